@@ -0,0 +1,196 @@
+import math
+
+import numpy as np
+
+from queues import erlang_c_array
+
+
+# --- Function 1: solve_jackson_network ---
+def solve_jackson_network(gamma, mu, c, routing):
+    """
+    Solves an open Jackson network of M/M/c stations.
+
+    The traffic equations λ = γ + Pᵀλ are solved in one linear solve, then every
+    station is evaluated as an independent M/M/c queue with its total arrival
+    rate (product-form result) through the vectorized Erlang-C path.
+
+    Args:
+        gamma (array-like): external arrival rate into each of the M stations (>= 0)
+        mu (array-like): service rate per server at each station
+        c (array-like): number of servers at each station
+        routing (array-like): M x M matrix, routing[i][j] = probability a customer
+            leaving station i goes to station j; the remainder of each row leaves
+    Returns:
+        dict: per-station arrays 'lamda', 'ro', 'p0', 'lq', 'l', 'wq', 'w'
+        (math.inf for saturated stations), plus network totals 'l_total' and
+        'w_total' (end-to-end response time = Σ L / Σ γ).
+        math.nan if invalid input.
+    """
+    try:
+        gamma = np.asarray(gamma, dtype=float)
+        mu = np.broadcast_to(np.asarray(mu, dtype=float), gamma.shape)
+        c = np.broadcast_to(np.asarray(c, dtype=float), gamma.shape)
+        routing = np.asarray(routing, dtype=float)
+    except (TypeError, ValueError):
+        return math.nan
+
+    m = gamma.size
+    if gamma.ndim != 1 or m == 0 or routing.shape != (m, m):
+        return math.nan
+    if not (np.all(gamma >= 0) and gamma.sum() > 0 and np.all(mu > 0) and np.all(np.isfinite(mu))
+            and np.all(c >= 1) and np.all(c == np.floor(c))):
+        return math.nan
+    if not (np.all(routing >= 0) and np.all(routing.sum(axis=1) <= 1 + 1e-12)):
+        return math.nan
+
+    # traffic equations (I - Pᵀ) λ = γ; singular means customers can never leave
+    try:
+        lamda = np.linalg.solve(np.eye(m) - routing.T, gamma)
+    except np.linalg.LinAlgError:
+        return math.nan
+    lamda = np.maximum(lamda, 0.0)
+
+    with np.errstate(all='ignore'):
+        ro = lamda / (c * mu)
+        p0, _, lq = erlang_c_array(lamda, mu, c)
+        visited = lamda > 0
+        feasible = ro < 1
+
+        # stations nobody reaches are empty; saturated stations grow without bound
+        p0 = np.where(visited, p0, 1.0)
+        lq = np.where(visited, lq, 0.0)
+        wq = np.where(visited, lq / lamda, 0.0)
+        w = wq + 1 / mu
+        l = lq + lamda / mu
+
+    result = {'lamda': lamda, 'ro': ro}
+    for key, value in (('p0', p0), ('lq', lq), ('l', l), ('wq', wq), ('w', w)):
+        result[key] = np.where(feasible, value, math.inf)
+
+    l_total = float(result['l'].sum())
+    result['l_total'] = l_total
+    result['w_total'] = l_total / float(gamma.sum())
+    return result
+
+
+# --- Function 2: solve_mva ---
+def solve_mva(demands, n, station_types=None, c=1, think_time=0.0):
+    """
+    Exact Mean Value Analysis of a closed product-form network with n customers.
+
+    For k = 1..n:
+        R_i(k) = D_i (1 + Q_i(k-1))   queueing station
+        R_i(k) = D_i                  delay (infinite-server) station
+        X(k)   = k / (Z + Σ R_i(k))
+        Q_i(k) = X(k) R_i(k)
+    Multi-server stations use Seidmann's approximation: a queueing station with
+    demand D/c in series with a delay of D(c-1)/c. Cost is O(n·M).
+
+    Args:
+        demands (array-like): service demand D_i (visits × service time) per station
+        n (int): number of customers in the closed network
+        station_types (sequence | None): 'queue' or 'delay' per station (default all 'queue')
+        c (int | array-like): servers per queueing station
+        think_time (float): client think time Z
+    Returns:
+        dict: 'x' (throughput), 'r' (response time), per-station arrays 'r_i'
+        (residence time), 'q' (mean customers) and 'u' (per-server utilization).
+        math.nan if invalid input, including all-zero demands with no think time.
+    """
+    model = _closed_model(demands, n, station_types, c, think_time)
+    if model is None:
+        return math.nan
+    queue_d, delay_d, demand, c = model
+
+    q_len = np.zeros(demand.size)
+    x = 0.0
+    r_i = queue_d + delay_d
+    for k in range(1, n + 1):
+        r_i = queue_d * (1 + q_len) + delay_d
+        x = k / (think_time + r_i.sum())
+        q_len = x * r_i
+
+    return _closed_result(x, r_i, q_len, demand, c)
+
+
+# --- Function 3: solve_mva_approx ---
+def solve_mva_approx(demands, n, station_types=None, c=1, think_time=0.0, tol=1e-8, max_iter=10000):
+    """
+    Approximate MVA (Schweitzer/Bard) for large populations.
+
+    Replaces Q_i(n-1) by Q_i(n)·(n-1)/n and iterates the MVA equations to a
+    fixed point, so each iteration costs O(M) regardless of n.
+
+    Args:
+        demands (array-like): service demand D_i per station
+        n (int): number of customers in the closed network
+        station_types (sequence | None): 'queue' or 'delay' per station (default all 'queue')
+        c (int | array-like): servers per queueing station
+        think_time (float): client think time Z
+        tol (float): convergence threshold on the largest change in Q_i, relative to n
+        max_iter (int): iteration limit
+    Returns:
+        dict: same keys as solve_mva plus 'iterations'.
+        math.nan if invalid input (as for solve_mva).
+    """
+    model = _closed_model(demands, n, station_types, c, think_time)
+    if model is None:
+        return math.nan
+    queue_d, delay_d, demand, c = model
+
+    # start from customers spread evenly over the queueing stations
+    active = queue_d > 0
+    q_len = np.where(active, n / max(int(active.sum()), 1), 0.0)
+    x = 0.0
+    r_i = queue_d + delay_d
+    iterations = 0
+    for iterations in range(1, max_iter + 1):
+        r_i = queue_d * (1 + q_len * (n - 1) / n) + delay_d
+        x = n / (think_time + r_i.sum())
+        q_next = x * r_i
+        converged = np.abs(q_next - q_len).max() < tol * n
+        q_len = q_next
+        if converged:
+            break
+
+    result = _closed_result(x, r_i, q_len, demand, c)
+    result['iterations'] = iterations
+    return result
+
+
+def _closed_model(demands, n, station_types, c, think_time):
+    """Validates MVA inputs and splits demands into queueing and delay parts."""
+    try:
+        demand = np.asarray(demands, dtype=float)
+        c = np.broadcast_to(np.asarray(c, dtype=float), demand.shape)
+    except (TypeError, ValueError):
+        return None
+    if demand.ndim != 1 or demand.size == 0 or not np.all(np.isfinite(demand) & (demand >= 0)):
+        return None
+    if not (isinstance(n, int) and n >= 1):
+        return None
+    if not (isinstance(think_time, (int, float)) and think_time >= 0):
+        return None
+    if not np.all((c >= 1) & (c == np.floor(c))):
+        return None
+    if demand.sum() + think_time <= 0:
+        return None  # no time is spent anywhere: throughput n / 0 is undefined
+
+    if station_types is None:
+        is_delay = np.zeros(demand.size, dtype=bool)
+    else:
+        station_types = list(station_types)
+        if len(station_types) != demand.size or any(t not in ('queue', 'delay') for t in station_types):
+            return None
+        is_delay = np.array([t == 'delay' for t in station_types])
+
+    # Seidmann: c servers ≈ one server of demand D/c plus a delay of D(c-1)/c
+    queue_d = np.where(is_delay, 0.0, demand / c)
+    delay_d = np.where(is_delay, demand, demand * (c - 1) / c)
+    return queue_d, delay_d, demand, np.where(is_delay, np.inf, c)
+
+
+def _closed_result(x, r_i, q_len, demand, c):
+    """Packs MVA results; utilization is per server (0 for delay stations)."""
+    return {'x': float(x), 'r': float(r_i.sum()), 'r_i': r_i, 'q': q_len, 'u': x * demand / c}
+
@@ -1,6 +1,12 @@
 import math
+from functools import lru_cache
 from typing import Union, List, Tuple
 
+import numpy as np
+
+# Upper bound on memoized entries per cache (validation and Erlang-C results).
+_CACHE_SIZE = 1024
+
 # --- Function 1: is_valid ---
 def is_valid(lamda: Union[float, int, List[Union[float, int]], Tuple[Union[float, int], ...]], mu: Union[float, int],
              c: Union[float, int] = 1) -> bool:
@@ -13,23 +19,13 @@ def is_valid(lamda: Union[float, int, List[Union[float, int]], Tuple[Union[float
         c (int): number of servers, must be >= 1
     Returns:
         bool: True if valid, false if otherwise
-    """
-    # Service rate validation
-    if not (isinstance(mu, (int, float)) and mu > 0):
-        return False
-
-    # Server count validation
-    if not (isinstance(c, (int, float)) and c >= 1 and c == int(c)):
-        return False
 
-    # Arrival rate validation
-    if isinstance(lamda, (int, float)):
-        return lamda > 0
-
-    if isinstance(lamda, (list, tuple)) and len(lamda) > 0:
-        return all(isinstance(x, (int, float)) and x > 0 for x in lamda)
-
-    return False
+    Results are memoized on the normalized (λ, μ, c) tuple.
+    """
+    key = _cache_key(lamda, mu, c)
+    if key is None:
+        return _check_valid(lamda, mu, c)
+    return _cached_check_valid(*key)
 
 
 # --- Function 2: is_feasible ---
@@ -45,12 +41,10 @@ def is_feasible(lamda: Union[float, int, List[Union[float, int]], Tuple[Union[fl
     Returns:
         bool: True if feasible (ρ < 1), false otherwise
     """
-    if not is_valid(lamda, mu, c):
-        return False
-
-    total_lamda = _get_total_lamda(lamda)
-    ro = total_lamda / (c * mu)
-    return ro < 1
+    key = _cache_key(lamda, mu, c)
+    if key is None:
+        return _check_feasible(lamda, mu, c)
+    return _cached_check_feasible(*key)
 
 
 # --- Function 3: calc_p0 ---
@@ -75,15 +69,8 @@ def calc_p0(lamda: Union[float, int, List[Union[float, int]], Tuple[Union[float,
     if not is_feasible(lamda, mu, c):
         return math.inf
 
-    total_lamda = _get_total_lamda(lamda)
-    a, ro = total_lamda / mu, total_lamda / (c * mu)
-
-    if c == 1:
-        return 1 - ro
-    else:
-        series = sum([(a ** n) / math.factorial(n) for n in range(int(c))])
-        tail = (a ** c) / (math.factorial(int(c)) * (1 - ro))
-        return 1 / (series + tail)
+    p0, _, _ = _erlang_c(*_erlang_key(lamda, mu, c))
+    return p0
 
 
 # --- Function 4: calc_lq_mmc ---
@@ -107,17 +94,8 @@ def calc_lq_mmc(lamda: Union[float, int, List[Union[float, int]], Tuple[Union[fl
     if not is_feasible(lamda, mu, c):
         return math.inf
 
-    total_lamda = _get_total_lamda(lamda)
-
-    if c == 1:
-        # Project 4 requirement: Specific M/M/1 Lq formula
-        return (total_lamda ** 2) / (mu * (mu - total_lamda))
-
-    a, ro = total_lamda / mu, total_lamda / (c * mu)
-    p0 = calc_p0(lamda, mu, c)
-    
-    pw = ((a ** c) / (math.factorial(int(c)) * (1 - ro))) * p0
-    return pw * ro / (1 - ro)
+    _, _, lq = _erlang_c(*_erlang_key(lamda, mu, c))
+    return lq
 
 
 # --- Internal Helper Functions ---
@@ -137,6 +115,106 @@ def _calc_utilization(total_lamda, mu, c):
     return r, ro
 
 
+# --- Internal Cache Layer ---
+def _cache_key(lamda, mu, c):
+    """
+    Normalizes the parameters into a hashable key (lists become tuples); None if unhashable.
+
+    The key carries the type of every value (including sequence elements), since
+    equal values of different types (25 vs Fraction(25)) validate differently.
+    """
+    lamda = tuple(lamda) if isinstance(lamda, list) else lamda
+    lamda_types = tuple(map(type, lamda)) if isinstance(lamda, tuple) else type(lamda)
+    key = (lamda, mu, c, (lamda_types, type(mu), type(c)))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _check_valid(lamda, mu, c):
+    """Uncached body of is_valid."""
+    # Service rate validation
+    if not (isinstance(mu, (int, float)) and mu > 0):
+        return False
+
+    # Server count validation
+    if not (isinstance(c, (int, float)) and c >= 1 and c == int(c)):
+        return False
+
+    # Arrival rate validation
+    if isinstance(lamda, (int, float)):
+        return lamda > 0
+
+    if isinstance(lamda, (list, tuple)) and len(lamda) > 0:
+        return all(isinstance(x, (int, float)) and x > 0 for x in lamda)
+
+    return False
+
+
+def _check_feasible(lamda, mu, c):
+    """Uncached body of is_feasible."""
+    if not is_valid(lamda, mu, c):
+        return False
+
+    total_lamda = _get_total_lamda(lamda)
+    ro = total_lamda / (c * mu)
+    return ro < 1
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _cached_check_valid(lamda, mu, c, types):
+    """Memoized _check_valid; `types` only keeps differently typed inputs apart."""
+    return _check_valid(lamda, mu, c)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _cached_check_feasible(lamda, mu, c, types):
+    """Memoized _check_feasible; `types` only keeps differently typed inputs apart."""
+    return _check_feasible(lamda, mu, c)
+
+
+def _erlang_key(lamda, mu, c):
+    """Normalized (total λ, μ, c) key shared by every Erlang-C lookup."""
+    return float(_get_total_lamda(lamda)), float(mu), int(c)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _erlang_c(total_lamda, mu, c):
+    """
+    Computes (P0, P_wait, Lq) for a feasible M/M/c system, memoized on (λ, μ, c).
+
+    Uses the Erlang-B recursion B(n) = a·B(n-1) / (n + a·B(n-1)) instead of
+    a**c / c!, so large server counts do not overflow.
+    """
+    a, ro = total_lamda / mu, total_lamda / (c * mu)
+
+    b = 1.0
+    for n in range(1, c + 1):
+        b = a * b / (n + a * b)
+
+    # Erlang-C (probability of waiting) from Erlang-B
+    pw = b / (1 - ro * (1 - b))
+
+    # P0 = B / (a^c/c!) / (1 + B·ρ/(1-ρ)), evaluated in log space
+    if b > 0:
+        log_p0 = math.log(b) - (c * math.log(a) - math.lgamma(c + 1)) - math.log1p(b * ro / (1 - ro))
+        p0 = math.exp(log_p0)
+    else:
+        # B underflows only when a << c, where the Poisson series sums to e^a
+        p0 = math.exp(-a)
+
+    return p0, pw, pw * ro / (1 - ro)
+
+
+def clear_cache():
+    """Clears the memoized validation and Erlang-C results."""
+    _cached_check_valid.cache_clear()
+    _cached_check_feasible.cache_clear()
+    _erlang_c.cache_clear()
+
+
 # --- Function 5: calc_bk_mmc ---
 def calc_bk_mmc(k, lamda, mu, c=1):
     """
@@ -266,4 +344,751 @@ def use_littles_law(lamda, mu, c=1, **kwargs):
         result_dict['wqk'] = wqk_vals
         result_dict['lqk'] = lqk_vals
 
-    return result_dict
\ No newline at end of file
+    return result_dict
+
+
+# --- Vectorized Helper Functions ---
+def erlang_c_array(total_lamda, mu, c):
+    """
+    Vectorized (P0, Pw, Lq) for M/M/c over broadcastable arrays, where Pw is
+    the Erlang-C probability of waiting.
+
+    Runs the Erlang-B recursion once up to max(c); entries are only meaningful
+    where the inputs are valid and ρ < 1 (callers mask the rest). Public so
+    that network.py can evaluate every station in one call.
+    """
+    with np.errstate(all='ignore'):
+        a = np.asarray(total_lamda, dtype=float) / mu
+        c_int = np.where(np.isfinite(c) & (c >= 1), c, 1).astype(int)
+        ro = a / c_int
+        c_max = int(c_int.max()) if c_int.size else 1
+
+        b = np.ones(np.broadcast(a, c_int).shape)
+        for n in range(1, c_max + 1):
+            b = np.where(n <= c_int, a * b / (n + a * b), b)
+
+        pw = b / (1 - ro * (1 - b))
+        log_fact = np.concatenate(([0.0], np.cumsum(np.log(np.arange(1, c_max + 1)))))
+        log_p0 = np.log(b) - (c_int * np.log(a) - log_fact[c_int]) - np.log1p(b * ro / (1 - ro))
+        p0 = np.where(b > 0, np.exp(log_p0), np.exp(-a))
+        lq = pw * ro / (1 - ro)
+    return p0, pw, lq
+
+
+def _mask_status(values, valid, feasible):
+    """Applies the module convention: nan where invalid, inf where infeasible."""
+    return np.where(~valid, math.nan, np.where(~feasible, math.inf, values))
+
+
+# --- Function 9: calc_class_metrics_mmc ---
+def calc_class_metrics_mmc(lamda, mu, c=1):
+    """
+    Calculates Wq_k, Lq_k, W_k and L_k for every priority class in one pass.
+
+    A single cumulative sum over λ_k yields every B_k and Erlang-C is evaluated
+    once per scenario, so a K-class table costs O(K) instead of O(K²).
+
+    Args:
+        lamda (array-like): class arrival rates, shape (K,) or (S, K) for S scenarios
+        mu (float | array-like): service rate, scalar or shape (S,)
+        c (int | array-like): number of servers, scalar or shape (S,)
+    Returns:
+        dict: 'wqk', 'lqk', 'wk', 'lk' arrays shaped (K,) or (S, K).
+        Entries are math.nan for invalid scenarios and math.inf for infeasible ones.
+        Returns math.nan if the inputs are not numeric.
+    """
+    try:
+        lam = np.atleast_1d(np.asarray(lamda, dtype=float))
+        mu_arr = np.asarray(mu, dtype=float)[..., None]
+        c_arr = np.asarray(c, dtype=float)[..., None]
+    except (TypeError, ValueError):
+        return math.nan
+
+    with np.errstate(all='ignore'):
+        valid = (np.all(lam > 0, axis=-1, keepdims=True) & (mu_arr > 0) & np.isfinite(mu_arr)
+                 & (c_arr >= 1) & (c_arr == np.floor(c_arr)))
+        total_lamda = lam.sum(axis=-1, keepdims=True)
+        ro = total_lamda / (c_arr * mu_arr)
+        feasible = valid & (ro < 1)
+
+        _, _, lq = erlang_c_array(total_lamda, mu_arr, c_arr)
+        wq = lq / total_lamda
+
+        # B_k = 1 - Σ_{j<=k} λ_j/(cμ); B_{k-1} drops the k-th term again
+        cum = np.cumsum(lam, axis=-1) / (c_arr * mu_arr)
+        b_k = 1 - cum
+        b_k_minus_1 = b_k + lam / (c_arr * mu_arr)
+
+        wqk = (1 - ro) * wq / (b_k_minus_1 * b_k)
+        wk = wqk + 1 / mu_arr
+
+        return {
+            'wqk': _mask_status(wqk, valid, feasible),
+            'lqk': _mask_status(lam * wqk, valid, feasible),
+            'wk': _mask_status(wk, valid, feasible),
+            'lk': _mask_status(lam * wk, valid, feasible),
+        }
+
+
+# --- Function 10: calc_class_metrics_mgc ---
+def calc_class_metrics_mgc(lamda, mu, c=1, scv=1.0, preemptive=False):
+    """
+    Calculates per-class metrics for an M/G/c priority system with per-class
+    service rates, either non-preemptive or preemptive-resume.
+
+    With σ_k = Σ_{j<=k} λ_j/(c μ_j) and the M/G/c residual-work approximation
+    W0 = C(c, a) · E[S²] / (2c E[S]):
+        non-preemptive:   W_q,k = W0 / ((1-σ_{k-1})(1-σ_k))
+        preemptive-resume: W_k = (1/μ_k)/(1-σ_{k-1}) + W0_k / ((1-σ_{k-1})(1-σ_k)),
+                           where W0_k only counts classes 1..k
+    Both reduce to the exact M/G/1 (Cobham) results for c = 1 and to
+    calc_class_metrics_mmc for a common μ with exponential service.
+
+    Args:
+        lamda (array-like): class arrival rates, shape (K,) or (S, K) for S scenarios
+        mu (float | array-like): service rate per class, scalar, (K,) or (S, K)
+        c (int | array-like): number of servers, scalar or shape (S,)
+        scv (float | array-like): squared coefficient of variation of service time
+            per class (1 = exponential, 0 = deterministic), broadcast like mu
+        preemptive (bool): True for preemptive-resume priorities
+    Returns:
+        dict: 'wqk', 'lqk', 'wk', 'lk' arrays shaped like lamda.
+        Entries are math.nan for invalid scenarios and math.inf for infeasible ones.
+        Returns math.nan if the inputs are not numeric.
+    """
+    try:
+        lam = np.atleast_1d(np.asarray(lamda, dtype=float))
+        mu_arr = np.asarray(mu, dtype=float)
+        scv_arr = np.asarray(scv, dtype=float)
+        c_arr = np.asarray(c, dtype=float)[..., None]
+        lam, mu_arr, scv_arr = np.broadcast_arrays(lam, mu_arr, scv_arr)
+    except (TypeError, ValueError):
+        return math.nan
+
+    with np.errstate(all='ignore'):
+        valid = (np.all((lam > 0) & (mu_arr > 0) & np.isfinite(mu_arr) & (scv_arr >= 0), axis=-1, keepdims=True)
+                 & (c_arr >= 1) & (c_arr == np.floor(c_arr)))
+
+        service = 1 / mu_arr
+        second_moment = (1 + scv_arr) * service ** 2
+
+        # cumulative offered load and second-moment rate over classes 1..k
+        load_k = np.cumsum(lam * service, axis=-1)
+        moment_k = np.cumsum(lam * second_moment, axis=-1)
+        sigma_k = load_k / c_arr
+        sigma_k_minus_1 = sigma_k - lam * service / c_arr
+        ro = sigma_k[..., -1:]
+        feasible = valid & (ro < 1)
+
+        if preemptive:
+            # class k only sees work from classes 1..k
+            _, pw_k, _ = erlang_c_array(load_k, 1.0, c_arr)
+            residual = pw_k * moment_k / (2 * c_arr * load_k)
+            wk = service / (1 - sigma_k_minus_1) + residual / ((1 - sigma_k_minus_1) * (1 - sigma_k))
+            wqk = wk - service
+        else:
+            _, pw, _ = erlang_c_array(load_k[..., -1:], 1.0, c_arr)
+            residual = pw * moment_k[..., -1:] / (2 * c_arr * load_k[..., -1:])
+            wqk = residual / ((1 - sigma_k_minus_1) * (1 - sigma_k))
+            wk = wqk + service
+
+        return {
+            'wqk': _mask_status(wqk, valid, feasible),
+            'lqk': _mask_status(lam * wqk, valid, feasible),
+            'wk': _mask_status(wk, valid, feasible),
+            'lk': _mask_status(lam * wk, valid, feasible),
+        }
+
+
+# --- Function 11: calc_transient_mmc ---
+def calc_transient_mmc(lamda, mu, c, t, n0=0, tol=1e-10):
+    """
+    Calculates the transient queue-length distribution P(N(t) = n) of an
+    M/M/c system started with n0 customers, by uniformization.
+
+    The birth-death generator is truncated at a level N that is doubled until
+    the probability of the truncation state stays below tol. The distribution
+    is carried from one grid time to the next by the interval's transition
+    operator exp(QΔt), built once per distinct Δt: rows with every server busy
+    throughout Δt share one Poisson-difference (Skellam) kernel applied as a
+    convolution, and only the first c + O(cμΔt) rows come from uniformization.
+    A step therefore costs one small dense product plus one convolution of the
+    vector, independent of the load. Feasibility is not required: overloaded
+    systems are well defined over a finite horizon.
+
+    Cost: a 1440-point day (Δt = 1 minute, μ = 1/hour) at c = 200 takes about
+    0.1 s at ρ = 0.95 or in overload (λ = 210) and about 0.4 s at ρ = 0.995,
+    where the stationary tail needs ~4800 states. Long intervals cost more:
+    with cμΔt = 200 per step the same day takes 1-4 s, mostly in the
+    convolutions over the 20,000+ states an overloaded queue reaches. Beyond
+    _BOUNDARY_CELLS the vector is uniformized directly, O(cμΔt · N) per step.
+
+    Args:
+        lamda (float | list | tuple): arrival rate(s)
+        mu (float): service rate
+        c (int): number of servers
+        t (float | array-like): time(s) >= 0 at which to evaluate
+        n0 (int): initial number of customers in the system
+        tol (float): truncation error tolerance
+    Returns:
+        ndarray: shape (N+1,) for scalar t, or (len(t), N+1) for a grid.
+        math.nan if invalid input.
+    """
+    if not is_valid(lamda, mu, c):
+        return math.nan
+    if not (isinstance(n0, int) and n0 >= 0 and 0 < tol < 1):
+        return math.nan
+    try:
+        times = np.asarray(t, dtype=float)
+    except (TypeError, ValueError):
+        return math.nan
+    if times.size == 0 or not np.all(np.isfinite(times) & (times >= 0)):
+        return math.nan
+
+    total_lamda, mu, c = float(_get_total_lamda(lamda)), float(mu), int(c)
+    t_max = float(times.max())
+    spread = _poisson_spread(tol)
+
+    # no state beyond n0 + (arrivals in [0, t_max]) carries probability above tol
+    n_bound = n0 + int(math.ceil(total_lamda * t_max + spread * (math.sqrt(total_lamda * t_max) + 1)))
+
+    # first guess: stationary geometric tail if stable, otherwise drift plus noise
+    ro = total_lamda / (c * mu)
+    if ro < 1:
+        step = int(math.ceil(math.log(tol) / math.log(ro))) + 1
+    else:
+        step = int(math.ceil((total_lamda - c * mu) * t_max + spread * math.sqrt((total_lamda + c * mu) * t_max)))
+    step = max(step, 64)
+
+    while True:
+        n_max = min(max(n0, c) + step, n_bound)
+        dist = _uniformize_mmc(total_lamda, mu, c, times.ravel(), n0, n_max, tol)
+        if n_max == n_bound or dist[:, -1].max() < tol:
+            break
+        step *= 2
+
+    return dist.reshape(times.shape + (n_max + 1,))
+
+
+def _poisson_spread(tol):
+    """Number of standard deviations that bounds a Poisson tail below tol."""
+    return math.sqrt(2 * math.log(1 / tol)) + 2
+
+
+def _poisson_pmf(mean, k_max):
+    """Poisson(mean) probabilities for k = 0..k_max."""
+    if mean == 0:
+        return np.concatenate(([1.0], np.zeros(k_max)))
+    k = np.arange(k_max + 1)
+    return np.exp(k * math.log(mean) - mean - np.array([math.lgamma(x + 1) for x in k]))
+
+
+def _uniformized_chain(total_lamda, mu, c, size):
+    """(rate, stay, up, down) of the uniformized M/M/c chain on states 0..size-1 (reflecting top)."""
+    n = np.arange(size)
+    birth = np.full(size, total_lamda)
+    birth[-1] = 0.0
+    death = np.minimum(n, c) * mu
+    rate = total_lamda + c * mu
+    return rate, 1 - (birth + death) / rate, birth[:-1] / rate, death[1:] / rate
+
+
+def _uniformize(u, chain, dt, tol):
+    """
+    u · exp(Q·dt) for a distribution u (or a block of them, one per row), as
+    Σ_k Poisson(k; rate·dt) · u P^k over the Poisson window.
+    """
+    rate, stay, up, down = chain
+    lt = rate * dt
+    spread = _poisson_spread(tol)
+    lo = max(int(lt - spread * math.sqrt(lt) - spread), 0)
+    hi = int(math.ceil(lt + spread * math.sqrt(lt) + spread))
+    log_lt = math.log(lt)
+
+    acc = np.zeros(u.shape)
+    u, u_next, scratch = u.copy(), np.zeros(u.shape), np.empty(u.shape)
+    # columns at or beyond `top` are still zero: mass moves at most one state per step
+    occupied = np.flatnonzero(u.reshape(-1, u.shape[-1]).any(axis=0))
+    top = int(occupied[-1]) + 1 if occupied.size else 0
+    weight = 0.0
+    for k in range(hi + 1):
+        cols = slice(0, top)
+        if k >= lo:
+            w = math.exp(-lt + k * log_lt - math.lgamma(k + 1))
+            np.multiply(u[..., cols], w, out=scratch[..., cols])
+            acc[..., cols] += scratch[..., cols]
+            weight += w
+        top = min(top + 1, u.shape[-1])
+        cols = slice(0, top)
+        np.multiply(u[..., cols], stay[cols], out=u_next[..., cols])
+        np.multiply(u[..., :top - 1], up[:top - 1], out=scratch[..., 1:top])
+        u_next[..., 1:top] += scratch[..., 1:top]
+        np.multiply(u[..., 1:top], down[:top - 1], out=scratch[..., :top - 1])
+        u_next[..., :top - 1] += scratch[..., :top - 1]
+        if k >= lo and k % 8 == 0:
+            np.subtract(u_next[..., cols], u[..., cols], out=scratch[..., cols])
+            if np.abs(scratch[..., cols]).sum() < tol * 1e-3:
+                # ‖uP − u‖ never grows under P, so every later term is within
+                # (hi − k)·tol·1e-3 of u_next: give it the remaining weight
+                acc += max(1.0 - weight, 0.0) * u_next
+                break
+        u, u_next = u_next, u
+    return acc
+
+
+# Largest dense state block (float64 cells) used to build a transition operator;
+# above it an interval is stepped by uniformizing the vector directly.
+_BOUNDARY_CELLS = 4_000_000
+
+
+def _transition_mmc(total_lamda, mu, c, dt, n_max, tol):
+    """
+    One-interval transition operator exp(Q·dt) of the M/M/c chain truncated at n_max.
+
+    Above state c + downs (downs bounds the departures in dt) every server stays
+    busy, so those rows are the same Skellam kernel Poisson(λ dt) − Poisson(cμ dt)
+    shifted; only the first rows are found by uniformization, over dt / 2^m
+    (rate·dt / 2^m ≤ 2) on the block of reachable states and then m squarings.
+
+    Returns:
+        (boundary, n_boundary, kernel, offset): boundary is the dense block of
+        rows 0..n_boundary-1, kernel[j] is the probability of moving by offset + j.
+        None when the boundary block would exceed _BOUNDARY_CELLS.
+    """
+    spread = _poisson_spread(tol)
+    ups_mean, downs_mean = total_lamda * dt, c * mu * dt
+    ups = int(math.ceil(ups_mean + spread * (math.sqrt(ups_mean) + 1)))
+    downs = int(math.ceil(downs_mean + spread * (math.sqrt(downs_mean) + 1)))
+
+    n_boundary = min(c + downs, n_max + 1)
+    size = min(n_boundary + ups + 1, n_max + 1)
+    if size * size > _BOUNDARY_CELLS:
+        return None
+
+    # interior kernel, trimmed to the window around the drift
+    skellam = np.convolve(_poisson_pmf(ups_mean, ups), _poisson_pmf(downs_mean, downs)[::-1])
+    drift, width = ups_mean - downs_mean, spread * (math.sqrt(ups_mean + downs_mean) + 1)
+    k_lo = max(int(math.floor(drift - width)), -downs)
+    k_hi = min(int(math.ceil(drift + width)), ups)
+    kernel = skellam[k_lo + downs:k_hi + downs + 1]
+
+    # boundary rows on the states they can reach; the reflecting top of this
+    # block is beyond `ups` of every boundary row, so it does not reach them
+    chain = _uniformized_chain(total_lamda, mu, c, size)
+    squarings = max(int(math.ceil(math.log2(chain[0] * dt / 2))), 0)
+    block = _uniformize(np.eye(size), chain, dt / 2 ** squarings, tol)
+    for _ in range(squarings):
+        block = block @ block
+    return block[:n_boundary], n_boundary, kernel, k_lo
+
+
+def _convolve(x, kernel):
+    """Full linear convolution; FFT once the kernel is long enough to pay off."""
+    if kernel.size <= 64 or x.size <= 64:
+        return np.convolve(x, kernel)
+    size = x.size + kernel.size - 1
+    n_fft = 1 << (size - 1).bit_length()
+    out = np.fft.irfft(np.fft.rfft(x, n_fft) * np.fft.rfft(kernel, n_fft), n_fft)[:size]
+    return np.maximum(out, 0.0)  # FFT round-off can dip just below zero
+
+
+def _uniformize_mmc(total_lamda, mu, c, times, n0, n_max, tol):
+    """
+    Carries the distribution across the sorted grid of the M/M/c chain truncated
+    at n_max, building the transition operator once per distinct interval length.
+    """
+    order = np.argsort(times)
+    out = np.empty((times.size, n_max + 1))
+    chain = None
+
+    v = np.zeros(n_max + 1)
+    v[n0] = 1.0
+    t_prev, step, dt_step = 0.0, None, math.nan
+
+    for i in order:
+        dt = times[i] - t_prev
+        t_prev = times[i]
+        if dt == 0:
+            out[i] = v
+            continue
+        if not math.isclose(dt, dt_step, rel_tol=1e-9):  # linspace grids differ by ulps
+            step, dt_step = _transition_mmc(total_lamda, mu, c, dt, n_max, tol), dt
+
+        if step is None:
+            if chain is None:
+                chain = _uniformized_chain(total_lamda, mu, c, n_max + 1)
+            nxt = _uniformize(v, chain, dt, tol)
+        else:
+            boundary, n_boundary, kernel, offset = step
+            nxt = np.zeros(n_max + 1)
+            nxt[:boundary.shape[1]] = v[:n_boundary] @ boundary
+            if n_boundary <= n_max:
+                moved = _convolve(v[n_boundary:], kernel)
+                first = n_boundary + offset
+                nxt[first:first + moved.size] += moved[:n_max + 1 - first]
+
+        v = nxt / nxt.sum()
+        out[i] = v
+
+    return out
+
+
+# --- Function 12: calc_pn_mmc ---
+def calc_pn_mmc(lamda, mu, c=1, n_max=None, tol=1e-12):
+    """
+    Calculates the steady-state distribution P(N = n) for an M/M/c queue.
+
+        P_n = P0 · a^n / n!                     for n < c
+        P_n = P_wait · (1-ρ) · ρ^(n-c)          for n >= c
+
+    Args:
+        lamda (float | list | tuple): arrival rate(s)
+        mu (float): service rate
+        c (int): number of servers
+        n_max (int | None): last state returned; by default the smallest n
+            whose tail P(N > n) is below tol
+        tol (float): tail cutoff used when n_max is None
+    Returns:
+        ndarray: P(N = n) for n = 0..n_max,
+        math.nan if invalid input,
+        math.inf if infeasible (ρ >= 1).
+    """
+    if not is_valid(lamda, mu, c):
+        return math.nan
+    if not is_feasible(lamda, mu, c):
+        return math.inf
+
+    total_lamda, c = _get_total_lamda(lamda), int(c)
+    a, ro = total_lamda / mu, total_lamda / (c * mu)
+    p0, pw, _ = _erlang_c(*_erlang_key(lamda, mu, c))
+
+    if n_max is None:
+        # P(N > n) = P_wait · ρ^(n-c+1) for n >= c-1
+        n_max = c - 1 if pw <= tol else c - 1 + int(math.ceil(math.log(tol / pw) / math.log(ro)))
+        n_max = max(n_max, 0)
+    elif not (isinstance(n_max, int) and n_max >= 0):
+        return math.nan
+
+    n = np.arange(n_max + 1)
+    with np.errstate(divide='ignore'):
+        # log(a^n / n!) via a cumulative sum keeps large c finite
+        log_terms = np.concatenate(([0.0], np.cumsum(np.log(a / n[1:]))))
+    below = p0 * np.exp(log_terms)
+    above = pw * (1 - ro) * ro ** np.maximum(n - c, 0)
+    return np.where(n < c, below, above)
+
+
+# --- Function 13: calc_wq_tail_mmc ---
+def calc_wq_tail_mmc(t, lamda, mu, c=1):
+    """
+    Calculates P(Wq > t) for an M/M/c FCFS queue.
+
+        P(Wq > t) = P_wait · exp(-(cμ - λ) t)
+
+    Args:
+        t (float | array-like): waiting-time threshold(s) >= 0
+        lamda (float | list | tuple): arrival rate(s)
+        mu (float): service rate
+        c (int): number of servers
+    Returns:
+        float | ndarray: tail probability for each t,
+        math.nan if invalid input,
+        math.inf if infeasible (ρ >= 1).
+    """
+    if not is_valid(lamda, mu, c):
+        return math.nan
+    if not is_feasible(lamda, mu, c):
+        return math.inf
+
+    total_lamda = _get_total_lamda(lamda)
+    _, pw, _ = _erlang_c(*_erlang_key(lamda, mu, c))
+    return _exponential_tail(t, pw, c * mu - total_lamda)
+
+
+# --- Function 14: calc_wq_quantile_mmc ---
+def calc_wq_quantile_mmc(q, lamda, mu, c=1):
+    """
+    Calculates waiting-time quantiles (e.g. p50/p95/p99) for an M/M/c FCFS queue.
+
+        t_q = max(0, ln(P_wait / (1-q)) / (cμ - λ))
+
+    Args:
+        q (float | array-like): quantile level(s) in [0, 1)
+        lamda (float | list | tuple): arrival rate(s)
+        mu (float): service rate
+        c (int): number of servers
+    Returns:
+        float | ndarray: Wq quantile for each q,
+        math.nan if invalid input,
+        math.inf if infeasible (ρ >= 1).
+    """
+    if not is_valid(lamda, mu, c):
+        return math.nan
+    if not is_feasible(lamda, mu, c):
+        return math.inf
+
+    total_lamda = _get_total_lamda(lamda)
+    _, pw, _ = _erlang_c(*_erlang_key(lamda, mu, c))
+    return _exponential_quantile(q, pw, c * mu - total_lamda)
+
+
+# --- Function 15: calc_wqk_tail_mmc ---
+def calc_wqk_tail_mmc(k, t, lamda, mu, c=1):
+    """
+    Calculates P(Wq,k > t) for priority class k of an M/M/c system.
+
+    Non-preemptive priority waits have no closed form; the class delay is
+    approximated as P_wait times an exponential whose mean matches W_q,k:
+        P(Wq,k > t) ≈ P_wait · exp(-t · P_wait / W_q,k)
+
+    Args:
+        k (int): priority class (1-based)
+        t (float | array-like): waiting-time threshold(s) >= 0
+        lamda (float | list | tuple): arrival rates per class
+        mu (float): service rate
+        c (int): number of servers
+    Returns:
+        float | ndarray: tail probability for each t,
+        math.nan if invalid input,
+        math.inf if infeasible (ρ >= 1).
+    """
+    wqk = calc_wqk_mmc(k, lamda, mu, c)
+    if math.isnan(wqk) or math.isinf(wqk):
+        return wqk
+
+    _, pw, _ = _erlang_c(*_erlang_key(lamda, mu, c))
+    return _exponential_tail(t, pw, pw / wqk)
+
+
+# --- Function 16: calc_wqk_quantile_mmc ---
+def calc_wqk_quantile_mmc(k, q, lamda, mu, c=1):
+    """
+    Calculates waiting-time quantiles for priority class k of an M/M/c system,
+    using the same exponential approximation as calc_wqk_tail_mmc.
+
+    Args:
+        k (int): priority class (1-based)
+        q (float | array-like): quantile level(s) in [0, 1)
+        lamda (float | list | tuple): arrival rates per class
+        mu (float): service rate
+        c (int): number of servers
+    Returns:
+        float | ndarray: Wq,k quantile for each q,
+        math.nan if invalid input,
+        math.inf if infeasible (ρ >= 1).
+    """
+    wqk = calc_wqk_mmc(k, lamda, mu, c)
+    if math.isnan(wqk) or math.isinf(wqk):
+        return wqk
+
+    _, pw, _ = _erlang_c(*_erlang_key(lamda, mu, c))
+    return _exponential_quantile(q, pw, pw / wqk)
+
+
+def _exponential_tail(t, pw, decay):
+    """P_wait · exp(-decay · t) over a t-grid; nan for negative or non-numeric t."""
+    try:
+        t_arr = np.asarray(t, dtype=float)
+    except (TypeError, ValueError):
+        return math.nan
+    with np.errstate(invalid='ignore'):
+        tail = np.where(t_arr >= 0, pw * np.exp(-decay * t_arr), math.nan)
+    return float(tail) if tail.ndim == 0 else tail
+
+
+def _exponential_quantile(q, pw, decay):
+    """Inverse of _exponential_tail: 0 when q <= 1 - P_wait, nan outside [0, 1)."""
+    try:
+        q_arr = np.asarray(q, dtype=float)
+    except (TypeError, ValueError):
+        return math.nan
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t_q = np.maximum(np.log(pw / (1 - q_arr)) / decay, 0.0)
+        t_q = np.where((q_arr >= 0) & (q_arr < 1), t_q, math.nan)
+    return float(t_q) if t_q.ndim == 0 else t_q
+
+
+# --- Function 17: calc_mmck ---
+def calc_mmck(lamda, mu, c, k):
+    """
+    Calculates steady-state metrics for a finite-capacity M/M/c/K queue
+    (at most K customers in the system, arrivals beyond that are blocked).
+
+    Defined for any ρ, so overloaded systems have finite metrics. The state
+    probabilities come from the birth-death recursion P_n = P_{n-1} · λ / (min(n, c) μ),
+    accumulated in log space and normalized once, O(K) per scenario.
+
+    Args:
+        lamda (float | array-like): arrival rate(s)
+        mu (float | array-like): service rate(s)
+        c (int | array-like): number of servers
+        k (int | array-like): system capacity, K >= c
+    Returns:
+        dict: 'p0', 'pk' (blocking probability), 'lamda_eff' (accepted
+        throughput), 'lq', 'l', 'wq', 'w'. Floats for scalar inputs, arrays
+        for broadcast parameter arrays; math.nan entries for invalid input.
+    """
+    try:
+        lam, mu_arr, c_arr, k_arr = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (lamda, mu, c, k)))
+    except (TypeError, ValueError):
+        return math.nan
+
+    with np.errstate(invalid='ignore'):
+        valid = ((lam > 0) & np.isfinite(lam) & (mu_arr > 0) & np.isfinite(mu_arr)
+                 & (c_arr >= 1) & (c_arr == np.floor(c_arr)) & (k_arr >= c_arr) & (k_arr == np.floor(k_arr))
+                 & np.isfinite(k_arr))
+    c_int = np.where(valid, c_arr, 1).astype(int)
+    k_int = np.where(valid, k_arr, 1).astype(int)
+    lam, mu_arr = np.where(valid, lam, 1.0), np.where(valid, mu_arr, 1.0)
+
+    n = np.arange(1, int(k_int.max(initial=1)) + 1)
+    log_ratio = np.log(lam[..., None] / (np.minimum(n, c_int[..., None]) * mu_arr[..., None]))
+    p = _normalize_birth_death(log_ratio, n <= k_int[..., None])
+
+    pk = np.take_along_axis(p, k_int[..., None], axis=-1)[..., 0]
+    lamda_eff = lam * (1 - pk)
+    return _birth_death_metrics(p, c_int, lamda_eff, valid, pk=pk)
+
+
+# --- Function 18: calc_mmc_finite_source ---
+def calc_mmc_finite_source(lamda, mu, c, n):
+    """
+    Calculates steady-state metrics for the M/M/c//N machine-repair model:
+    N sources each generating requests at rate λ while not in the system.
+
+    State probabilities use the recursion P_j = P_{j-1} · (N-j+1)λ / (min(j, c) μ),
+    accumulated in log space and normalized once, O(N) per scenario.
+
+    Args:
+        lamda (float | array-like): arrival rate per source
+        mu (float | array-like): service rate(s)
+        c (int | array-like): number of servers
+        n (int | array-like): population size N >= 1
+    Returns:
+        dict: 'p0', 'lamda_eff' (throughput λ(N - L)), 'lq', 'l', 'wq', 'w'.
+        Floats for scalar inputs, arrays for broadcast parameter arrays;
+        math.nan entries for invalid input.
+    """
+    try:
+        lam, mu_arr, c_arr, n_arr = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (lamda, mu, c, n)))
+    except (TypeError, ValueError):
+        return math.nan
+
+    with np.errstate(invalid='ignore'):
+        valid = ((lam > 0) & np.isfinite(lam) & (mu_arr > 0) & np.isfinite(mu_arr)
+                 & (c_arr >= 1) & (c_arr == np.floor(c_arr)) & (n_arr >= 1) & (n_arr == np.floor(n_arr))
+                 & np.isfinite(n_arr))
+    c_int = np.where(valid, c_arr, 1).astype(int)
+    n_int = np.where(valid, n_arr, 1).astype(int)
+    lam, mu_arr = np.where(valid, lam, 1.0), np.where(valid, mu_arr, 1.0)
+
+    j = np.arange(1, int(n_int.max(initial=1)) + 1)
+    active = j <= n_int[..., None]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sources = np.where(active, n_int[..., None] - j + 1, 1)
+        log_ratio = np.log(sources * lam[..., None] / (np.minimum(j, c_int[..., None]) * mu_arr[..., None]))
+    p = _normalize_birth_death(log_ratio, active)
+
+    l = (p * np.arange(p.shape[-1])).sum(axis=-1)
+    lamda_eff = lam * (n_int - l)
+    return _birth_death_metrics(p, c_int, lamda_eff, valid)
+
+
+def _normalize_birth_death(log_ratio, active):
+    """
+    Normalizes P_n ∝ Π_{i<=n} ratio_i from log ratios; states outside
+    `active` get probability 0. The max shift keeps exp() in range.
+    """
+    log_p = np.cumsum(np.where(active, log_ratio, 0.0), axis=-1)
+    log_p = np.where(active, log_p, -np.inf)
+    log_p = np.concatenate((np.zeros(log_p.shape[:-1] + (1,)), log_p), axis=-1)
+    log_p -= log_p.max(axis=-1, keepdims=True)
+    p = np.exp(log_p)
+    return p / p.sum(axis=-1, keepdims=True)
+
+
+def _birth_death_metrics(p, c, lamda_eff, valid, pk=None):
+    """Little's Law metrics from a state distribution p over n = 0..N_max."""
+    n = np.arange(p.shape[-1])
+    l = (p * n).sum(axis=-1)
+    lq = (p * np.maximum(n - c[..., None], 0)).sum(axis=-1)
+
+    result = {'p0': p[..., 0]}
+    if pk is not None:
+        result['pk'] = pk
+    result.update({'lamda_eff': lamda_eff, 'lq': lq, 'l': l, 'wq': lq / lamda_eff, 'w': l / lamda_eff})
+
+    for key, value in result.items():
+        value = np.where(valid, value, math.nan)
+        result[key] = float(value) if value.ndim == 0 else value
+    return result
+
+
+# --- Function 19: calc_max_lamda ---
+def calc_max_lamda(mu, c=1, q=None, tol=1e-10, **kwargs):
+    """
+    Inverse of use_littles_law: finds the largest arrival rate an M/M/c pool
+    can absorb while keeping one metric within its target.
+
+    Every metric is increasing in λ on (0, cμ), so the root is bracketed by
+    [0, cμ] and found by bisection run on all targets at once (one vectorized
+    Erlang-C evaluation per iteration) until every bracket is within tol of
+    its upper end, i.e. relative to λ itself even when λ ≪ cμ.
+
+    Args:
+        mu (float | array-like): service rate
+        c (int | array-like): number of servers
+        q (float | None): if given with wq, the target is the q-quantile of Wq
+            (e.g. q=0.99 for a p99 budget) instead of its mean
+        tol (float): relative tolerance on the returned λ
+        **kwargs: exactly one target among l, lq, w, wq (scalar or array)
+    Returns:
+        float | ndarray: maximum λ for each target (0.0 if even λ → 0 misses it),
+        math.nan for invalid input, None if no supported target was given.
+    """
+    if len(kwargs) != 1:
+        return None
+    metric, target = next(iter(kwargs.items()))
+    if metric not in ('l', 'lq', 'w', 'wq') or (q is not None and metric != 'wq'):
+        return None
+
+    try:
+        target, mu_arr, c_arr = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (target, mu, c)))
+        q_level = None if q is None else float(q)
+    except (TypeError, ValueError):
+        return math.nan
+
+    with np.errstate(invalid='ignore'):
+        valid = ((target >= 0) & np.isfinite(target) & (mu_arr > 0) & np.isfinite(mu_arr)
+                 & (c_arr >= 1) & (c_arr == np.floor(c_arr)))
+    if q_level is not None:
+        valid = valid & (0 <= q_level < 1)  # valid is a numpy.bool_ for scalar inputs
+    mu_arr, c_arr = np.where(valid, mu_arr, 1.0), np.where(valid, c_arr, 1.0)
+
+    def metric_at(lam):
+        _, pw, lq = erlang_c_array(lam, mu_arr, c_arr)
+        with np.errstate(all='ignore'):
+            wq = lq / lam
+            if q_level is not None:
+                return np.maximum(np.log(pw / (1 - q_level)) / (c_arr * mu_arr - lam), 0.0)
+            return {'lq': lq, 'wq': wq, 'l': lq + lam / mu_arr, 'w': wq + 1 / mu_arr}[metric]
+
+    # targets at or below the λ → 0 limit of the metric can only be met by λ = 0
+    floor = 1 / mu_arr if metric == 'w' else (-math.inf if q_level is not None else 0.0)
+    with np.errstate(invalid='ignore'):
+        zero = ~valid | (target <= floor)
+
+    # bracket: metric(λ_lo) <= target < metric(λ_hi) for every entry
+    lo = np.zeros(target.shape)
+    hi = np.where(zero, 0.0, c_arr * mu_arr)
+    for _ in range(2000):  # safeguard; a λ near 1e-300·cμ needs ~1000 halvings
+        if np.all(hi - lo <= tol * hi):
+            break
+        mid = (lo + hi) / 2
+        ok = metric_at(mid) <= target
+        lo = np.where(ok, mid, lo)
+        hi = np.where(ok, hi, mid)
+
+    result = np.where(valid, lo, math.nan)
+    return float(result) if result.ndim == 0 else result
+
@@ -0,0 +1,101 @@
+import unittest
+import math
+
+import numpy as np
+
+import queues as q
+import network as net
+
+
+class TestNetworkStudent(unittest.TestCase):
+    """Test suite for queueing network functions"""
+
+    # ==================== Tests for solve_jackson_network ====================
+    def test_jackson_tandem(self):
+        """Test two M/M/1 stations in series add their response times"""
+        result = net.solve_jackson_network([20, 0], [25, 30], [1, 1], [[0, 1], [0, 0]])
+        self.assertAlmostEqual(20.0, result['lamda'][1], places=10)
+        self.assertAlmostEqual(1 / 5 + 1 / 10, result['w_total'], places=10)
+        self.assertAlmostEqual(4.0 + 2.0, result['l_total'], places=10)
+
+    def test_jackson_feedback(self):
+        """Test a feedback loop inflates the station arrival rate"""
+        result = net.solve_jackson_network([10], [25], [2], [[0.5]])
+        self.assertAlmostEqual(20.0, result['lamda'][0], places=10)
+        self.assertAlmostEqual(q.calc_lq_mmc(20, 25, 2), result['lq'][0], places=10)
+        self.assertAlmostEqual(result['l'][0] / 10, result['w_total'], places=10)
+
+    def test_jackson_unvisited_and_saturated(self):
+        """Test unvisited stations are empty and saturated ones infinite"""
+        result = net.solve_jackson_network([20, 0], [25, 30], [1, 1], [[0, 0], [0, 0]])
+        self.assertEqual(0.0, result['l'][1])
+        result = net.solve_jackson_network([30, 0], [25, 30], [1, 1], [[0, 0], [0, 0]])
+        self.assertTrue(math.isinf(result['w'][0]))
+        self.assertTrue(math.isinf(result['w_total']))
+
+    def test_jackson_large_mesh(self):
+        """Test a 300-station mesh solves and conserves flow"""
+        rng = np.random.default_rng(1)
+        m = 300
+        routing = rng.random((m, m))
+        routing *= 0.8 / routing.sum(axis=1, keepdims=True)
+        gamma = rng.random(m)
+        result = net.solve_jackson_network(gamma, 50.0, 4, routing)
+        # everything that enters eventually leaves: Σγ = Σ λ_i (1 - Σ_j P_ij)
+        self.assertAlmostEqual(gamma.sum(), (result['lamda'] * 0.2).sum(), places=8)
+        self.assertTrue(np.all(np.isfinite(result['w'])))
+
+    def test_jackson_invalid(self):
+        """Test invalid inputs return nan"""
+        self.assertTrue(math.isnan(net.solve_jackson_network([20], [25], [1], [[1.0]])))
+        self.assertTrue(math.isnan(net.solve_jackson_network([20], [-25], [1], [[0.0]])))
+        self.assertTrue(math.isnan(net.solve_jackson_network([20, 5], [25], [1], [[0.0]])))
+
+    # ==================== Tests for solve_mva ====================
+    def test_mva_single_station(self):
+        """Test a single queueing station saturates at 1/D"""
+        result = net.solve_mva([0.5], 4)
+        self.assertAlmostEqual(2.0, result['x'], places=10)
+        self.assertAlmostEqual(4.0, result['q'][0], places=10)
+
+    def test_mva_matches_machine_repair(self):
+        """Test a queue plus think time reproduces the M/M/1//N model"""
+        expected = q.calc_mmc_finite_source(1, 5, 1, 3)['lamda_eff']
+        self.assertAlmostEqual(expected, net.solve_mva([0.2], 3, think_time=1.0)['x'], places=10)
+        result = net.solve_mva([0.2, 1.0], 3, ['queue', 'delay'])
+        self.assertAlmostEqual(expected, result['x'], places=10)
+        self.assertAlmostEqual(0.0, result['u'][1], places=10)
+
+    def test_mva_flow_balance(self):
+        """Test Little's Law over the whole closed network"""
+        result = net.solve_mva([0.1, 0.3, 0.2], 25, think_time=2.0)
+        self.assertAlmostEqual(25, result['x'] * (result['r'] + 2.0), places=8)
+        self.assertAlmostEqual(25 - result['x'] * 2.0, result['q'].sum(), places=8)
+
+    def test_mva_approx_close_to_exact(self):
+        """Test Schweitzer MVA tracks exact MVA for a large population"""
+        demands = np.random.default_rng(0).random(100)
+        exact = net.solve_mva(demands, 10000)
+        approx = net.solve_mva_approx(demands, 10000)
+        self.assertAlmostEqual(exact['x'], approx['x'], delta=1e-3 * exact['x'])
+        exact = net.solve_mva([0.1, 0.3, 0.2], 25, think_time=2.0)
+        approx = net.solve_mva_approx([0.1, 0.3, 0.2], 25, think_time=2.0)
+        self.assertAlmostEqual(exact['x'], approx['x'], delta=0.05 * exact['x'])
+
+    def test_mva_invalid(self):
+        """Test invalid inputs return nan"""
+        self.assertTrue(math.isnan(net.solve_mva([-1.0], 3)))
+        self.assertTrue(math.isnan(net.solve_mva([1.0], 0)))
+        self.assertTrue(math.isnan(net.solve_mva([1.0], 3, ['disk'])))
+        self.assertTrue(math.isnan(net.solve_mva_approx([1.0], 3, c=0)))
+
+    def test_mva_zero_demand_and_think_time(self):
+        """Test a network that spends no time anywhere returns nan instead of inf"""
+        self.assertTrue(math.isnan(net.solve_mva([0.0, 0.0], 3)))
+        self.assertTrue(math.isnan(net.solve_mva_approx([0.0, 0.0], 3)))
+        self.assertAlmostEqual(3.0, net.solve_mva([0.0, 0.0], 3, think_time=1.0)['x'], places=12)
+
+
+if __name__ == '__main__':
+    # Run tests with verbose output
+    unittest.main(verbosity=2)
@@ -1,5 +1,11 @@
 import unittest
 import math
+import time
+from decimal import Decimal
+from fractions import Fraction
+
+import numpy as np
+
 import queues as q
 
 
@@ -261,6 +267,311 @@ class TestQueuesStudent(unittest.TestCase):
         self.assertIsNone(q.use_littles_law(20, 25, 1, lq=math.inf))
         self.assertIsNone(q.use_littles_law(20, 25, 1, lq=-1))
 
+    # ==================== Tests for the cache layer ====================
+    def test_cache_single_erlang_c_per_query(self):
+        """Test a priority report evaluates Erlang-C once for all classes"""
+        q.clear_cache()
+        lamda = tuple([1.0] * 20)
+        result = q.use_littles_law(lamda, 25, 1, lq=0.5)
+        self.assertEqual(20, len(result['wqk']))
+        info = q._erlang_c.cache_info()
+        self.assertEqual(1, info.misses)
+        self.assertGreaterEqual(info.hits, 19)
+
+    def test_cache_list_and_tuple_share_key(self):
+        """Test list and tuple arrival rates hit the same cached entry"""
+        q.clear_cache()
+        self.assertAlmostEqual(2.8444, q.calc_lq_mmc([10, 15, 15], 25, 2), places=4)
+        self.assertAlmostEqual(2.8444, q.calc_lq_mmc((10, 15, 15), 25, 2), places=4)
+        self.assertEqual(1, q._erlang_c.cache_info().misses)
+
+    def test_cache_unhashable_inputs(self):
+        """Test unhashable inputs bypass the cache instead of raising"""
+        self.assertFalse(q.is_valid({'a': 5}, 25, 1))
+        self.assertFalse(q.is_valid([[5]], 25, 1))
+
+    def test_cache_keeps_types_apart(self):
+        """Test equal values of different types do not share cached validity"""
+        q.clear_cache()
+        self.assertFalse(q.is_valid(20, Fraction(25), 1))
+        self.assertTrue(q.is_valid(20, 25, 1))
+        self.assertAlmostEqual(0.2, q.calc_p0(20, 25, 1), places=10)
+        self.assertFalse(q.is_valid(Decimal(20), 25, 1))
+        self.assertFalse(q.is_feasible([20, Decimal(1)], 25, 1))
+        self.assertTrue(q.is_feasible([20, 1], 25, 1))
+
+    def test_calc_p0_large_c(self):
+        """Test calc_p0 and calc_lq_mmc stay finite for large server counts"""
+        self.assertTrue(0 < q.calc_lq_mmc(190, 1, 200) < 10)
+        self.assertAlmostEqual(math.exp(-0.5), q.calc_p0(0.5, 1, 300), places=10)
+
+    # ==================== Tests for calc_class_metrics_mmc ====================
+    def test_class_metrics_match_scalar_functions(self):
+        """Test vectorized class metrics agree with calc_wqk_mmc/calc_lqk_mmc"""
+        lamda = (5, 20, 30)
+        result = q.calc_class_metrics_mmc(lamda, 25, 3)
+        for k in range(1, 4):
+            wqk = q.calc_wqk_mmc(k, lamda, 25, 3)
+            self.assertAlmostEqual(wqk, result['wqk'][k - 1], places=10)
+            self.assertAlmostEqual(q.calc_lqk_mmc(k, lamda, wqk), result['lqk'][k - 1], places=10)
+            self.assertAlmostEqual(wqk + 1 / 25, result['wk'][k - 1], places=10)
+
+    def test_class_metrics_rubric_values(self):
+        """Test vectorized class metrics for the (5, 10, 5) lecture case"""
+        result = q.calc_class_metrics_mmc((5, 10, 5), 25, 1)
+        for key, expected in (('wqk', (0.04, 0.10, 0.40)), ('wk', (0.08, 0.14, 0.44)),
+                              ('lqk', (0.2, 1.0, 2.0)), ('lk', (0.4, 1.4, 2.2))):
+            for got, exp in zip(result[key], expected):
+                self.assertAlmostEqual(exp, got, places=7)
+
+    def test_class_metrics_scenarios(self):
+        """Test scenario rows are evaluated independently with nan/inf masking"""
+        result = q.calc_class_metrics_mmc([[5, 10, 5], [10, 10, 10], [5, -1, 5]], 25, 1)
+        self.assertEqual((3, 3), result['wqk'].shape)
+        self.assertAlmostEqual(0.4, result['wqk'][0, 2], places=7)
+        self.assertTrue(all(math.isinf(x) for x in result['wqk'][1]))
+        self.assertTrue(all(math.isnan(x) for x in result['lk'][2]))
+
+    def test_class_metrics_per_scenario_servers(self):
+        """Test mu and c may vary per scenario"""
+        result = q.calc_class_metrics_mmc([[5, 10, 5], [10, 15, 15]], 25, [1, 2])
+        self.assertAlmostEqual(0.4, result['wqk'][0, 2], places=7)
+        self.assertAlmostEqual(q.calc_wqk_mmc(3, (10, 15, 15), 25, 2), result['wqk'][1, 2], places=10)
+
+    def test_class_metrics_invalid_input(self):
+        """Test non-numeric arrival rates return nan"""
+        self.assertTrue(math.isnan(q.calc_class_metrics_mmc(('five',), 25, 1)))
+
+    # ==================== Tests for calc_class_metrics_mgc ====================
+    def test_mgc_matches_mmc_for_common_mu(self):
+        """Test non-preemptive M/G/c with exponential service equals the M/M/c table"""
+        expected = q.calc_class_metrics_mmc((5, 20, 30), 25, 3)
+        result = q.calc_class_metrics_mgc((5, 20, 30), 25, 3)
+        for key in ('wqk', 'lqk', 'wk', 'lk'):
+            for got, exp in zip(result[key], expected[key]):
+                self.assertAlmostEqual(exp, got, places=10)
+
+    def test_mgc_cobham_heterogeneous(self):
+        """Test c = 1 reproduces the M/G/1 non-preemptive priority formula"""
+        result = q.calc_class_metrics_mgc((2, 3), (10, 8), 1, scv=(0.5, 2.0))
+        residual = (2 * 1.5 / 10 ** 2 + 3 * 3.0 / 8 ** 2) / 2
+        self.assertAlmostEqual(residual / (1 - 0.2), result['wqk'][0], places=10)
+        self.assertAlmostEqual(residual / ((1 - 0.2) * (1 - 0.575)), result['wqk'][1], places=10)
+
+    def test_mgc_preemptive_mm1(self):
+        """Test preemptive-resume M/M/1: top class is unaffected, total L is conserved"""
+        result = q.calc_class_metrics_mgc((5, 15), 25, 1, preemptive=True)
+        self.assertAlmostEqual(1 / (25 - 5), result['wk'][0], places=10)
+        self.assertAlmostEqual(4.0, result['lk'].sum(), places=10)
+
+    def test_mgc_preemptive_top_class_mmc(self):
+        """Test preemptive top class sees an M/M/c queue of its own traffic"""
+        result = q.calc_class_metrics_mgc((5, 20, 30), 25, 3, preemptive=True)
+        self.assertAlmostEqual(q.calc_lq_mmc(5, 25, 3) / 5, result['wqk'][0], places=10)
+        self.assertLess(result['wk'][0], q.calc_class_metrics_mmc((5, 20, 30), 25, 3)['wk'][0])
+
+    def test_mgc_invalid_and_infeasible(self):
+        """Test nan/inf masking per scenario"""
+        result = q.calc_class_metrics_mgc([[5, 15], [10, 20], [5, 5]], 25, 1, scv=[1, 1], preemptive=True)
+        self.assertTrue(math.isinf(result['wk'][1, 0]))
+        result = q.calc_class_metrics_mgc((5, 15), (25, -1), 1)
+        self.assertTrue(math.isnan(result['wk'][0]))
+
+    # ==================== Tests for calc_transient_mmc ====================
+    def test_transient_initial_state(self):
+        """Test t = 0 returns the initial state and rows are distributions"""
+        dist = q.calc_transient_mmc(20, 25, 1, [0.0, 0.5], n0=3)
+        self.assertAlmostEqual(1.0, dist[0, 3], places=12)
+        for row in dist:
+            self.assertAlmostEqual(1.0, row.sum(), places=10)
+
+    def test_transient_matches_infinite_server(self):
+        """Test with many idle servers the queue follows the M/M/inf Poisson law"""
+        lamda, mu, t = 5.0, 1.0, 0.7
+        dist = q.calc_transient_mmc(lamda, mu, 60, t)
+        mean = lamda / mu * (1 - math.exp(-mu * t))
+        for n in range(8):
+            expected = math.exp(-mean) * mean ** n / math.factorial(n)
+            self.assertAlmostEqual(expected, dist[n], places=9)
+
+    def test_transient_light_traffic_from_busy_start(self):
+        """Test a nonzero n0 in light traffic drains like M/M/inf (binomial + Poisson)"""
+        lamda, mu, n0, times = 0.001, 1.0, 3, [0.5, 1.0, 4.0]
+        dist = q.calc_transient_mmc(lamda, mu, 10, times, n0=n0)
+        for row, t in zip(dist, times):
+            stay = math.exp(-mu * t)
+            mean = lamda / mu * (1 - stay)
+            for n in range(6):
+                expected = sum(math.comb(n0, j) * stay ** j * (1 - stay) ** (n0 - j)
+                               * math.exp(-mean) * mean ** (n - j) / math.factorial(n - j)
+                               for j in range(min(n, n0) + 1))
+                self.assertAlmostEqual(expected, row[n], places=9)
+        single = q.calc_transient_mmc(lamda, mu, 1, 1.0, n0=n0)
+        self.assertAlmostEqual(math.exp(-1.0), single[3], places=2)
+
+    def test_transient_converges_to_steady_state(self):
+        """Test long horizons reach the steady-state M/M/1 mean"""
+        dist = q.calc_transient_mmc(20, 25, 1, [100.0, 1.0])
+        mean = (dist[0] * range(dist.shape[1])).sum()
+        self.assertAlmostEqual(4.0, mean, places=6)
+        self.assertLess((dist[1] * range(dist.shape[1])).sum(), 4.0)
+
+    def test_transient_overloaded(self):
+        """Test infeasible systems still return a finite distribution"""
+        dist = q.calc_transient_mmc(30, 25, 1, 2.0)
+        self.assertAlmostEqual(1.0, dist.sum(), places=10)
+        self.assertGreater((dist * range(dist.size)).sum(), 5.0)
+
+    def test_transient_operator_matches_direct_uniformization(self):
+        """Test the convolution operator agrees with stepping the vector directly"""
+        t = np.linspace(0, 3, 25)
+        for lamda, c, n0 in ((9.0, 10, 40), (12.0, 10, 0), (0.5, 3, 6)):
+            fast = q.calc_transient_mmc(lamda, 1.0, c, t, n0=n0)
+            limit, q._BOUNDARY_CELLS = q._BOUNDARY_CELLS, 0
+            try:
+                direct = q.calc_transient_mmc(lamda, 1.0, c, t, n0=n0)
+            finally:
+                q._BOUNDARY_CELLS = limit
+            self.assertLess(np.abs(fast - direct).sum(axis=1).max(), 1e-9)
+
+    def test_transient_day_grid_near_saturation_and_overload(self):
+        """Test a 1440-point day at c=200 stays under a second at rho=0.995 and in overload"""
+        t = np.linspace(0, 24, 1440)
+        for lamda in (199.0, 210.0):
+            start = time.perf_counter()
+            dist = q.calc_transient_mmc(lamda, 1.0, 200, t)
+            self.assertLess(time.perf_counter() - start, 1.0)
+            np.testing.assert_allclose(dist.sum(axis=1), 1.0, atol=1e-9)
+        mean = (dist[-1] * np.arange(dist.shape[1])).sum()
+        self.assertGreater(mean, 200 + 0.8 * 10 * 24)    # backlog grows at about λ − cμ
+
+    def test_transient_invalid(self):
+        """Test invalid inputs return nan"""
+        self.assertTrue(math.isnan(q.calc_transient_mmc(0, 25, 1, 1.0)))
+        self.assertTrue(math.isnan(q.calc_transient_mmc(20, 25, 1, -1.0)))
+        self.assertTrue(math.isnan(q.calc_transient_mmc(20, 25, 1, 1.0, n0=-2)))
+
+    # ==================== Tests for distributions and percentiles ====================
+    def test_calc_pn_mmc_mm1(self):
+        """Test P(N=n) is geometric for M/M/1 and sums to one"""
+        pn = q.calc_pn_mmc(20, 25, 1)
+        self.assertAlmostEqual(0.2, pn[0], places=10)
+        self.assertAlmostEqual(0.2 * 0.8 ** 5, pn[5], places=10)
+        self.assertAlmostEqual(1.0, pn.sum(), places=9)
+
+    def test_calc_pn_mmc_matches_p0_and_lq(self):
+        """Test the M/M/c distribution reproduces calc_p0 and calc_lq_mmc"""
+        pn = q.calc_pn_mmc(65, 25, 3)
+        self.assertAlmostEqual(q.calc_p0(65, 25, 3), pn[0], places=10)
+        lq = sum(max(n - 3, 0) * p for n, p in enumerate(pn))
+        self.assertAlmostEqual(q.calc_lq_mmc(65, 25, 3), lq, places=8)
+        self.assertEqual(11, len(q.calc_pn_mmc(65, 25, 3, n_max=10)))
+
+    def test_calc_pn_mmc_invalid_infeasible(self):
+        """Test calc_pn_mmc nan/inf conventions"""
+        self.assertTrue(math.isnan(q.calc_pn_mmc(0, 25, 1)))
+        self.assertTrue(math.isinf(q.calc_pn_mmc(30, 25, 1)))
+
+    def test_calc_wq_tail_mmc(self):
+        """Test P(Wq > t) for M/M/1 over a t-grid"""
+        tail = q.calc_wq_tail_mmc([0.0, 0.1, 0.2], 20, 25, 1)
+        for t, got in zip((0.0, 0.1, 0.2), tail):
+            self.assertAlmostEqual(0.8 * math.exp(-5 * t), got, places=10)
+        self.assertAlmostEqual(0.8, q.calc_wq_tail_mmc(0, 20, 25, 1), places=10)
+
+    def test_calc_wq_quantile_mmc(self):
+        """Test Wq quantiles invert the tail and are zero below 1 - P_wait"""
+        p50, p95, p99 = q.calc_wq_quantile_mmc([0.5, 0.95, 0.99], 40, 25, 2)
+        self.assertAlmostEqual(0.5, q.calc_wq_tail_mmc(p50, 40, 25, 2), places=10)
+        self.assertAlmostEqual(0.01, q.calc_wq_tail_mmc(p99, 40, 25, 2), places=10)
+        self.assertTrue(p50 < p95 < p99)
+        self.assertEqual(0.0, q.calc_wq_quantile_mmc(0.1, 20, 25, 1))
+        self.assertTrue(math.isinf(q.calc_wq_quantile_mmc(0.9, 30, 25, 1)))
+
+    def test_calc_wqk_tail_and_quantile(self):
+        """Test the class tail matches the class mean and inverts consistently"""
+        pw = q.calc_wq_tail_mmc(0, (5, 10, 5), 25, 1)
+        self.assertAlmostEqual(pw, q.calc_wqk_tail_mmc(3, 0, (5, 10, 5), 25, 1), places=10)
+        t99 = q.calc_wqk_quantile_mmc(3, 0.99, (5, 10, 5), 25, 1)
+        self.assertAlmostEqual(0.01, q.calc_wqk_tail_mmc(3, t99, (5, 10, 5), 25, 1), places=10)
+        self.assertLess(q.calc_wqk_quantile_mmc(1, 0.99, (5, 10, 5), 25, 1), t99)
+        self.assertTrue(math.isnan(q.calc_wqk_tail_mmc(4, 0, (5, 10, 5), 25, 1)))
+
+    # ==================== Tests for finite-capacity models ====================
+    def test_calc_mmck_mm1k_formula(self):
+        """Test M/M/1/K against the closed-form truncated geometric"""
+        r, k = 30 / 25, 5
+        p0 = (1 - r) / (1 - r ** (k + 1))
+        result = q.calc_mmck(30, 25, 1, k)
+        self.assertAlmostEqual(p0, result['p0'], places=10)
+        self.assertAlmostEqual(p0 * r ** k, result['pk'], places=10)
+        self.assertAlmostEqual(30 * (1 - p0 * r ** k), result['lamda_eff'], places=10)
+        self.assertAlmostEqual(result['l'] / result['lamda_eff'], result['w'], places=10)
+
+    def test_calc_mmck_large_k_matches_mmc(self):
+        """Test a large buffer reproduces the infinite-capacity M/M/c results"""
+        result = q.calc_mmck(65, 25, 3, 500)
+        self.assertAlmostEqual(q.calc_p0(65, 25, 3), result['p0'], places=10)
+        self.assertAlmostEqual(q.calc_lq_mmc(65, 25, 3), result['lq'], places=8)
+
+    def test_calc_mmck_overload_and_arrays(self):
+        """Test overload stays finite and parameter arrays are broadcast"""
+        self.assertAlmostEqual(0.8, q.calc_mmck(1e4, 1, 2000, 1e5)['pk'], places=6)
+        result = q.calc_mmck([20, 30, -1], 25, [1, 2, 1], [5, 10, 5])
+        self.assertEqual((3,), result['lq'].shape)
+        self.assertAlmostEqual(q.calc_mmck(30, 25, 2, 10)['lq'], result['lq'][1], places=12)
+        self.assertTrue(math.isnan(result['w'][2]))
+        self.assertTrue(math.isnan(q.calc_mmck(20, 25, 3, 2)['p0']))
+
+    def test_calc_mmc_finite_source(self):
+        """Test the machine-repair model against hand-computed probabilities"""
+        result = q.calc_mmc_finite_source(1, 5, 1, 3)
+        weights = (1, 0.6, 0.24, 0.048)
+        total = sum(weights)
+        self.assertAlmostEqual(1 / total, result['p0'], places=10)
+        l = sum(n * w for n, w in enumerate(weights)) / total
+        self.assertAlmostEqual(l, result['l'], places=10)
+        self.assertAlmostEqual(1 * (3 - l), result['lamda_eff'], places=10)
+        self.assertTrue(math.isnan(q.calc_mmc_finite_source(1, 5, 1, 0)['l']))
+
+    # ==================== Tests for calc_max_lamda ====================
+    def test_calc_max_lamda_mm1(self):
+        """Test the inverse of W = 1/(mu - lamda) for M/M/1"""
+        self.assertAlmostEqual(20.0, q.calc_max_lamda(25, 1, w=0.2), places=6)
+        self.assertAlmostEqual(20.0, q.calc_max_lamda(25, 1, lq=3.2), places=6)
+
+    def test_calc_max_lamda_batched_targets(self):
+        """Test a batch of Wq targets round-trips through calc_lq_mmc"""
+        result = q.calc_max_lamda(25, 2, wq=[0.01, 0.05, 0.1])
+        self.assertEqual(3, len(result))
+        for lamda, target in zip(result, (0.01, 0.05, 0.1)):
+            self.assertAlmostEqual(target, q.calc_lq_mmc(lamda, 25, 2) / lamda, places=6)
+
+    def test_calc_max_lamda_percentile(self):
+        """Test a p99 budget round-trips through calc_wq_quantile_mmc"""
+        lamda = q.calc_max_lamda(25, 1, q=0.99, wq=0.5)
+        self.assertAlmostEqual(0.5, q.calc_wq_quantile_mmc(0.99, lamda, 25, 1), places=6)
+
+    def test_calc_max_lamda_small_answer_is_relative(self):
+        """Test the tolerance is relative to λ when λ is far below cμ"""
+        lamda = q.calc_max_lamda(25, 1, lq=1e-9, tol=1e-6)
+        self.assertAlmostEqual(1.0, q.calc_lq_mmc(lamda, 25, 1) / 1e-9, places=5)
+        self.assertEqual(0.0, q.calc_max_lamda(25, 1, lq=0))
+
+    def test_calc_max_lamda_edge_cases(self):
+        """Test unattainable, invalid and missing targets"""
+        self.assertEqual(0.0, q.calc_max_lamda(25, 1, w=0.01))
+        self.assertTrue(math.isnan(q.calc_max_lamda(25, 1, lq=-1)))
+        self.assertTrue(math.isnan(q.calc_max_lamda(0, 1, lq=1)))
+        self.assertIsNone(q.calc_max_lamda(25, 1))
+        self.assertIsNone(q.calc_max_lamda(25, 1, q=0.9, w=1.0))
+
+    def test_calc_max_lamda_invalid_quantile(self):
+        """Test an out-of-range q returns nan for scalar and array targets"""
+        self.assertTrue(math.isnan(q.calc_max_lamda(25, 1, q=1.5, wq=0.1)))
+        self.assertTrue(math.isnan(q.calc_max_lamda(25, 1, q=-0.1, wq=0.1)))
+        self.assertTrue(np.all(np.isnan(q.calc_max_lamda(25, 1, q=1.5, wq=[0.1, 0.2]))))
+
 
 if __name__ == '__main__':
     # Run tests with verbose output
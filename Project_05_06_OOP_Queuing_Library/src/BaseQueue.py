@@ -5,10 +5,73 @@ BaseQueue class - Base class for all queue types.
 from __future__ import annotations
 
 import math
+import threading
+import time
 from abc import ABC
+from functools import wraps
 from typing import Tuple
 
 
+# -------------------- profiling state (opt-in, see BaseQueue.enable_profiling) --------------------
+
+_PROFILE_FIELDS = ("recomputations", "cache_hits", "validations", "calc_seconds")
+_profile_stats: dict[str, dict[str, float]] = {}
+_profile_patches: list[tuple[type, str, object]] = []  # (class, attribute, original) to restore
+_profile_lock = threading.Lock()  # guards _profile_stats updates
+_profile_depth = threading.local()  # per-thread nesting: only outermost super() calls are counted
+
+
+def _profile_add(queue: object, field: str, amount: float = 1) -> None:
+    """Add to a counter of the queue's concrete class."""
+    name = type(queue).__name__
+    with _profile_lock:
+        entry = _profile_stats.get(name)
+        if entry is None:
+            entry = _profile_stats[name] = dict.fromkeys(_PROFILE_FIELDS, 0)
+        entry[field] += amount
+
+
+def _profiled_calc(func):
+    @wraps(func)
+    def wrapper(self):
+        if getattr(_profile_depth, "calc", 0):
+            return func(self)
+        _profile_depth.calc = 1
+        start = time.perf_counter()
+        try:
+            return func(self)
+        finally:
+            _profile_depth.calc = 0
+            _profile_add(self, "recomputations")
+            _profile_add(self, "calc_seconds", time.perf_counter() - start)
+    return wrapper
+
+
+def _profiled_validation(func):
+    @wraps(func)
+    def wrapper(self):
+        if getattr(_profile_depth, "valid", 0):
+            return func(self)
+        _profile_depth.valid = 1
+        try:
+            return func(self)
+        finally:
+            _profile_depth.valid = 0
+            _profile_add(self, "validations")
+    return wrapper
+
+
+def _profiled_read(prop: property) -> property:
+    fget = prop.fget
+
+    @wraps(fget)
+    def getter(self):
+        if not self._recalc_needed:
+            _profile_add(self, "cache_hits")
+        return fget(self)
+    return property(getter, prop.fset, prop.fdel, prop.__doc__)
+
+
 class BaseQueue(ABC):
     """
     Base class for queue implementations.
@@ -19,11 +82,19 @@ class BaseQueue(ABC):
         _lq (float): average number in queue
         _p0 (float): probability of empty system
         _recalc_needed (bool): flag for lazy recomputation
+        _trusted (bool): parameters already validated (QueueFactory fast path)
+        _dlq_dlamda, _dlq_dmu (float): ∂Lq/∂λ and ∂Lq/∂μ, set with _lq
 
     Derived (properties):
-        ro (ρ), r (alias), utilization (alias), l, wq, w, p0, lq
+        ro (ρ), r (alias), utilization (alias), l, wq, w, p0, lq,
+        dlq_dlamda, dlq_dmu, dwq_dlamda, dwq_dmu (analytic sensitivities)
+
+    Instances use __slots__ (no per-object __dict__); subclasses declare only
+    the attributes they add.
     """
 
+    __slots__ = ("_lamda", "_mu", "_lq", "_p0", "_recalc_needed", "_trusted", "_dlq_dlamda", "_dlq_dmu")
+
     # -------------------- construction --------------------
 
     def __init__(self, lamda: float | Tuple[float, ...], mu: float) -> None:
@@ -37,25 +108,20 @@ class BaseQueue(ABC):
         # computed placeholders first
         self._lq: float = math.nan
         self._p0: float = math.nan
+        self._dlq_dlamda: float = math.nan
+        self._dlq_dmu: float = math.nan
         self._recalc_needed: bool = True
+        self._trusted: bool = False
 
         # storage placeholders (setters will validate)
         self._lamda: float = math.nan
         self._mu: float = math.nan
 
-        # validate via setters (centralized validation)
+        # validate via setters (centralized validation); metrics stay lazy
+        # until the first read, so construction runs no queueing math
         self.mu = mu
         self.lamda = lamda
 
-        # initialize computed metrics per spec
-        if self.is_valid() and self.is_feasible():
-            self._calc_metrics()
-        elif self.is_valid() and not self.is_feasible():
-            # infeasible ⇒ both infinite (per rubric/project text)
-            self._lq = math.inf
-            self._p0 = math.inf
-            self._recalc_needed = False
-
     # -------------------- helpers --------------------
 
     def _is_numeric(self, value: object) -> bool:
@@ -74,6 +140,27 @@ class BaseQueue(ABC):
         """Sum tuple λ; otherwise return scalar λ."""
         return float(sum(lamda)) if isinstance(lamda, tuple) else float(lamda)
 
+    # -------------------- bulk update --------------------
+
+    def update(self, **params) -> None:
+        """
+        Set several parameters at once, e.g. q.update(lamda=30, mu=40).
+
+        Every name is checked before anything is assigned, so an unknown name
+        leaves the queue untouched. Each value goes through its normal setter
+        and the metrics are recomputed once, on the next read.
+
+        Raises:
+            TypeError: if a name is not a settable parameter of this queue.
+        """
+        cls = type(self)
+        for name in params:
+            attr = getattr(cls, name, None)
+            if name.startswith("_") or not (isinstance(attr, property) and attr.fset is not None):
+                raise TypeError(f"{cls.__name__}.update() got an unexpected parameter '{name}'")
+        for name, value in params.items():
+            setattr(self, name, value)
+
     # -------------------- validity / feasibility --------------------
 
     def is_valid(self) -> bool:
@@ -82,9 +169,22 @@ class BaseQueue(ABC):
             return False
         return isinstance(self._lamda, (int, float)) and self._lamda > 0
 
+    def _valid(self) -> bool:
+        """is_valid() for internal metric paths; skipped while the queue is trusted."""
+        return self._trusted or self.is_valid()
+
+    def _trust(self) -> bool:
+        """
+        Validate once and, if valid, let metric reads skip revalidation until
+        the next setter call. Returns the validity.
+        """
+        self._trusted = False
+        self._trusted = self.is_valid()
+        return self._trusted
+
     def is_feasible(self) -> bool:
         """True iff ρ < 1 (uses current ro property)."""
-        if not self.is_valid():
+        if not self._valid():
             return False
         return self.ro < 1
 
@@ -93,7 +193,8 @@ class BaseQueue(ABC):
 
     def _calc_metrics(self) -> None:
         """
-        Calculate and store Lq and P0. Derived classes implement the formulas.
+        Calculate and store Lq and P0. Derived classes implement the formulas,
+        and may also store ∂Lq/∂λ and ∂Lq/∂μ in _dlq_dlamda / _dlq_dmu.
         The last action of this method should be to set _recalc_needed = False.
         """
         self._lq = math.nan
@@ -105,7 +206,7 @@ class BaseQueue(ABC):
     @property
     def ro(self) -> float:
         """Utilization ρ = λ/μ."""
-        if not self.is_valid():
+        if not self._valid():
             return math.nan
         return self._lamda / self._mu
 
@@ -122,7 +223,7 @@ class BaseQueue(ABC):
     @property
     def lq(self) -> float:
         """Average number in queue (Lq). Lazy recompute if needed."""
-        if self._recalc_needed and self.is_valid():
+        if self._recalc_needed:
             self._calc_metrics()
         return self._lq
 
@@ -132,7 +233,7 @@ class BaseQueue(ABC):
         Average number in system (L). For any c:
         L = Lq + λ/μ (Little’s Law with mean in service = λ/μ).
         """
-        if not self.is_valid():
+        if not self._valid():
             return math.nan
         if not self.is_feasible():
             return math.inf
@@ -141,24 +242,50 @@ class BaseQueue(ABC):
     @property
     def wq(self) -> float:
         """Average waiting time in queue: Wq = Lq / λ."""
-        if not self.is_valid():
+        if not self._valid():
             return math.nan
         return self.lq / self._lamda
 
     @property
     def w(self) -> float:
         """Average time in system: W = L / λ."""
-        if not self.is_valid():
+        if not self._valid():
             return math.nan
         return self.l / self._lamda
 
     @property
     def p0(self) -> float:
         """Probability of an empty system (P0). Lazy recompute if needed."""
-        if self._recalc_needed and self.is_valid():
+        if self._recalc_needed:
             self._calc_metrics()
         return self._p0
 
+    # -------------------- sensitivities --------------------
+
+    @property
+    def dlq_dlamda(self) -> float:
+        """∂Lq/∂λ, computed together with Lq (NaN if invalid, +inf if infeasible)."""
+        lq = self.lq
+        return self._dlq_dlamda if math.isfinite(lq) else lq
+
+    @property
+    def dlq_dmu(self) -> float:
+        """∂Lq/∂μ, computed together with Lq (NaN if invalid, +inf if infeasible)."""
+        lq = self.lq
+        return self._dlq_dmu if math.isfinite(lq) else lq
+
+    @property
+    def dwq_dlamda(self) -> float:
+        """∂Wq/∂λ = (∂Lq/∂λ − Wq) / λ."""
+        d = self.dlq_dlamda
+        return (d - self.wq) / self._lamda if math.isfinite(d) else d
+
+    @property
+    def dwq_dmu(self) -> float:
+        """∂Wq/∂μ = (∂Lq/∂μ) / λ."""
+        d = self.dlq_dmu
+        return d / self._lamda if math.isfinite(d) else d
+
     # -------------------- stored properties --------------------
 
     @property
@@ -171,6 +298,7 @@ class BaseQueue(ABC):
         """Setter for λ; sums tuples for non-priority queues; invalid ⇒ NaN."""
         self._lamda = self._simplify_lamda(value) if self._is_numeric_or_tuple(value) else math.nan
         self._recalc_needed = True
+        self._trusted = False
 
     @property
     def mu(self) -> float:
@@ -182,6 +310,64 @@ class BaseQueue(ABC):
         """Setter for μ; invalid ⇒ NaN."""
         self._mu = float(value) if (self._is_numeric(value) and value > 0) else math.nan
         self._recalc_needed = True
+        self._trusted = False
+
+    # -------------------- profiling --------------------
+
+    @staticmethod
+    def enable_profiling() -> None:
+        """
+        Instrument BaseQueue and every subclass defined so far: counts metric
+        recomputations (and their time), cached Lq/P0 reads and is_valid()
+        calls per concrete class. Nothing is wrapped while profiling is off,
+        so the disabled cost is zero.
+
+        Profiling is process-wide: the methods are replaced on the classes
+        themselves, so every queue in every thread is counted until
+        disable_profiling(). Counters are shared and lock-protected, and
+        nesting is tracked per thread.
+        """
+        if _profile_patches:
+            return
+        classes, pending = [], [BaseQueue]
+        while pending:
+            klass = pending.pop()
+            classes.append(klass)
+            pending.extend(klass.__subclasses__())
+        for klass in classes:
+            for name, wrap in (("_calc_metrics", _profiled_calc), ("is_valid", _profiled_validation)):
+                if name in vars(klass):
+                    original = vars(klass)[name]
+                    _profile_patches.append((klass, name, original))
+                    setattr(klass, name, wrap(original))
+        for name in ("lq", "p0"):
+            original = vars(BaseQueue)[name]
+            _profile_patches.append((BaseQueue, name, original))
+            setattr(BaseQueue, name, _profiled_read(original))
+
+    @staticmethod
+    def disable_profiling() -> None:
+        """Restore the original methods; collected stats are kept."""
+        while _profile_patches:
+            klass, name, original = _profile_patches.pop()
+            setattr(klass, name, original)
+
+    @staticmethod
+    def profiling_enabled() -> bool:
+        """True while the instrumentation is installed."""
+        return bool(_profile_patches)
+
+    @staticmethod
+    def profiling_stats() -> dict[str, dict[str, float]]:
+        """Snapshot: class name ⇒ {'recomputations', 'cache_hits', 'validations', 'calc_seconds'}."""
+        with _profile_lock:
+            return {name: dict(entry) for name, entry in _profile_stats.items()}
+
+    @staticmethod
+    def reset_profiling_stats() -> None:
+        """Clear all counters."""
+        with _profile_lock:
+            _profile_stats.clear()
 
     # -------------------- representation --------------------
 
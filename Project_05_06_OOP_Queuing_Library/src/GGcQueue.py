@@ -0,0 +1,95 @@
+"""
+GGcQueue class - Approximation for the G/G/c queue.
+Multi-server: general interarrival and service times, c servers.
+
+"""
+from __future__ import annotations
+
+import math
+from typing import Iterable
+
+from MGcQueue import MGcQueue
+from RunningStats import RunningStats
+
+
+class GGcQueue(MGcQueue):
+    """
+    Allen–Cunneen approximation with general arrivals:
+
+        Lq = Lq(M/M/c) · (ca² + cs²) / 2,   ca² = (σa λ)²,  cs² = (σμ)²
+
+    For c = 1 this is Kingman's formula; Poisson arrivals (σa = 1/λ) give
+    MGcQueue.
+    """
+
+    __slots__ = ("_sigma_a",)
+
+    # -------------------- construction --------------------
+
+    def __init__(self, lamda: float | tuple[float, ...], mu: float, c: int, sigma: float,
+                 sigma_a: float) -> None:
+        """
+        Args:
+            lamda: Aggregate arrival rate (λ).
+            mu: Per-server service rate (μ).
+            c: Number of servers (integer ≥ 1).
+            sigma: Standard deviation of the service time (σ ≥ 0).
+            sigma_a: Standard deviation of the interarrival time (σa ≥ 0).
+        """
+        self._sigma_a: float = math.nan
+        self.sigma_a = sigma_a  # setter validates
+        super().__init__(lamda, mu, c, sigma)
+
+    @classmethod
+    def from_samples(cls, interarrival_times: Iterable, service_times: Iterable, c: int = 1) -> GGcQueue:
+        """
+        Build a queue with λ, σa, μ and σ estimated from two streams.
+
+        Args:
+            interarrival_times: iterable of interarrival times (or array chunks).
+            service_times: iterable of service times (or array chunks).
+            c: Number of servers.
+        """
+        arrivals = RunningStats(interarrival_times)
+        services = RunningStats(service_times)
+        return cls(cls._rate(arrivals), cls._rate(services), c, services.std, arrivals.std)
+
+    # -------------------- validation --------------------
+
+    def is_valid(self) -> bool:
+        """Extend M/G/c validity to include σa ≥ 0."""
+        if not super().is_valid():
+            return False
+        return isinstance(self._sigma_a, float) and not math.isnan(self._sigma_a) and self._sigma_a >= 0
+
+    # -------------------- properties --------------------
+
+    @property
+    def sigma_a(self) -> float:
+        """Getter for the interarrival-time standard deviation σa."""
+        return self._sigma_a
+
+    @sigma_a.setter
+    def sigma_a(self, value: float) -> None:
+        """Setter for σa; invalid ⇒ NaN; triggers recompute."""
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and value >= 0:
+            self._sigma_a = float(value)
+        else:
+            self._sigma_a = math.nan
+        self._recalc_needed = True
+        self._trusted = False
+
+    @property
+    def ca2(self) -> float:
+        """Squared coefficient of variation of interarrival times: (σa λ)²."""
+        return (self._sigma_a * self._lamda) ** 2
+
+    def _dca2_dlamda(self) -> float:
+        """∂ca²/∂λ = 2σa²λ."""
+        return 2.0 * self._sigma_a * self._sigma_a * self._lamda
+
+    # -------------------- representation --------------------
+
+    def __str__(self) -> str:
+        """Append sigma_a to MGcQueue string."""
+        return super().__str__() + f"\n\tsigma_a: {self.sigma_a}"
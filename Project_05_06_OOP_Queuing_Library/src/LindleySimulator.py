@@ -0,0 +1,138 @@
+"""
+LindleySimulator class - Vectorized simulation of single-server FIFO queues
+(M/M/1, M/D/1, M/G/1, G/G/1) through the Lindley recursion.
+
+"""
+from __future__ import annotations
+
+import numpy as np
+
+from BaseQueue import BaseQueue
+from GGcQueue import GGcQueue
+from MD1Queue import MD1Queue
+from MGcQueue import MGcQueue
+from MG1Queue import MG1Queue
+from MMcQueue import MMcQueue
+from QueueSimulator import Deterministic, Exponential, Gamma, Trace
+
+
+class LindleySimulator:
+    """
+    Single-server FIFO simulator without an event loop.
+
+    Lindley: W_n = max(0, W_{n-1} + S_{n-1} - A_n). With C_n the running sum of
+    X_n = S_{n-1} - A_n, this unrolls to W_n = C_n - min(-W_0, min_{k<=n} C_k),
+    i.e. a cumulative sum and a cumulative minimum per chunk of customers.
+    Only the last waiting time and service time are carried between chunks.
+    """
+
+    # -------------------- construction --------------------
+
+    def __init__(self, interarrival, service) -> None:
+        """
+        Args:
+            interarrival: distribution with sample(rng, size) for interarrival times.
+            service: distribution with sample(rng, size) for service times.
+        """
+        self.interarrival = interarrival
+        self.service = service
+
+    @classmethod
+    def from_queue(cls, queue: BaseQueue) -> LindleySimulator:
+        """Build a simulator with the assumptions of a single-server analytic queue."""
+        if not queue.is_valid():
+            raise ValueError("queue parameters are invalid")
+        if isinstance(queue, MMcQueue) and queue.c != 1:
+            raise ValueError("the Lindley recursion only covers single-server queues")
+
+        if isinstance(queue, GGcQueue):
+            return cls(Gamma(1.0 / queue.lamda, queue.sigma_a), Gamma(1.0 / queue.mu, queue.sigma))
+        arrivals = Exponential(queue.lamda)
+        if isinstance(queue, MD1Queue):
+            return cls(arrivals, Deterministic(1.0 / queue.mu))
+        if isinstance(queue, (MG1Queue, MGcQueue)):
+            return cls(arrivals, Gamma(1.0 / queue.mu, queue.sigma))
+        return cls(arrivals, Exponential(queue.mu))
+
+    # -------------------- simulation --------------------
+
+    @staticmethod
+    def _draw(dist, rng: np.random.Generator, offset: int, size: int) -> np.ndarray:
+        """Next `size` draws; traces continue where the previous chunk stopped."""
+        if isinstance(dist, Trace):
+            return dist.values[offset:offset + size]
+        return dist.sample(rng, size)
+
+    def _chunks(self, n: int, seed, chunk_size: int):
+        """Yield (interarrival, service, wq) arrays for consecutive chunks of customers."""
+        if not (isinstance(n, int) and n >= 1 and isinstance(chunk_size, int) and chunk_size >= 1):
+            raise ValueError("n and chunk_size must be integers >= 1")
+        rng = np.random.default_rng(seed)
+        w_prev, s_prev = 0.0, 0.0
+        done = 0
+        while done < n:
+            size = min(chunk_size, n - done)
+            gaps = self._draw(self.interarrival, rng, done, size)
+            services = self._draw(self.service, rng, done, size)
+            size = min(gaps.size, services.size)
+            if size == 0:
+                return
+            gaps, services = gaps[:size], services[:size]
+
+            x = np.empty(size)
+            x[0] = s_prev - gaps[0]
+            np.subtract(services[:-1], gaps[1:], out=x[1:])
+            if done == 0:
+                x[0] = 0.0  # the first customer finds the system empty
+            cum = np.cumsum(x)
+            wq = cum - np.minimum(np.minimum.accumulate(cum), -w_prev)
+
+            yield gaps, services, wq
+            w_prev, s_prev = float(wq[-1]), float(services[-1])
+            done += size
+
+    def sample_wq(self, n: int, seed=None, chunk_size: int = 1_000_000) -> np.ndarray:
+        """Waiting times in queue of the first n customers (system starts empty)."""
+        return np.concatenate([wq for _, _, wq in self._chunks(n, seed, chunk_size)])
+
+    def run(self, n: int, warmup: int = 0, seed=None, chunk_size: int = 1_000_000) -> dict:
+        """
+        Simulate n customers in chunks and summarize them, discarding the first `warmup`.
+
+        Args:
+            n: customers to simulate.
+            warmup: initial customers excluded from the statistics.
+            seed: seed or SeedSequence for numpy.random.default_rng.
+            chunk_size: customers generated per vectorized chunk (bounds memory).
+        Returns:
+            dict with keys 'p0', 'lq', 'l', 'wq', 'w', 'lamda', 'n' like
+            QueueSimulator.run; lq and l follow from Little's Law, p0 from the
+            fraction of time the server is idle.
+        """
+        if not (isinstance(warmup, int) and 0 <= warmup < n):
+            raise ValueError("need integers 0 <= warmup < n")
+
+        count, sum_wq, sum_s, span = 0, 0.0, 0.0, 0.0
+        seen = 0
+        for gaps, services, wq in self._chunks(n, seed, chunk_size):
+            skip = min(max(warmup - seen, 0), wq.size)
+            seen += wq.size
+            count += wq.size - skip
+            sum_wq += float(wq[skip:].sum())
+            sum_s += float(services[skip:].sum())
+            span += float(gaps[skip:].sum())
+        if count == 0:
+            raise ValueError("trace is shorter than the warmup period")
+
+        wq_mean = sum_wq / count
+        w_mean = wq_mean + sum_s / count
+        lamda = count / span if span > 0 else float("nan")
+        return {
+            'p0': 1.0 - sum_s / span if span > 0 else float("nan"),
+            'lq': lamda * wq_mean,
+            'l': lamda * w_mean,
+            'wq': wq_mean,
+            'w': w_mean,
+            'lamda': lamda,
+            'n': count,
+        }
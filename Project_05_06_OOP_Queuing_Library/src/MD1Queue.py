@@ -6,8 +6,10 @@ from BaseQueue import BaseQueue
 class MD1Queue(BaseQueue):
     """Implements _calc_metrics for M/D/1."""
 
+    __slots__ = ()
+
     def _calc_metrics(self) -> None:
-        if not self.is_valid():
+        if not self._valid():
             self._p0 = math.nan
             self._lq = math.nan
             self._recalc_needed = False
@@ -24,4 +26,8 @@ class MD1Queue(BaseQueue):
         self._p0 = 1 - rho
         # M/D/1 queue length in line: exactly half of MM1 with same ρ
         self._lq = (rho * rho) / (2 * (1 - rho))
+        # sensitivities: half of the M/M/1 ones, ∂Lq/∂ρ = ρ(2 - ρ) / (2(1 - ρ)^2)
+        dlq_drho = rho * (2 - rho) / (2 * (1 - rho) ** 2)
+        self._dlq_dlamda = dlq_drho / self.mu
+        self._dlq_dmu = -dlq_drho * rho / self.mu
         self._recalc_needed = False
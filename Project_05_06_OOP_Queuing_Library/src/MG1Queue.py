@@ -10,6 +10,8 @@ class MG1Queue(BaseQueue):
         P0 = 1 − ρ.
     """
 
+    __slots__ = ("_sigma",)
+
     def __init__(self, lamda, mu, sigma):
         self._sigma = math.nan
         self.sigma = sigma  # use setter to validate; sets _recalc_needed
@@ -28,8 +30,9 @@ class MG1Queue(BaseQueue):
         """
         Feasibility for M/G/1 uses only λ and μ (ρ = λ/μ < 1).
         σ is irrelevant for stability; this matches lecture tests.
+        Trusted queues (fully valid) skip the check, as in _valid().
         """
-        if not super().is_valid():  # only λ, μ
+        if not (self._trusted or super().is_valid()):  # only λ, μ
             return False
         rho = self.lamda / self.mu
         return rho < 1.0
@@ -47,12 +50,13 @@ class MG1Queue(BaseQueue):
         else:
             self._sigma = math.nan
         self._recalc_needed = True
+        self._trusted = False
 
     # ----- core calculations -----
 
     def _calc_metrics(self) -> None:
         try:
-            if not self.is_valid():
+            if not self._valid():
                 self._p0 = math.nan
                 self._lq = math.nan
                 return
@@ -68,7 +72,16 @@ class MG1Queue(BaseQueue):
             var_s = sig * sig
 
             self._p0 = 1.0 - rho
-            self._lq = (rho * rho + (lam * lam) * var_s) / (2.0 * (1.0 - rho))
+            num = rho * rho + (lam * lam) * var_s
+            den = 2.0 * (1.0 - rho)
+            self._lq = num / den
+
+            # quotient rule on num/den with ρ = λ/μ
+            mu = self.mu
+            dnum_dlam, dden_dlam = 2.0 * rho / mu + 2.0 * lam * var_s, -2.0 / mu
+            dnum_dmu, dden_dmu = -2.0 * rho * rho / mu, 2.0 * rho / mu
+            self._dlq_dlamda = (dnum_dlam * den - num * dden_dlam) / (den * den)
+            self._dlq_dmu = (dnum_dmu * den - num * dden_dmu) / (den * den)
         finally:
             self._recalc_needed = False
 
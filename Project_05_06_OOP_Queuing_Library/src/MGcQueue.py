@@ -0,0 +1,118 @@
+"""
+MGcQueue class - Approximation for the M/G/c queue.
+Multi-server: Poisson arrivals, general service times, c servers.
+
+"""
+from __future__ import annotations
+
+import math
+from typing import Iterable
+
+from MMcQueue import MMcQueue
+from RunningStats import RunningStats
+
+
+class MGcQueue(MMcQueue):
+    """
+    Allen–Cunneen approximation on top of the Erlang-C path:
+
+        Lq = Lq(M/M/c) · (ca² + cs²) / 2,   ca² = 1 (Poisson),  cs² = (σμ)²
+
+    Exact for c = 1 (Pollaczek–Khinchine) and for exponential service
+    (σ = 1/μ). P0 is reported from the M/M/c normalization.
+    """
+
+    __slots__ = ("_sigma",)
+
+    # -------------------- construction --------------------
+
+    def __init__(self, lamda: float | tuple[float, ...], mu: float, c: int, sigma: float) -> None:
+        """
+        Args:
+            lamda: Aggregate arrival rate (λ).
+            mu: Per-server service rate (μ).
+            c: Number of servers (integer ≥ 1).
+            sigma: Standard deviation of the service time (σ ≥ 0).
+        """
+        self._sigma: float = math.nan
+        self.sigma = sigma  # setter validates
+        super().__init__(lamda, mu, c)
+
+    @classmethod
+    def from_samples(cls, lamda: float, service_times: Iterable, c: int = 1) -> MGcQueue:
+        """
+        Build a queue with μ and σ estimated from a stream of service times.
+
+        Args:
+            lamda: Arrival rate (λ).
+            service_times: iterable of service times or of array chunks of them;
+                consumed once with running (Welford) statistics.
+            c: Number of servers.
+        """
+        stats = RunningStats(service_times)
+        return cls(lamda, cls._rate(stats), c, stats.std)
+
+    @staticmethod
+    def _rate(stats: RunningStats) -> float:
+        """Rate 1/mean of a sample (NaN when it cannot be estimated)."""
+        mean = stats.mean
+        return 1.0 / mean if mean > 0 else math.nan
+
+    # -------------------- validation --------------------
+
+    def is_valid(self) -> bool:
+        """Extend M/M/c validity to include σ ≥ 0."""
+        if not super().is_valid():
+            return False
+        return isinstance(self._sigma, float) and not math.isnan(self._sigma) and self._sigma >= 0
+
+    # -------------------- properties --------------------
+
+    @property
+    def sigma(self) -> float:
+        """Getter for the service-time standard deviation σ."""
+        return self._sigma
+
+    @sigma.setter
+    def sigma(self, value: float) -> None:
+        """Setter for σ; invalid ⇒ NaN; triggers recompute."""
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and value >= 0:
+            self._sigma = float(value)
+        else:
+            self._sigma = math.nan
+        self._recalc_needed = True
+        self._trusted = False
+
+    @property
+    def cs2(self) -> float:
+        """Squared coefficient of variation of service: (σμ)²."""
+        return (self._sigma * self._mu) ** 2
+
+    @property
+    def ca2(self) -> float:
+        """Squared coefficient of variation of interarrival times (1 for Poisson)."""
+        return 1.0
+
+    # -------------------- metrics --------------------
+
+    def _dca2_dlamda(self) -> float:
+        """∂ca²/∂λ (0 for Poisson arrivals)."""
+        return 0.0
+
+    def _calc_metrics(self) -> None:
+        """Erlang-C Lq and P0, with Lq (and its sensitivities) scaled by f = (ca² + cs²)/2."""
+        super()._calc_metrics()
+        if math.isfinite(self._lq):
+            f = (self.ca2 + self.cs2) / 2.0
+            lq_mmc = self._lq
+            self._lq = lq_mmc * f
+            # product rule: ∂f/∂λ = ½ ∂ca²/∂λ,  ∂f/∂μ = σ²μ
+            self._dlq_dlamda = self._dlq_dlamda * f + lq_mmc * self._dca2_dlamda() / 2.0
+            self._dlq_dmu = self._dlq_dmu * f + lq_mmc * self._sigma * self._sigma * self._mu
+            self._delta_lq_c *= f
+
+    # -------------------- representation --------------------
+
+    def __str__(self) -> str:
+        """Append sigma to MMcQueue string."""
+        return super().__str__() + f"\n\tsigma: {self.sigma}"
@@ -12,18 +12,21 @@ from BaseQueue import BaseQueue
 class MM1Queue(BaseQueue):
     """Implements _calc_metrics() for M/M/1."""
 
+    __slots__ = ()
+
     def _calc_metrics(self) -> None:
         """
         M/M/1 formulas (feasible):
             ρ = λ/μ
             P0 = 1 - ρ
             Lq = ρ^2 / (1 - ρ)
+            ∂Lq/∂ρ = ρ(2 - ρ) / (1 - ρ)^2,  ∂ρ/∂λ = 1/μ,  ∂ρ/∂μ = -ρ/μ
 
         Infeasible (ρ >= 1): P0 = +inf, Lq = +inf.
         Invalid: P0 = NaN, Lq = NaN.
         """
         try:
-            if not self.is_valid():
+            if not self._valid():
                 self._p0 = math.nan
                 self._lq = math.nan
                 return
@@ -36,6 +39,9 @@ class MM1Queue(BaseQueue):
             rho = self.ro
             self._p0 = 1.0 - rho
             self._lq = (rho * rho) / (1.0 - rho)
+            dlq_drho = rho * (2.0 - rho) / ((1.0 - rho) ** 2)
+            self._dlq_dlamda = dlq_drho / self._mu
+            self._dlq_dmu = -dlq_drho * rho / self._mu
         finally:
             # lecture pattern: ensure the recompute flag is always cleared
             self._recalc_needed = False
@@ -1,7 +1,12 @@
 # Project6/MMcPriorityQueue.py
 import math
+from itertools import accumulate
+
+import numpy as np
+
 from BaseQueue import BaseQueue
 from MMcQueue import MMcQueue
+from erlang import erlang_c
 
 
 class MMcPriorityQueue(MMcQueue):
@@ -21,6 +26,8 @@ class MMcPriorityQueue(MMcQueue):
       - Getter-style access (use properties), no direct private attr pokes.
     """
 
+    __slots__ = ("_lamda_k", "_cum_lamda_k")
+
     # -------------------------
     # construction (same call signature)
     # -------------------------
@@ -50,10 +57,14 @@ class MMcPriorityQueue(MMcQueue):
         """
         lam_agg = math.nan
         keep_tuple = None
+        cum = None
 
         if isinstance(value, tuple):
             # Validate tuple; align with tests: sum == 0 => treat as invalid for priority case.
             try:
+                # same component rule as is_valid, checked once here
+                if not all(isinstance(x, (int, float)) and not isinstance(x, bool) for x in value):
+                    raise ValueError
                 parts = [float(x) for x in value]
                 if any(math.isnan(x) or x < 0 for x in parts):
                     raise ValueError
@@ -62,9 +73,12 @@ class MMcPriorityQueue(MMcQueue):
                     raise ValueError
                 lam_agg = total
                 keep_tuple = tuple(value)
+                # prefix sums Σ_{j<=k} λ_j for k = 0..K, shared by every per-class getter
+                cum = tuple(accumulate(parts, initial=0.0))
             except Exception:
                 lam_agg = math.nan
                 keep_tuple = None
+                cum = None
         else:
             # Scalar path – defer to parent semantics, but do minimal sanitation.
             try:
@@ -77,6 +91,7 @@ class MMcPriorityQueue(MMcQueue):
         # Store (or clear) the tuple first.
         # (Use a normal attribute so tests can access via property.)
         self._lamda_k = keep_tuple
+        self._cum_lamda_k = cum
 
         # Delegate to parent's property setter to preserve lazy computation.
         # IMPORTANT: property.__set__(instance, value) takes exactly (self, value).
@@ -111,19 +126,15 @@ class MMcPriorityQueue(MMcQueue):
     def is_valid(self) -> bool:
         """
         Valid iff parent is valid AND (if lamda_k exists) all components are >= 0.
-        (Note: a tuple that failed validation already forced lamda = NaN above.)
+        The lamda setter only keeps tuples whose components passed that check
+        (a tuple that failed validation already forced lamda = NaN above), so
+        this is O(1) rather than a scan over the classes on every getter call.
         """
-        if not super().is_valid():
-            return False
-        t = self.lamda_k
-        if t is None:
-            # Scalar lamda case is allowed; no tuple-level constraint.
-            return True
-        return all(isinstance(x, (int, float)) and not isinstance(x, bool) and x >= 0 for x in t)
+        return super().is_valid()
 
     def is_feasible(self) -> bool:
         """Feasible iff parent utilization ρ < 1."""
-        if not self.is_valid():
+        if not self._valid():
             return False
         return self.ro < 1.0
 
@@ -137,7 +148,7 @@ class MMcPriorityQueue(MMcQueue):
 
     def get_wq_k(self, k: int) -> float:
         # Guard rails
-        if not self.is_valid():
+        if not self._valid():
             return math.nan
         if not self.is_feasible():
             return math.inf
@@ -155,8 +166,8 @@ class MMcPriorityQueue(MMcQueue):
 
         # cumulative utilizations (non-preemptive priority approximation)
         rho_total = self.lamda / denom
-        cum_rho_km1 = sum(self.get_lamda_k(i + 1) for i in range(k - 1)) / denom
-        cum_rho_k = sum(self.get_lamda_k(i + 1) for i in range(k)) / denom
+        cum_rho_km1 = self._cum_lamda_k[k - 1] / denom
+        cum_rho_k = self._cum_lamda_k[k] / denom
 
         if any(math.isnan(x) for x in (rho_total, cum_rho_km1, cum_rho_k)):
             return math.nan
@@ -194,7 +205,7 @@ class MMcPriorityQueue(MMcQueue):
         Barrier/availability factor used by the tests:
             B_k = 1 - ( sum_{j=1..k} λ_j ) / (c μ)
         """
-        if not self.is_valid():
+        if not self._valid():
             return math.nan
         if not self.is_feasible():
             return math.inf
@@ -206,5 +217,84 @@ class MMcPriorityQueue(MMcQueue):
         if math.isnan(denom):
             return math.nan
 
-        cum = sum(self.get_lamda_k(i + 1) for i in range(k))
-        return 1.0 - (cum / denom)
+        return 1.0 - (self._cum_lamda_k[k] / denom)
+
+    def class_metrics(self) -> dict:
+        """
+        Every per-class metric in one pass over the cached prefix sums.
+
+        Returns:
+            dict of arrays with one entry per class: 'wqk', 'wk', 'lqk', 'lk', 'bk'
+            (same values as get_wq_k, get_w_k, get_lq_k, get_l_k, get_b_k) and
+            'dwqk_dmu' (∂Wq_k/∂μ). Entries are NaN when the queue is invalid and
+            +inf when infeasible.
+        """
+        t = self.lamda_k
+        size = len(t) if t else 0
+        keys = ('wqk', 'wk', 'lqk', 'lk', 'bk', 'dwqk_dmu')
+        if not self._valid() or not t:
+            return {key: np.full(size, math.nan) for key in keys}
+        if not self.is_feasible():
+            return {key: np.full(size, math.inf) for key in keys}
+
+        lam_k = np.array(t, dtype=float)
+        cum = np.array(self._cum_lamda_k) / self._denom()
+        wq, rho, mu = self.wq, self.ro, self.mu
+        result = self._class_vectors(lam_k, cum, wq, rho, mu)
+
+        # Wq_k = Wq · (1-ρ)/(a b) and ρ, a, b all move with 1/μ:
+        # ∂ln Wq_k/∂μ = ∂ln Wq/∂μ + (ρ/μ)/(1-ρ) − (σ_{k-1}/μ)/a − (σ_k/μ)/b
+        a, b = 1.0 - cum[:-1], 1.0 - cum[1:]
+        dlog = self.dwq_dmu / wq + (rho / mu) / (1.0 - rho) - cum[:-1] / (mu * a) - cum[1:] / (mu * b)
+        result['dwqk_dmu'] = result['wqk'] * dlog
+        return result
+
+    def evaluate_scenarios(self, lamda_k) -> dict:
+        """
+        Per-class metrics for many class-rate mixes on this queue's μ and c.
+
+        Each row of lamda_k is evaluated as if assigned to lamda_k, but all rows
+        share one vectorized Erlang-C evaluation and one prefix-sum pass, with
+        no per-row tuple validation or object state changes.
+
+        Args:
+            lamda_k: array-like of shape (S, K): S scenarios of K class rates.
+        Returns:
+            dict of (S, K) arrays 'wqk', 'wk', 'lqk', 'lk', 'bk'. Rows are NaN
+            where the scenario (or μ, c) is invalid and +inf where infeasible.
+        """
+        lam_k = np.asarray(lamda_k, dtype=float)
+        if lam_k.ndim != 2:
+            raise ValueError("lamda_k must be a 2-D array (scenarios × classes)")
+
+        mu, c = self.mu, self.c
+        denom = self._denom()
+        lam = lam_k.sum(axis=1)
+        valid = np.all(np.isfinite(lam_k) & (lam_k >= 0), axis=1) & (lam > 0)
+        if math.isnan(denom):  # invalid μ or c
+            valid[:] = False
+        feasible = valid & (lam < denom)
+
+        with np.errstate(all='ignore'):
+            rho = lam / denom
+            _, pw = erlang_c(lam / mu, c)
+            wq = pw / (denom - lam)
+            cum = np.concatenate((np.zeros((lam_k.shape[0], 1)), np.cumsum(lam_k, axis=1)), axis=1) / denom
+            result = self._class_vectors(lam_k, cum, wq[:, None], rho[:, None], mu)
+
+        rows_valid, rows_feasible = valid[:, None], feasible[:, None]
+        return {key: np.where(~rows_valid, math.nan, np.where(~rows_feasible, math.inf, value))
+                for key, value in result.items()}
+
+    @staticmethod
+    def _class_vectors(lam_k, cum_rho, wq, rho, mu) -> dict:
+        """
+        Per-class metrics from class rates (..., K), cumulative utilizations
+        (..., K+1) and the aggregate Wq and ρ (broadcast over the class axis).
+        """
+        a = 1.0 - cum_rho[..., :-1]
+        b = 1.0 - cum_rho[..., 1:]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            wqk = np.where((a > 0) & (b > 0), wq * (1.0 - rho) / (a * b), math.inf)
+        wk = wqk + 1.0 / mu
+        return {'wqk': wqk, 'wk': wk, 'lqk': lam_k * wqk, 'lk': lam_k * wk, 'bk': b}
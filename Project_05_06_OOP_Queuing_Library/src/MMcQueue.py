@@ -6,11 +6,23 @@ Multi-server: Poisson arrivals, Exponential service, c servers.
 from __future__ import annotations
 
 import math
+import sys
+
 from BaseQueue import BaseQueue
 
 
 class MMcQueue(BaseQueue):
-    """Erlang-C implementation for M/M/c."""
+    """
+    Erlang-C implementation for M/M/c.
+
+    Keeps only the last Erlang-B value B(a, n) and its n for the current
+    offered load a, so stepping c up or down walks the recursion from there
+    (O(Δc), constant memory per queue). A change of λ or μ restarts it in
+    O(c) without factorials or powers of a, and so does a step down that is
+    longer than c or starts from a subnormal B.
+    """
+
+    __slots__ = ("_c", "_erlang_a", "_erlang_n", "_erlang_b", "_delta_lq_c")
 
     # -------------------- construction --------------------
 
@@ -22,6 +34,10 @@ class MMcQueue(BaseQueue):
             c: Number of servers (integer ≥ 1).
         """
         self._c: int | float = math.nan  # temp to avoid attribute errors
+        self._erlang_a: float = math.nan  # offered load of the cached B(a, n) below
+        self._erlang_n: int = 0
+        self._erlang_b: float = 1.0
+        self._delta_lq_c: float = math.nan
 
         if isinstance(c, (int, float)) and c >= 1 and c == int(c):
             self._c = int(c)
@@ -40,7 +56,7 @@ class MMcQueue(BaseQueue):
 
     def is_feasible(self) -> bool:
         """True iff ρ = λ/(c μ) < 1."""
-        if not self.is_valid():
+        if not self._valid():
             return False
         return self.ro < 1
 
@@ -49,7 +65,7 @@ class MMcQueue(BaseQueue):
     @property
     def ro(self) -> float:
         """Per-server utilization: ρ = λ/(c μ)."""
-        if not self.is_valid():
+        if not self._valid():
             return math.nan
         return self._lamda / (self._c * self._mu)
 
@@ -58,6 +74,12 @@ class MMcQueue(BaseQueue):
         """Getter for number of servers."""
         return self._c
 
+    @property
+    def delta_lq_c(self) -> float:
+        """Discrete sensitivity to servers: Lq(c + 1) − Lq(c) (NaN if invalid, +inf if infeasible)."""
+        lq = self.lq
+        return self._delta_lq_c if math.isfinite(lq) else lq
+
     @c.setter
     def c(self, value: int | float) -> None:
         """Setter for number of servers; invalid ⇒ NaN; triggers recompute."""
@@ -66,24 +88,61 @@ class MMcQueue(BaseQueue):
         else:
             self._c = math.nan
         self._recalc_needed = True
+        self._trusted = False
 
     # -------------------- metrics --------------------
 
+    def _erlang_b_c(self) -> float:
+        """Erlang-B B(a, c), walking the cached B(a, n) to n = c (restarting for a new a)."""
+        a, c = self._lamda / self._mu, self._c
+        n, b = self._erlang_n, self._erlang_b
+        # step down only from a normal B and when it is shorter than restarting:
+        # a subnormal B has lost its digits, which the inverse step would spread
+        if a != self._erlang_a or (c < n and (b < sys.float_info.min or n - c > c)):
+            n, b = 0, 1.0
+        while n < c:
+            n += 1
+            b = a * b / (n + a * b)
+        while n > c:  # inverse step B(a, n-1) = n·B / (a(1 − B))
+            b = n * b / (a * (1.0 - b))
+            n -= 1
+        self._erlang_a, self._erlang_n, self._erlang_b = a, n, b
+        return b
+
+    @staticmethod
+    def _erlang_lq(a: float, c: int, b: float) -> float:
+        """Lq = C(a, c) · a/(c − a) from the Erlang-B value b = B(a, c), with C = cB / (c − a + aB)."""
+        return c * b / (c - a + a * b) * a / (c - a)
+
+    @staticmethod
+    def _erlang_lq_derivative(a: float, c: int, b: float) -> float:
+        """dLq/da for M/M/c, from b = B(a, c) (requires a < c)."""
+        db = b * (c / a - 1.0 + b)
+        d = c - a + a * b
+        dd = -1.0 + b + a * db
+        erlang_c = c * b / d
+        derlang_c = c * (db * d - b * dd) / (d * d)
+        return derlang_c * a / (c - a) + erlang_c * c / ((c - a) ** 2)
+
     def _calc_metrics(self) -> None:
         """
-        Erlang-C normalization and Lq:
+        Erlang-C normalization and Lq via the Erlang-B recursion:
 
             a = λ/μ
             ρ = a/c
-            P0 = 1 / [ Σ_{n=0}^{c-1} a^n/n!  +  (a^c / (c!(1-ρ))) ]
-            P_wait = (a^c / (c!(1-ρ))) * P0
+            B(a, 0) = 1,  B(a, n) = a·B(a, n-1) / (n + a·B(a, n-1))
+            P_wait = B / (1 - ρ(1 - B))
+            P0 = B · c!/a^c / (1 + Bρ/(1-ρ))     (in log space)
             Lq = P_wait * ρ / (1-ρ)
 
+        Sensitivities use ∂B/∂a = B(c/a − 1 + B) with a = λ/μ, and Lq(c + 1)
+        from one more recursion step.
+
         Infeasible (ρ ≥ 1): P0 = +inf, Lq = +inf.
         Invalid: P0 = NaN, Lq = NaN.
         """
         try:
-            if not self.is_valid():
+            if not self._valid():
                 self._p0 = math.nan
                 self._lq = math.nan
                 return
@@ -97,12 +156,20 @@ class MMcQueue(BaseQueue):
             a = lam / mu
             rho = a / c
 
-            series = sum((a ** n) / math.factorial(n) for n in range(c))
-            tail = (a ** c) / (math.factorial(c) * (1.0 - rho))
-            self._p0 = 1.0 / (series + tail)
-
-            p_wait = ((a ** c) / (math.factorial(c) * (1.0 - rho))) * self._p0
+            b = self._erlang_b_c()
+            p_wait = b / (1.0 - rho * (1.0 - b))
+            if b > 0:
+                log_p0 = math.log(b) + math.lgamma(c + 1) - c * math.log(a) - math.log1p(b * rho / (1.0 - rho))
+                self._p0 = math.exp(log_p0)
+            else:  # B underflows only for a ≪ 1, where the system is almost always empty
+                self._p0 = math.exp(-a)
             self._lq = p_wait * (rho / (1.0 - rho))
+
+            dlq_da = self._erlang_lq_derivative(a, c, b)
+            self._dlq_dlamda = dlq_da / mu
+            self._dlq_dmu = -dlq_da * a / mu
+            b_next = a * b / (c + 1 + a * b)
+            self._delta_lq_c = self._erlang_lq(a, c + 1, b_next) - self._lq
         finally:
             self._recalc_needed = False
 
@@ -0,0 +1,286 @@
+"""
+QueueArray class - Struct-of-arrays container for many M/G/c-style queues.
+Holds λ, μ, c and σ for N queues in four float64 arrays plus a one-byte model
+code (33 bytes per queue), evaluates every metric with whole-array NumPy
+operations, and serializes to a flat columnar byte layout.
+
+"""
+from __future__ import annotations
+
+import math
+import struct
+from typing import Iterable
+
+import numpy as np
+
+from BaseQueue import BaseQueue
+from GGcQueue import GGcQueue
+from MD1Queue import MD1Queue
+from MGcQueue import MGcQueue
+from MG1Queue import MG1Queue
+from MM1Queue import MM1Queue
+from MMcPriorityQueue import MMcPriorityQueue
+from MMcQueue import MMcQueue
+from erlang import erlang_c, erlang_c_lq
+
+
+class QueueArray:
+    """
+    N queues evaluated together.
+
+    Each row is an M/G/c queue with arrival rate λ, per-server service rate μ,
+    c servers and service-time standard deviation σ. Rows whose model is
+    'mm1' or 'mmc' have exponential service (σ = 1/μ tracking μ) and ignore
+    the σ column; every other row needs a finite σ ≥ 0. Lq scales the Erlang-C result by the
+    service-time variability:
+
+        Lq = Lq(M/M/c) · (1 + cs²) / 2,   cs² = (σμ)²  (1 if exponential)
+
+    which is exact for M/M/c, M/D/1 and M/G/1 (Pollaczek–Khinchine) and the
+    usual approximation for M/G/c otherwise.
+
+    Metrics follow the BaseQueue conventions row by row: NaN where the inputs
+    are invalid, +inf where ρ ≥ 1. The same analytic sensitivities as the
+    queue classes (dlq_dlamda, dlq_dmu, dwq_dlamda, dwq_dmu, delta_lq_c) are
+    available as arrays.
+
+    The model column records which queue class each row came from (an index
+    into MODELS) so that to_queues() rebuilds the same objects.
+    """
+
+    __slots__ = ("lamda", "mu", "c", "sigma", "model")
+
+    MODELS = ('mm1', 'md1', 'mg1', 'mmc', 'mgc')
+    _CODES = {MM1Queue: 0, MD1Queue: 1, MG1Queue: 2, MMcQueue: 3, MGcQueue: 4}
+    _EXPONENTIAL = (0, 3)
+
+    # header: magic, format version, reserved, row count
+    _HEADER = struct.Struct("<4sHHQ")
+    _MAGIC = b"QARR"
+    _VERSION = 1
+
+    # -------------------- construction --------------------
+
+    def __init__(self, lamda, mu, c=1, sigma=None, model=None) -> None:
+        """
+        Args:
+            lamda: Arrival rates (λ), shape (N,).
+            mu: Per-server service rates (μ), scalar or shape (N,).
+            c: Number of servers, scalar or shape (N,).
+            sigma: Service-time standard deviations, scalar or shape (N,);
+                ignored (stored as NaN) on exponential rows.
+            model: Model codes (indices into MODELS), scalar or shape (N,);
+                None ⇒ 'mmc' when sigma is None, else 'mgc'.
+        """
+        lamda = np.asarray(lamda, dtype=float)
+        if lamda.ndim != 1:
+            raise ValueError("lamda must be a 1-D array")
+        shape = lamda.shape
+        self.lamda: np.ndarray = lamda.copy()
+        self.mu: np.ndarray = np.broadcast_to(np.asarray(mu, dtype=float), shape).copy()
+        self.c: np.ndarray = np.broadcast_to(np.asarray(c, dtype=float), shape).copy()
+        if model is None:
+            model = self.MODELS.index('mmc' if sigma is None else 'mgc')
+        self.model: np.ndarray = np.broadcast_to(np.asarray(model, dtype=np.uint8), shape).copy()
+        if np.any(self.model >= len(self.MODELS)):
+            raise ValueError(f"model codes must index {self.MODELS}")
+        sigma = math.nan if sigma is None else sigma
+        sigma = np.broadcast_to(np.asarray(sigma, dtype=float), shape)
+        self.sigma: np.ndarray = np.where(self._exponential(), math.nan, sigma)
+
+    @classmethod
+    def from_queues(cls, queues: Iterable[BaseQueue]) -> QueueArray:
+        """Pack MM1/MD1/MG1/MMc/MGc queue objects into one array container."""
+        rows = []
+        for q in queues:
+            if isinstance(q, GGcQueue):
+                raise TypeError("QueueArray only holds Poisson-arrival queues")
+            if isinstance(q, MMcPriorityQueue):
+                raise TypeError("QueueArray cannot hold per-class rates of an MMcPriorityQueue")
+            c = q.c if isinstance(q, MMcQueue) else 1
+            if isinstance(q, MD1Queue):
+                sigma = 0.0
+            elif isinstance(q, (MG1Queue, MGcQueue)):
+                sigma = q.sigma
+            else:
+                sigma = math.nan  # exponential
+            # most specific registered class in the MRO (MGcQueue is an MMcQueue)
+            code = next((cls._CODES[k] for k in type(q).__mro__ if k in cls._CODES), None)
+            if code is None:
+                raise TypeError(f"QueueArray cannot hold {type(q).__name__}")
+            rows.append((q.lamda, q.mu, c, sigma, code))
+        data = np.array(rows, dtype=float).reshape(-1, 5)
+        return cls(data[:, 0], data[:, 1], data[:, 2], data[:, 3], data[:, 4])
+
+    def to_queues(self) -> list[BaseQueue]:
+        """Rebuild one queue object per row, using the model column."""
+        queues = []
+        for lam, mu, c, sigma, code in zip(self.lamda.tolist(), self.mu.tolist(), self.c.tolist(),
+                                           self.sigma.tolist(), self.model.tolist()):
+            c = int(c) if math.isfinite(c) and c == int(c) else c
+            name = self.MODELS[code]
+            if name == 'mm1':
+                queues.append(MM1Queue(lam, mu))
+            elif name == 'md1':
+                queues.append(MD1Queue(lam, mu))
+            elif name == 'mg1':
+                queues.append(MG1Queue(lam, mu, sigma))
+            elif name == 'mmc':
+                queues.append(MMcQueue(lam, mu, c))
+            else:
+                queues.append(MGcQueue(lam, mu, c, sigma))
+        return queues
+
+    # -------------------- serialization --------------------
+
+    def to_bytes(self) -> bytes:
+        """
+        Flat columnar encoding: a 16-byte header followed by the λ, μ, c and σ
+        columns (little-endian float64) and the uint8 model column.
+        """
+        header = self._HEADER.pack(self._MAGIC, self._VERSION, 0, len(self))
+        columns = [np.ascontiguousarray(col, dtype="<f8") for col in (self.lamda, self.mu, self.c, self.sigma)]
+        return b"".join([header, *(col.tobytes() for col in columns), self.model.tobytes()])
+
+    @classmethod
+    def from_bytes(cls, buffer) -> QueueArray:
+        """
+        Decode to_bytes() output without copying: the columns are read-only
+        NumPy views into `buffer` (bytes, bytearray, memoryview or mmap).
+        """
+        view = memoryview(buffer)
+        size = cls._HEADER.size
+        if view.nbytes < size:
+            raise ValueError("buffer is too short for a QueueArray header")
+        magic, version, _, n = cls._HEADER.unpack_from(view)
+        if magic != cls._MAGIC or version != cls._VERSION:
+            raise ValueError("buffer does not hold a QueueArray (bad magic or version)")
+        if view.nbytes != size + 33 * n:
+            raise ValueError("buffer length does not match the row count")
+
+        obj = cls.__new__(cls)
+        for i, name in enumerate(("lamda", "mu", "c", "sigma")):
+            setattr(obj, name, np.frombuffer(view, dtype="<f8", count=n, offset=size + 8 * n * i))
+        obj.model = np.frombuffer(view, dtype=np.uint8, count=n, offset=size + 32 * n)
+        return obj
+
+    def __len__(self) -> int:
+        return self.lamda.size
+
+    def _exponential(self) -> np.ndarray:
+        """Row-wise: exponential service (model 'mm1' or 'mmc')."""
+        return np.isin(self.model, self._EXPONENTIAL)
+
+    def _cs2(self) -> np.ndarray:
+        """Squared coefficient of variation of service (1 for exponential rows)."""
+        return np.where(self._exponential(), 1.0, (self.sigma * self.mu) ** 2)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the parameter and model arrays."""
+        return self.lamda.nbytes + self.mu.nbytes + self.c.nbytes + self.sigma.nbytes + self.model.nbytes
+
+    # -------------------- validation / feasibility --------------------
+
+    def is_valid(self) -> np.ndarray:
+        """Row-wise: λ>0, μ>0, c integer ≥1 and, unless exponential, σ≥0 finite."""
+        lam, mu, c, sigma = self.lamda, self.mu, self.c, self.sigma
+        return ((np.isfinite(lam) & (lam > 0)) & (np.isfinite(mu) & (mu > 0))
+                & (np.isfinite(c) & (c >= 1) & (c == np.floor(c)))
+                & (self._exponential() | (np.isfinite(sigma) & (sigma >= 0))))
+
+    def is_feasible(self) -> np.ndarray:
+        """Row-wise: valid and ρ = λ/(c μ) < 1."""
+        with np.errstate(invalid='ignore'):
+            return self.is_valid() & (self.ro < 1)
+
+    def _masked(self, values: np.ndarray) -> np.ndarray:
+        """NaN where invalid, +inf where infeasible."""
+        valid = self.is_valid()
+        with np.errstate(invalid='ignore'):
+            feasible = valid & (self.lamda < self.c * self.mu)
+        return np.where(~valid, math.nan, np.where(~feasible, math.inf, values))
+
+    # -------------------- properties --------------------
+
+    @property
+    def ro(self) -> np.ndarray:
+        """Per-server utilization: ρ = λ/(c μ); NaN where invalid."""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(self.is_valid(), self.lamda / (self.c * self.mu), math.nan)
+
+    @property
+    def p0(self) -> np.ndarray:
+        """Probability of an empty system (Erlang-C normalization)."""
+        with np.errstate(all='ignore'):
+            p0, _ = erlang_c(self.lamda / self.mu, self.c)
+        return self._masked(p0)
+
+    @property
+    def lq(self) -> np.ndarray:
+        """Average number in queue."""
+        with np.errstate(all='ignore'):
+            rho = self.lamda / (self.c * self.mu)
+            _, pw = erlang_c(self.lamda / self.mu, self.c)
+            lq = pw * rho / (1 - rho) * (1 + self._cs2()) / 2
+        return self._masked(lq)
+
+    @property
+    def l(self) -> np.ndarray:
+        """Average number in system: L = Lq + λ/μ."""
+        with np.errstate(all='ignore'):
+            return self.lq + self.lamda / self.mu
+
+    @property
+    def wq(self) -> np.ndarray:
+        """Average waiting time in queue: Wq = Lq / λ."""
+        with np.errstate(all='ignore'):
+            return self.lq / self.lamda
+
+    @property
+    def w(self) -> np.ndarray:
+        """Average time in system: W = Wq + 1/μ."""
+        with np.errstate(all='ignore'):
+            return self.wq + 1 / self.mu
+
+    # -------------------- sensitivities --------------------
+
+    def _sensitivities(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Unmasked (lq, ∂Lq/∂λ, ∂Lq/∂μ, ΔLq for c + 1), including the (1 + cs²)/2 factor."""
+        lam, mu, sigma = self.lamda, self.mu, self.sigma
+        with np.errstate(all='ignore'):
+            a = lam / mu
+            lq, dlq_da, delta_c = erlang_c_lq(a, self.c)
+            f = (1 + self._cs2()) / 2
+            df_dmu = np.where(self._exponential(), 0.0, sigma * sigma * mu)  # cs² is fixed for exponential rows
+            dlq_dlamda = dlq_da / mu * f
+            dlq_dmu = -dlq_da * a / mu * f + lq * df_dmu
+        return lq * f, dlq_dlamda, dlq_dmu, delta_c * f
+
+    @property
+    def dlq_dlamda(self) -> np.ndarray:
+        """∂Lq/∂λ per queue."""
+        return self._masked(self._sensitivities()[1])
+
+    @property
+    def dlq_dmu(self) -> np.ndarray:
+        """∂Lq/∂μ per queue."""
+        return self._masked(self._sensitivities()[2])
+
+    @property
+    def dwq_dlamda(self) -> np.ndarray:
+        """∂Wq/∂λ = (∂Lq/∂λ − Wq) / λ per queue."""
+        lq, dlq_dlamda, _, _ = self._sensitivities()
+        with np.errstate(all='ignore'):
+            return self._masked((dlq_dlamda - lq / self.lamda) / self.lamda)
+
+    @property
+    def dwq_dmu(self) -> np.ndarray:
+        """∂Wq/∂μ = (∂Lq/∂μ) / λ per queue."""
+        with np.errstate(all='ignore'):
+            return self._masked(self._sensitivities()[2] / self.lamda)
+
+    @property
+    def delta_lq_c(self) -> np.ndarray:
+        """Lq(c + 1) − Lq(c) per queue."""
+        return self._masked(self._sensitivities()[3])
@@ -0,0 +1,192 @@
+"""
+QueueEstimator class - Streaming estimation of queue parameters and observed
+metrics from arrival/departure logs, for comparison with the analytic queues.
+
+"""
+from __future__ import annotations
+
+import math
+from typing import Iterable
+
+import numpy as np
+
+from BaseQueue import BaseQueue
+from GGcQueue import GGcQueue
+from MG1Queue import MG1Queue
+from MGcQueue import MGcQueue
+from MM1Queue import MM1Queue
+from MMcQueue import MMcQueue
+from RunningStats import RunningStats
+
+
+class QueueEstimator:
+    """
+    Consumes FIFO customer records in arrival order and keeps running
+    statistics only (O(1) memory regardless of log size):
+
+        interarrival times → λ, σa      service times → μ, σ
+        start − arrival    → Wq         departure − arrival → W
+
+    Lq and L follow from Little's Law. When service start times are not
+    logged, a single FIFO server is assumed: start = max(arrival, previous
+    departure).
+    """
+
+    MODELS = ('mm', 'mg', 'gg')
+
+    # -------------------- construction --------------------
+
+    def __init__(self, c: int = 1) -> None:
+        """
+        Args:
+            c: Number of servers of the observed system (integer ≥ 1).
+        """
+        if not (isinstance(c, int) and c >= 1):
+            raise ValueError("c must be an integer >= 1")
+        self.c = c
+        self._gaps = RunningStats()
+        self._service = RunningStats()
+        self._wait = RunningStats()
+        self._sojourn = RunningStats()
+        self._last_arrival = math.nan
+        self._last_departure = -math.inf
+
+    # -------------------- updates --------------------
+
+    def update(self, arrival, departure, start=None) -> None:
+        """
+        Add one customer or a chunk of customers.
+
+        Args:
+            arrival: arrival timestamp(s), non-decreasing across calls.
+            departure: departure timestamp(s).
+            start: service start timestamp(s); required when c > 1.
+        """
+        arrival = np.atleast_1d(np.asarray(arrival, dtype=float))
+        departure = np.atleast_1d(np.asarray(departure, dtype=float))
+        if arrival.shape != departure.shape or arrival.ndim != 1:
+            raise ValueError("arrival and departure must have the same 1-D shape")
+        if arrival.size == 0:
+            return
+
+        if start is None:
+            if self.c != 1:
+                raise ValueError("start times are required for multi-server logs")
+            # FIFO single server: service starts when the previous customer leaves
+            previous = np.concatenate(([self._last_departure], departure[:-1]))
+            start = np.maximum(arrival, previous)
+        else:
+            start = np.atleast_1d(np.asarray(start, dtype=float))
+            if start.shape != arrival.shape:
+                raise ValueError("start must have the same shape as arrival")
+
+        gaps = np.diff(arrival, prepend=self._last_arrival)
+        if math.isnan(self._last_arrival):
+            gaps = gaps[1:]  # the very first arrival has no gap
+        self._gaps.update(gaps)
+        self._service.update(departure - start)
+        self._wait.update(start - arrival)
+        self._sojourn.update(departure - arrival)
+        self._last_arrival = float(arrival[-1])
+        self._last_departure = float(departure[-1])
+
+    def consume(self, records: Iterable) -> QueueEstimator:
+        """
+        Feed an iterator of (arrival, departure) or (arrival, departure, start)
+        records, where each field is a scalar or an array chunk.
+        """
+        for record in records:
+            self.update(*record)
+        return self
+
+    # -------------------- estimates --------------------
+
+    @property
+    def n(self) -> int:
+        """Customers seen."""
+        return self._sojourn.n
+
+    @property
+    def lamda(self) -> float:
+        """Arrival rate λ = 1 / mean interarrival time."""
+        mean = self._gaps.mean
+        return 1.0 / mean if mean > 0 else math.nan
+
+    @property
+    def sigma_a(self) -> float:
+        """Standard deviation of the interarrival time."""
+        return self._gaps.std
+
+    @property
+    def mu(self) -> float:
+        """Per-server service rate μ = 1 / mean service time."""
+        mean = self._service.mean
+        return 1.0 / mean if mean > 0 else math.nan
+
+    @property
+    def sigma(self) -> float:
+        """Standard deviation of the service time."""
+        return self._service.std
+
+    @property
+    def ro(self) -> float:
+        """Estimated per-server utilization λ/(c μ)."""
+        return self.lamda / (self.c * self.mu)
+
+    @property
+    def wq(self) -> float:
+        """Observed mean wait in queue."""
+        return self._wait.mean
+
+    @property
+    def w(self) -> float:
+        """Observed mean time in system."""
+        return self._sojourn.mean
+
+    @property
+    def lq(self) -> float:
+        """Observed mean number in queue (Little's Law: λ·Wq)."""
+        return self.lamda * self.wq
+
+    @property
+    def l(self) -> float:
+        """Observed mean number in system (Little's Law: λ·W)."""
+        return self.lamda * self.w
+
+    # -------------------- models --------------------
+
+    def to_queue(self, model: str = 'mg') -> BaseQueue:
+        """
+        Instantiate the analytic queue matching the estimates.
+
+        Args:
+            model: 'mm' (MM1Queue / MMcQueue), 'mg' (MG1Queue / MGcQueue)
+                or 'gg' (GGcQueue).
+        """
+        if model not in self.MODELS:
+            raise ValueError(f"model must be one of {self.MODELS}")
+        lamda, mu, c = self.lamda, self.mu, self.c
+        if model == 'gg':
+            return GGcQueue(lamda, mu, c, self.sigma, self.sigma_a)
+        if model == 'mg':
+            return MG1Queue(lamda, mu, self.sigma) if c == 1 else MGcQueue(lamda, mu, c, self.sigma)
+        return MM1Queue(lamda, mu) if c == 1 else MMcQueue(lamda, mu, c)
+
+    def compare(self, queue: BaseQueue | None = None, model: str = 'mg') -> dict:
+        """
+        Model vs. observed metrics.
+
+        Args:
+            queue: analytic queue to compare with (default: to_queue(model)).
+            model: model passed to to_queue when queue is None.
+        Returns:
+            dict metric ⇒ {'observed', 'model', 'error'} for 'lq', 'l', 'wq', 'w',
+            where error is (model − observed) / observed.
+        """
+        queue = self.to_queue(model) if queue is None else queue
+        result = {}
+        for name in ('lq', 'l', 'wq', 'w'):
+            observed, predicted = getattr(self, name), getattr(queue, name)
+            error = (predicted - observed) / observed if observed else math.nan
+            result[name] = {'observed': observed, 'model': predicted, 'error': error}
+        return result
@@ -0,0 +1,94 @@
+"""
+QueueFactory class - Registry of queue models and construction from spec dicts,
+validated once at the boundary.
+
+"""
+from __future__ import annotations
+
+import inspect
+
+from BaseQueue import BaseQueue
+from GGcQueue import GGcQueue
+from MD1Queue import MD1Queue
+from MG1Queue import MG1Queue
+from MGcQueue import MGcQueue
+from MM1Queue import MM1Queue
+from MMcPriorityQueue import MMcPriorityQueue
+from MMcQueue import MMcQueue
+
+
+class QueueFactory:
+    """
+    Builds queues from specs such as {'model': 'mmc', 'lamda': 40, 'mu': 25, 'c': 2}.
+
+    The spec is checked against the registered class's constructor and the
+    queue's is_valid() once; invalid specs raise ValueError instead of
+    producing a NaN queue. Queues returned by create() are trusted: metric
+    reads skip the is_valid() chain until a setter changes a parameter.
+    """
+
+    _registry: dict[str, type] = {
+        'mm1': MM1Queue,
+        'md1': MD1Queue,
+        'mg1': MG1Queue,
+        'mmc': MMcQueue,
+        'mgc': MGcQueue,
+        'ggc': GGcQueue,
+        'mmc_priority': MMcPriorityQueue,
+    }
+
+    # -------------------- registry --------------------
+
+    @classmethod
+    def register(cls, name: str, queue_cls: type) -> None:
+        """Register (or replace) a BaseQueue subclass under a model name."""
+        if not (isinstance(queue_cls, type) and issubclass(queue_cls, BaseQueue)):
+            raise TypeError("queue_cls must be a BaseQueue subclass")
+        cls._registry[name.lower()] = queue_cls
+
+    @classmethod
+    def models(cls) -> tuple[str, ...]:
+        """Registered model names."""
+        return tuple(cls._registry)
+
+    # -------------------- construction --------------------
+
+    @classmethod
+    def create(cls, spec: dict) -> BaseQueue:
+        """
+        Build a validated, trusted queue from a spec dict.
+
+        Args:
+            spec: 'model' (registered name, case-insensitive) plus the
+                constructor parameters of that model; lists are accepted
+                for class-rate tuples.
+        Raises:
+            ValueError: unknown model, missing/unexpected parameters, or
+                parameters the queue considers invalid.
+        """
+        params = dict(spec)
+        name = str(params.pop('model', '')).lower()
+        queue_cls = cls._registry.get(name)
+        if queue_cls is None:
+            raise ValueError(f"unknown queue model '{name}'; expected one of {cls.models()}")
+
+        signature = inspect.signature(queue_cls.__init__)
+        accepted = [p for p in signature.parameters.values() if p.name != 'self']
+        unexpected = set(params) - {p.name for p in accepted}
+        if unexpected:
+            raise ValueError(f"unexpected parameters for '{name}': {sorted(unexpected)}")
+        missing = [p.name for p in accepted if p.default is p.empty and p.name not in params]
+        if missing:
+            raise ValueError(f"missing parameters for '{name}': {missing}")
+
+        if isinstance(params.get('lamda'), list):
+            params['lamda'] = tuple(params['lamda'])
+        queue = queue_cls(**params)
+        if not queue._trust():
+            raise ValueError(f"invalid parameters for '{name}': {params}")
+        return queue
+
+
+def create_queue(spec: dict) -> BaseQueue:
+    """Shortcut for QueueFactory.create(spec)."""
+    return QueueFactory.create(spec)
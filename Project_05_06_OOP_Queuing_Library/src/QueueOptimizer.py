@@ -0,0 +1,153 @@
+"""
+QueueOptimizer class - Cost-based choice of server count and priority order
+for a multi-class M/M/c system.
+
+"""
+from __future__ import annotations
+
+import math
+from typing import Sequence
+
+from MMcPriorityQueue import MMcPriorityQueue
+from MMcQueue import MMcQueue
+
+
+class QueueOptimizer:
+    """
+    Minimizes  c · server_cost + Σ_k waiting_cost_k · Lq_k  over the number of
+    servers c and the service discipline (FIFO or a non-preemptive priority
+    order of the classes).
+
+    Search:
+      - c runs upward from the smallest stable value on one MMcQueue, so each
+        step continues its cached Erlang-B value (one recursion step per c).
+      - Lq is decreasing in c, so once c · server_cost alone reaches the best
+        total cost no larger c can win and the scan stops (bound on c).
+      - With one μ shared by all classes, an adjacent-interchange argument
+        shows the cμ order (highest waiting cost first) is the cheapest
+        priority order for every c, so it is the only order costed unless
+        candidate orders are supplied (e.g. business constraints).
+    """
+
+    # -------------------- construction --------------------
+
+    def __init__(self, lamda_k: Sequence[float], mu: float, server_cost: float,
+                 waiting_cost: float | Sequence[float], max_servers: int | None = None) -> None:
+        """
+        Args:
+            lamda_k: Arrival rate of each class (traffic profile).
+            mu: Per-server service rate (μ), shared by all classes.
+            server_cost: Cost per server per unit time.
+            waiting_cost: Cost per waiting customer per unit time, one value
+                for all classes or one per class.
+            max_servers: Optional cap on c.
+        """
+        self.lamda_k = tuple(float(x) for x in lamda_k)
+        k = len(self.lamda_k)
+        if k == 0 or any(not (x >= 0) for x in self.lamda_k) or sum(self.lamda_k) <= 0:
+            raise ValueError("lamda_k must be non-empty, >= 0, with a positive sum")
+        if not (isinstance(mu, (int, float)) and mu > 0):
+            raise ValueError("mu must be > 0")
+        if not (isinstance(server_cost, (int, float)) and server_cost > 0):
+            raise ValueError("server_cost must be > 0")
+        if isinstance(waiting_cost, (int, float)):
+            waiting_cost = (waiting_cost,) * k
+        self.waiting_cost = tuple(float(x) for x in waiting_cost)
+        if len(self.waiting_cost) != k or any(not (x >= 0) for x in self.waiting_cost):
+            raise ValueError("waiting_cost must be >= 0, one value or one per class")
+        if max_servers is not None and not (isinstance(max_servers, int) and max_servers >= 1):
+            raise ValueError("max_servers must be an integer >= 1")
+
+        self.mu = float(mu)
+        self.server_cost = float(server_cost)
+        self.max_servers = max_servers
+        self.evaluated = 0
+
+    # -------------------- cost model --------------------
+
+    def _class_wait(self, wq: float, rho: float, before: float, rate: float, capacity: float) -> float:
+        """Wq_k for a class of rate `rate` served after classes with total rate `before`."""
+        a = 1.0 - before / capacity
+        b = 1.0 - (before + rate) / capacity
+        return wq * (1.0 - rho) / (a * b)
+
+    def cost(self, c: int, order: Sequence[int] | None = None) -> float:
+        """
+        Total cost of c servers with FIFO (order=None) or the given priority
+        order (class indices, highest priority first). +inf if unstable.
+        """
+        queue = MMcQueue(sum(self.lamda_k), self.mu, c)
+        if not queue.is_feasible():
+            return math.inf
+        return c * self.server_cost + self._waiting_cost(queue, order)
+
+    def _waiting_cost(self, queue: MMcQueue, order: Sequence[int] | None) -> float:
+        """Σ_k waiting_cost_k · Lq_k for a feasible queue."""
+        self.evaluated += 1
+        wq = queue.wq
+        if order is None:
+            return wq * sum(w * lam for w, lam in zip(self.waiting_cost, self.lamda_k))
+        rho, capacity = queue.ro, queue.c * self.mu
+        total, before = 0.0, 0.0
+        for k in order:
+            lam = self.lamda_k[k]
+            total += self.waiting_cost[k] * lam * self._class_wait(wq, rho, before, lam, capacity)
+            before += lam
+        return total
+
+    # -------------------- search --------------------
+
+    def priority_order(self) -> tuple[int, ...]:
+        """cμ rule: class indices by decreasing waiting cost (ties keep input order)."""
+        return tuple(sorted(range(len(self.lamda_k)), key=lambda k: -self.waiting_cost[k]))
+
+    def optimize(self, priorities: bool = True, orders: Sequence[Sequence[int]] | None = None) -> dict:
+        """
+        Search c and the discipline.
+
+        Args:
+            priorities: also consider priority orders (False ⇒ FIFO only).
+            orders: candidate priority orders (class indices, highest priority
+                first); None ⇒ the optimal cμ order.
+        Returns:
+            dict with 'c', 'order' (tuple of class indices, or None for FIFO),
+            'cost', 'server_cost', 'waiting_cost', 'evaluated' (configurations
+            costed) and 'queue' (the matching MMcQueue or MMcPriorityQueue with
+            classes in priority order).
+        """
+        k = len(self.lamda_k)
+        candidates: list[tuple[int, ...] | None] = [None]
+        if priorities and k > 1:
+            if orders is None:
+                candidates.append(self.priority_order())
+            else:
+                for order in orders:
+                    order = tuple(order)
+                    if sorted(order) != list(range(k)):
+                        raise ValueError(f"order {order} is not a permutation of the {k} classes")
+                    candidates.append(order)
+
+        self.evaluated = 0
+        total = sum(self.lamda_k)
+        c = int(total // self.mu) + 1  # smallest c with ρ < 1
+        queue = MMcQueue(total, self.mu, c)
+
+        best = {'cost': math.inf}
+        while (self.max_servers is None or c <= self.max_servers) and c * self.server_cost < best['cost']:
+            queue.c = c  # incremental: reuses the cached Erlang-B recursion
+            fixed = c * self.server_cost
+            for order in candidates:
+                waiting = self._waiting_cost(queue, order)
+                if fixed + waiting < best['cost']:
+                    best = {'c': c, 'order': order, 'cost': fixed + waiting,
+                            'server_cost': fixed, 'waiting_cost': waiting}
+            c += 1
+
+        if 'c' not in best:
+            raise ValueError("no stable configuration within max_servers")
+        best['evaluated'] = self.evaluated
+        if best['order'] is None:
+            best['queue'] = MMcQueue(total, self.mu, best['c'])
+        else:
+            best['queue'] = MMcPriorityQueue(tuple(self.lamda_k[k] for k in best['order']), self.mu, best['c'])
+        return best
@@ -0,0 +1,226 @@
+"""
+QueueSimulator class - Discrete-event simulation of FIFO G/G/c queues.
+Used to check the analytic BaseQueue models against sampled or replayed traffic.
+
+"""
+from __future__ import annotations
+
+import csv
+import heapq
+import math
+
+import numpy as np
+
+from BaseQueue import BaseQueue
+from GGcQueue import GGcQueue
+from MD1Queue import MD1Queue
+from MGcQueue import MGcQueue
+from MG1Queue import MG1Queue
+from MMcQueue import MMcQueue
+
+
+# -------------------- distributions --------------------
+
+class Exponential:
+    """Exponential times with the given rate (mean 1/rate)."""
+
+    def __init__(self, rate: float) -> None:
+        if not (isinstance(rate, (int, float)) and rate > 0):
+            raise ValueError("rate must be > 0")
+        self.rate = float(rate)
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        return rng.exponential(1.0 / self.rate, size)
+
+
+class Deterministic:
+    """Constant times."""
+
+    def __init__(self, value: float) -> None:
+        if not (isinstance(value, (int, float)) and value >= 0):
+            raise ValueError("value must be >= 0")
+        self.value = float(value)
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        return np.full(size, self.value)
+
+
+class Gamma:
+    """Gamma times parameterized by mean and standard deviation (sigma = 0 ⇒ constant)."""
+
+    def __init__(self, mean: float, sigma: float) -> None:
+        if not (isinstance(mean, (int, float)) and mean > 0):
+            raise ValueError("mean must be > 0")
+        if not (isinstance(sigma, (int, float)) and sigma >= 0):
+            raise ValueError("sigma must be >= 0")
+        self.mean = float(mean)
+        self.sigma = float(sigma)
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        if self.sigma == 0:
+            return np.full(size, self.mean)
+        shape = (self.mean / self.sigma) ** 2
+        return rng.gamma(shape, self.mean / shape, size)
+
+
+class Trace:
+    """Replays recorded times in order (trace replay); size is capped by the trace length."""
+
+    def __init__(self, values) -> None:
+        values = np.asarray(values, dtype=float)
+        if values.ndim != 1 or values.size == 0 or not np.all(np.isfinite(values) & (values >= 0)):
+            raise ValueError("trace must be a non-empty 1-D sequence of times >= 0")
+        self.values = values
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        return self.values[:size]
+
+
+# -------------------- simulator --------------------
+
+class QueueSimulator:
+    """
+    FIFO G/G/c simulator with a heap-based event calendar.
+
+    Arrival and service times are drawn in bulk into arrays (one record per
+    customer: arrival, start of service, departure). The calendar holds the
+    next completion time of every server, so each customer costs one heap
+    operation: it starts at max(arrival, earliest completion).
+
+    Reported metrics use the same names as BaseQueue properties:
+        p0, lq, l (time averages), wq, w (customer averages), plus lamda and n.
+    """
+
+    # -------------------- construction --------------------
+
+    def __init__(self, interarrival, service, c: int = 1) -> None:
+        """
+        Args:
+            interarrival: distribution with sample(rng, size) for interarrival times.
+            service: distribution with sample(rng, size) for service times.
+            c: Number of servers (integer ≥ 1).
+        """
+        if not (isinstance(c, int) and c >= 1):
+            raise ValueError("c must be an integer >= 1")
+        self.interarrival = interarrival
+        self.service = service
+        self.c = c
+
+    @classmethod
+    def from_queue(cls, queue: BaseQueue) -> QueueSimulator:
+        """Build a simulator with the arrival/service assumptions of an analytic queue."""
+        if not queue.is_valid():
+            raise ValueError("queue parameters are invalid")
+
+        if isinstance(queue, GGcQueue):
+            return cls(Gamma(1.0 / queue.lamda, queue.sigma_a), Gamma(1.0 / queue.mu, queue.sigma), queue.c)
+        arrivals = Exponential(queue.lamda)
+        if isinstance(queue, MGcQueue):
+            return cls(arrivals, Gamma(1.0 / queue.mu, queue.sigma), queue.c)
+        if isinstance(queue, MMcQueue):
+            return cls(arrivals, Exponential(queue.mu), queue.c)
+        if isinstance(queue, MD1Queue):
+            return cls(arrivals, Deterministic(1.0 / queue.mu))
+        if isinstance(queue, MG1Queue):
+            return cls(arrivals, Gamma(1.0 / queue.mu, queue.sigma))
+        return cls(arrivals, Exponential(queue.mu))
+
+    @classmethod
+    def from_csv(cls, path: str, arrival_col: str = "arrival", service_col: str = "service",
+                 c: int = 1) -> QueueSimulator:
+        """
+        Build a trace-replay simulator from a CSV with one row per customer.
+
+        Args:
+            path: CSV file path.
+            arrival_col: column of arrival timestamps.
+            service_col: column of service durations.
+            c: Number of servers.
+        """
+        with open(path, newline="") as fh:
+            rows = [(float(r[arrival_col]), float(r[service_col])) for r in csv.DictReader(fh)]
+        rows.sort()
+        arrivals = np.array([r[0] for r in rows])
+        services = np.array([r[1] for r in rows])
+        interarrival = np.diff(arrivals, prepend=arrivals[0]) if arrivals.size else arrivals
+        return cls(Trace(interarrival), Trace(services), c)
+
+    # -------------------- simulation --------------------
+
+    def simulate(self, n: int, rng: np.random.Generator | None = None) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Run n customers through the queue.
+
+        Returns:
+            (arrival, start, departure) arrays, one entry per customer.
+        """
+        rng = np.random.default_rng() if rng is None else rng
+        gaps = self.interarrival.sample(rng, n)
+        services = self.service.sample(rng, n)
+        n = min(gaps.size, services.size)
+        arrival = np.cumsum(gaps[:n])
+        services = services[:n]
+
+        start_list = [0.0] * n
+        calendar = [0.0] * self.c  # next completion time per server
+        heapreplace = heapq.heapreplace
+        for i, (a, s) in enumerate(zip(arrival.tolist(), services.tolist())):
+            t = calendar[0]
+            if t < a:
+                t = a
+            start_list[i] = t
+            heapreplace(calendar, t + s)
+
+        start = np.array(start_list)
+        return arrival, start, start + services
+
+    def run(self, n: int, warmup: int = 0, seed=None) -> dict:
+        """
+        Simulate n customers and summarize them, discarding the first `warmup`.
+
+        Args:
+            n: customers to simulate.
+            warmup: initial customers excluded from the statistics.
+            seed: seed or SeedSequence for numpy.random.default_rng.
+        Returns:
+            dict with keys 'p0', 'lq', 'l', 'wq', 'w', 'lamda', 'n'.
+        """
+        if not (isinstance(n, int) and isinstance(warmup, int) and 0 <= warmup < n):
+            raise ValueError("need integers 0 <= warmup < n")
+        arrival, start, departure = self.simulate(n, np.random.default_rng(seed))
+        if arrival.size <= warmup:
+            raise ValueError("trace is shorter than the warmup period")
+        return self.summarize(arrival, start, departure, warmup)
+
+    @staticmethod
+    def summarize(arrival: np.ndarray, start: np.ndarray, departure: np.ndarray, warmup: int = 0) -> dict:
+        """Compute queue metrics from per-customer records over [arrival[warmup], arrival[-1]]."""
+        t0, t1 = float(arrival[warmup]), float(arrival[-1])
+        span = t1 - t0
+        counted = slice(warmup, None)
+        wq = float(np.mean(start[counted] - arrival[counted]))
+        w = float(np.mean(departure[counted] - arrival[counted]))
+        if span <= 0:
+            return {'p0': math.nan, 'lq': math.nan, 'l': math.nan, 'wq': wq, 'w': w,
+                    'lamda': math.nan, 'n': arrival.size - warmup}
+
+        def time_in_window(begin, end):
+            return float(np.sum(np.clip(end, t0, t1) - np.clip(begin, t0, t1)))
+
+        # number in system between consecutive events, for the empty-time fraction
+        times = np.concatenate((arrival, departure))
+        steps = np.concatenate((np.ones(arrival.size), -np.ones(departure.size)))
+        order = np.argsort(times, kind="stable")
+        times, in_system = times[order], np.cumsum(steps[order])
+        empty = in_system[:-1] == 0
+        idle = time_in_window(times[:-1][empty], times[1:][empty])
+
+        return {
+            'p0': idle / span,
+            'lq': time_in_window(arrival, start) / span,
+            'l': time_in_window(arrival, departure) / span,
+            'wq': wq,
+            'w': w,
+            'lamda': (arrival.size - 1 - warmup) / span,
+            'n': arrival.size - warmup,
+        }
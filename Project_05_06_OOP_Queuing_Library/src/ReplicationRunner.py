@@ -0,0 +1,169 @@
+"""
+ReplicationRunner class - Independent replications of a QueueSimulator run in
+parallel, with confidence intervals and adaptive stopping.
+
+"""
+from __future__ import annotations
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+
+import numpy as np
+
+from QueueSimulator import QueueSimulator
+
+
+def _replicate(simulator: QueueSimulator, n: int, warmup: int, seed: np.random.SeedSequence) -> dict:
+    """Worker entry point: one independent replication (module level so it pickles)."""
+    return simulator.run(n, warmup=warmup, seed=seed)
+
+
+def _t_two_sided(theta: float, df: int) -> float:
+    """P(|T| ≤ √df·tan θ) for integer df (finite series, Abramowitz & Stegun 26.7.3–4)."""
+    s, c2 = math.sin(theta), math.cos(theta) ** 2
+    if df % 2:
+        term, total = s * math.cos(theta), 0.0
+        for k in range(1, (df - 1) // 2 + 1):
+            total += term
+            term *= c2 * (2 * k) / (2 * k + 1)
+        return 2 / math.pi * (theta + total)
+    term, total = s, 0.0
+    for k in range(1, df // 2 + 1):
+        total += term
+        term *= c2 * (2 * k - 1) / (2 * k)
+    return total
+
+
+def _t_quantile(p: float, df: int) -> float:
+    """
+    Student-t quantile.
+
+    Exact for df ≤ 30 (bisection on the closed-form CDF); above that the
+    Cornish–Fisher expansion around the normal quantile is accurate to ~1e-5.
+    """
+    if p < 0.5:
+        return -_t_quantile(1 - p, df)
+    if df <= 30:
+        target, lo, hi = 2 * p - 1, 0.0, math.pi / 2
+        for _ in range(60):
+            mid = (lo + hi) / 2
+            lo, hi = (mid, hi) if _t_two_sided(mid, df) < target else (lo, mid)
+        return math.sqrt(df) * math.tan((lo + hi) / 2)
+    z = NormalDist().inv_cdf(p)
+    g1 = (z ** 3 + z) / 4
+    g2 = (5 * z ** 5 + 16 * z ** 3 + 3 * z) / 96
+    g3 = (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / 384
+    g4 = (79 * z ** 9 + 776 * z ** 7 + 1482 * z ** 5 - 1920 * z ** 3 - 945 * z) / 92160
+    return z + g1 / df + g2 / df ** 2 + g3 / df ** 3 + g4 / df ** 4
+
+
+class ReplicationRunner:
+    """
+    Runs independent replications of a simulation across a process pool.
+
+    Each replication gets its own child of one SeedSequence, so results do not
+    depend on the number of workers. Every replication is treated as one batch:
+    per-metric means get a Student-t interval from the spread of the batch
+    means, and replications are added in rounds (one per worker) until every
+    requested half-width target is met.
+    """
+
+    METRICS = ('p0', 'lq', 'l', 'wq', 'w')
+
+    # -------------------- construction --------------------
+
+    def __init__(self, simulator: QueueSimulator, n: int, warmup: int = 0,
+                 confidence: float = 0.95, max_workers: int | None = None) -> None:
+        """
+        Args:
+            simulator: the QueueSimulator to replicate (must be picklable).
+            n: customers per replication.
+            warmup: customers discarded at the start of each replication.
+            confidence: two-sided confidence level of the intervals.
+            max_workers: worker processes (None ⇒ os.cpu_count(); 1 ⇒ run in-process).
+        """
+        if not (0 < confidence < 1):
+            raise ValueError("confidence must be in (0, 1)")
+        if not (isinstance(n, int) and isinstance(warmup, int) and 0 <= warmup < n):
+            raise ValueError("need integers 0 <= warmup < n")
+        self.simulator = simulator
+        self.n = n
+        self.warmup = warmup
+        self.confidence = confidence
+        self.max_workers = max_workers
+
+    # -------------------- execution --------------------
+
+    def run(self, target: float | dict | None = None, relative: bool = True, min_replications: int = 5,
+            max_replications: int = 100, seed=None) -> dict:
+        """
+        Replicate until the half-width target is met or max_replications is reached.
+
+        Args:
+            target: half-width goal for every metric (float) or per metric (dict);
+                None runs exactly min_replications.
+            relative: interpret targets as a fraction of the metric mean.
+            min_replications: replications before the first stopping check (>= 2).
+            max_replications: hard cap on replications.
+            seed: root seed for numpy.random.SeedSequence.
+        Returns:
+            dict with 'mean' and 'half_width' (metric ⇒ value), 'replications',
+            and 'converged' (whether the target was met).
+        """
+        if not (2 <= min_replications <= max_replications):
+            raise ValueError("need 2 <= min_replications <= max_replications")
+        if target is None:
+            goals = {}
+        elif isinstance(target, dict):
+            goals = dict(target)
+            if not set(goals) <= set(self.METRICS):
+                raise ValueError(f"targets must be among {self.METRICS}")
+        else:
+            goals = {m: float(target) for m in self.METRICS}
+
+        seeds = np.random.SeedSequence(seed).spawn(max_replications)
+        samples = {m: [] for m in self.METRICS}
+        done, converged = 0, False
+
+        workers = self.max_workers or os.cpu_count() or 1
+        pool = ProcessPoolExecutor(workers) if workers > 1 else None
+        try:
+            while done < max_replications:
+                size = min_replications - done if done < min_replications else workers
+                batch = seeds[done:min(done + size, max_replications)]
+                if pool is None:
+                    results = [_replicate(self.simulator, self.n, self.warmup, s) for s in batch]
+                else:
+                    results = list(pool.map(_replicate, *zip(*[(self.simulator, self.n, self.warmup, s)
+                                                               for s in batch])))
+                for r in results:
+                    for m in self.METRICS:
+                        samples[m].append(r[m])
+                done += len(batch)
+
+                mean, half = self._interval(samples)
+                converged = bool(goals) and all(
+                    half[m] <= (goal * abs(mean[m]) if relative else goal) for m, goal in goals.items())
+                if not goals or converged:
+                    break
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        mean, half = self._interval(samples)
+        return {'mean': mean, 'half_width': half, 'replications': done, 'converged': converged}
+
+    def _interval(self, samples: dict) -> tuple[dict, dict]:
+        """Per-metric batch mean and confidence half-width."""
+        mean, half = {}, {}
+        for m, values in samples.items():
+            x = np.asarray(values, dtype=float)
+            mean[m] = float(x.mean())
+            if x.size < 2:
+                half[m] = math.inf
+                continue
+            t = _t_quantile(0.5 + self.confidence / 2, x.size - 1)
+            half[m] = float(t * x.std(ddof=1) / math.sqrt(x.size))
+        return mean, half
@@ -0,0 +1,108 @@
+"""
+RunningStats class - Streaming mean / variance (Welford) for service-time and
+interarrival logs that are too large to hold in memory.
+
+"""
+from __future__ import annotations
+
+import math
+from typing import Iterable
+
+import numpy as np
+
+
+class RunningStats:
+    """
+    Count, mean and variance of a stream of values in O(1) memory.
+
+    Single values use Welford's update; array chunks are summarized with NumPy
+    and merged with Chan's parallel formula, so feeding one value at a time
+    or whole chunks gives the same result.
+    """
+
+    __slots__ = ("_n", "_mean", "_m2")
+
+    def __init__(self, values: Iterable[float] | None = None) -> None:
+        """
+        Args:
+            values: optional iterable of values (or array chunks) to consume.
+        """
+        self._n = 0
+        self._mean = 0.0
+        self._m2 = 0.0  # Σ (x - mean)²
+        if values is not None:
+            self.extend(values)
+
+    # -------------------- updates --------------------
+
+    def push(self, x: float) -> None:
+        """Add one value (Welford)."""
+        x = float(x)
+        self._n += 1
+        delta = x - self._mean
+        self._mean += delta / self._n
+        self._m2 += delta * (x - self._mean)
+
+    def update(self, chunk) -> None:
+        """Add an array chunk of values (Chan et al. merge)."""
+        chunk = np.asarray(chunk, dtype=float).ravel()
+        if chunk.size == 0:
+            return
+        n_b = chunk.size
+        mean_b = float(chunk.mean())
+        m2_b = float(((chunk - mean_b) ** 2).sum())
+        self.merge_moments(n_b, mean_b, m2_b)
+
+    def extend(self, values: Iterable) -> None:
+        """Consume an iterable of scalars and/or array chunks."""
+        if isinstance(values, np.ndarray):
+            self.update(values)
+            return
+        for item in values:
+            if np.ndim(item) == 0:
+                self.push(item)
+            else:
+                self.update(item)
+
+    def merge(self, other: RunningStats) -> None:
+        """Fold another RunningStats (e.g. from a parallel reader) into this one."""
+        self.merge_moments(other._n, other._mean, other._m2)
+
+    def merge_moments(self, n_b: int, mean_b: float, m2_b: float) -> None:
+        """Fold in a summary given as (count, mean, Σ squared deviations)."""
+        if n_b == 0:
+            return
+        n_a = self._n
+        n = n_a + n_b
+        delta = mean_b - self._mean
+        self._mean += delta * n_b / n
+        self._m2 += m2_b + delta * delta * n_a * n_b / n
+        self._n = n
+
+    # -------------------- properties --------------------
+
+    @property
+    def n(self) -> int:
+        """Number of values seen."""
+        return self._n
+
+    @property
+    def mean(self) -> float:
+        """Sample mean (NaN before the first value)."""
+        return self._mean if self._n else math.nan
+
+    @property
+    def variance(self) -> float:
+        """Unbiased sample variance (NaN with fewer than two values)."""
+        return self._m2 / (self._n - 1) if self._n > 1 else math.nan
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation."""
+        return math.sqrt(self.variance) if self._n > 1 else math.nan
+
+    @property
+    def scv(self) -> float:
+        """Squared coefficient of variation: variance / mean²."""
+        mean = self.mean
+        return self.variance / (mean * mean) if self._n > 1 and mean != 0 else math.nan
@@ -0,0 +1,140 @@
+"""
+StaffingPlanner class - Per-interval staffing for time-varying arrivals using
+pointwise-stationary, lagged and infinite-server offered-load approximations.
+
+"""
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+
+class StaffingPlanner:
+    """
+    Staffs each interval of a λ(t) profile as a stationary M/M/c queue whose
+    offered load a_i depends on the chosen approximation:
+
+        'psa'  pointwise stationary:  a_i = λ_i / μ
+        'lag'  lagged PSA:            a_i = λ(t_i − 1/μ) / μ  (shifted by one mean service time)
+        'mol'  infinite-server (modified) offered load, the mean busy servers
+               of an M(t)/M/∞ queue: m' = λ(t) − μ m, averaged over each interval
+
+    The smallest c meeting the target is found in one Erlang-B recursion over
+    all intervals at once: at step n every interval that is still unstaffed
+    gets B(a_i, n) = a_i B(a_i, n−1) / (n + a_i B(a_i, n−1)) and is assigned
+    c = n as soon as its target holds.
+    """
+
+    METHODS = ('psa', 'lag', 'mol')
+
+    # -------------------- construction --------------------
+
+    def __init__(self, lamda, mu: float, interval: float = 0.25) -> None:
+        """
+        Args:
+            lamda: Arrival rate per interval (array-like, ≥ 0), in the time unit of mu.
+            mu: Service rate per server (μ > 0).
+            interval: Interval length in the same time unit (e.g. 0.25 h).
+        """
+        lamda = np.asarray(lamda, dtype=float)
+        if lamda.ndim != 1 or lamda.size == 0 or not np.all(np.isfinite(lamda) & (lamda >= 0)):
+            raise ValueError("lamda must be a non-empty 1-D array of rates >= 0")
+        if not (isinstance(mu, (int, float)) and mu > 0):
+            raise ValueError("mu must be > 0")
+        if not (isinstance(interval, (int, float)) and interval > 0):
+            raise ValueError("interval must be > 0")
+        self.lamda = lamda
+        self.mu = float(mu)
+        self.interval = float(interval)
+
+    # -------------------- offered load --------------------
+
+    def offered_load(self, method: str = 'psa') -> np.ndarray:
+        """Offered load a_i (in servers) per interval under the given approximation."""
+        lam, mu, dt = self.lamda, self.mu, self.interval
+        if method == 'psa':
+            return lam / mu
+        if method == 'lag':
+            mid = (np.arange(lam.size) + 0.5) * dt
+            return np.interp(mid - 1.0 / mu, mid, lam) / mu
+        if method == 'mol':
+            # exact for piecewise-constant λ: m relaxes towards λ_i/μ at rate μ
+            decay = math.exp(-mu * dt)
+            spread = -math.expm1(-mu * dt) / (mu * dt)  # mean of e^{-μs} over the interval
+            target = lam / mu
+            m_start = np.empty(lam.size)
+            m = target[0]  # start from steady state for the first interval
+            for i, a in enumerate(target.tolist()):
+                m_start[i] = m
+                m = a + (m - a) * decay
+            return target + (m_start - target) * spread
+        raise ValueError(f"method must be one of {self.METHODS}")
+
+    # -------------------- staffing --------------------
+
+    def plan(self, method: str = 'psa', target_wq: float | None = None, service_level: float | None = None,
+             answer_time: float = 0.0, max_delay_prob: float | None = None) -> dict:
+        """
+        Minimal servers per interval meeting every given target.
+
+        Args:
+            method: 'psa', 'lag' or 'mol'.
+            target_wq: maximum mean wait in queue.
+            service_level: minimum P(Wq ≤ answer_time).
+            answer_time: threshold for service_level.
+            max_delay_prob: maximum probability of waiting (Erlang C).
+        Returns:
+            dict of per-interval arrays: 'offered_load', 'c' (int), 'ro',
+            'pw' (probability of waiting) and 'wq', evaluated on the offered
+            load of the chosen method.
+        """
+        if target_wq is None and service_level is None and max_delay_prob is None:
+            raise ValueError("give at least one of target_wq, service_level, max_delay_prob")
+        if target_wq is not None and not target_wq > 0:
+            raise ValueError("target_wq must be > 0")
+        if service_level is not None and not (0 < service_level < 1 and answer_time >= 0):
+            raise ValueError("service_level must be in (0, 1) with answer_time >= 0")
+        if max_delay_prob is not None and not 0 < max_delay_prob <= 1:
+            raise ValueError("max_delay_prob must be in (0, 1]")
+
+        a = self.offered_load(method)
+        mu = self.mu
+        size = a.size
+        c = np.zeros(size, dtype=np.int64)
+        pw = np.zeros(size)
+        wq = np.zeros(size)
+
+        # intervals without traffic need no servers
+        todo = np.flatnonzero(a > 0)
+        b = np.ones(todo.size)
+        # safeguard: any practical target is met well below this many servers
+        n_max = int(math.ceil(a.max() + 20 * math.sqrt(a.max()))) + 100
+        n = 0
+        while todo.size:
+            n += 1
+            if n > n_max:
+                raise ValueError(f"targets not met with {n_max} servers; loosen the targets")
+            a_t = a[todo]
+            b = a_t * b / (n + a_t * b)
+            stable = a_t < n
+            with np.errstate(divide='ignore', invalid='ignore'):
+                rho = a_t / n
+                pw_n = np.where(stable, b / (1 - rho * (1 - b)), 1.0)
+                gap = np.where(stable, (n - a_t) * mu, 0.0)  # cμ − λ
+                wq_n = np.where(stable, pw_n / gap, math.inf)
+
+            ok = stable.copy()
+            if target_wq is not None:
+                ok &= wq_n <= target_wq
+            if service_level is not None:
+                ok &= 1 - pw_n * np.exp(-gap * answer_time) >= service_level
+            if max_delay_prob is not None:
+                ok &= pw_n <= max_delay_prob
+
+            done = todo[ok]
+            c[done], pw[done], wq[done] = n, pw_n[ok], wq_n[ok]
+            todo, b = todo[~ok], b[~ok]
+
+        ro = np.where(c > 0, a / np.maximum(c, 1), 0.0)
+        return {'offered_load': a, 'c': c, 'ro': ro, 'pw': pw, 'wq': wq}
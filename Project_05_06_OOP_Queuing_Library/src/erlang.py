@@ -0,0 +1,88 @@
+"""
+erlang module - Vectorized Erlang-B / Erlang-C helpers shared by the array-based
+queue classes.
+
+"""
+from __future__ import annotations
+
+import numpy as np
+
+
+def erlang_b(a, c) -> np.ndarray:
+    """
+    Erlang-B blocking probability B(a, c) over broadcastable arrays.
+
+    Uses the stable recursion B(a, n) = a·B(a, n-1) / (n + a·B(a, n-1)), run once
+    up to max(c); entries with c < 1 or non-integer c are returned as NaN.
+
+    Args:
+        a: offered load λ/μ.
+        c: number of servers.
+    """
+    a = np.asarray(a, dtype=float)
+    c = np.asarray(c, dtype=float)
+    ok = np.isfinite(c) & (c >= 1) & (c == np.floor(c))
+    c_int = np.where(ok, c, 1).astype(np.int64)
+    c_max = int(c_int.max()) if c_int.size else 1
+
+    b = np.ones(np.broadcast(a, c_int).shape)
+    with np.errstate(all='ignore'):
+        for n in range(1, c_max + 1):
+            ab = a * b
+            b = np.where(n <= c_int, ab / (n + ab), b)
+    return np.where(ok, b, np.nan)
+
+
+def erlang_c(a, c) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Erlang-C probability of waiting and P0 for M/M/c over broadcastable arrays.
+
+        Pw = B / (1 − ρ(1 − B)),  ρ = a/c
+        P0 = B·c!/a^c / (1 + Bρ/(1 − ρ))   (evaluated in log space)
+
+    Entries are only meaningful where a > 0 and ρ < 1; callers mask the rest.
+
+    Returns:
+        (p0, pw) arrays.
+    """
+    a = np.asarray(a, dtype=float)
+    c = np.asarray(c, dtype=float)
+    b = erlang_b(a, c)
+    with np.errstate(all='ignore'):
+        rho = a / c
+        pw = b / (1 - rho * (1 - b))
+        c_int = np.where(np.isfinite(c) & (c >= 1), c, 1).astype(np.int64)
+        c_max = int(c_int.max()) if c_int.size else 1
+        log_fact = np.concatenate(([0.0], np.cumsum(np.log(np.arange(1, c_max + 1)))))
+        log_p0 = np.log(b) + log_fact[c_int] - c_int * np.log(a) - np.log1p(b * rho / (1 - rho))
+        # B underflows to 0 only when a ≪ 1; then the system is almost always empty
+        p0 = np.where(b > 0, np.exp(log_p0), np.exp(-a))
+    return p0, pw
+
+
+def erlang_c_lq(a, c) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    M/M/c queue length and its sensitivities over broadcastable arrays.
+
+        Lq = C·a/(c − a),  C = cB / (c − a + aB),  ∂B/∂a = B(c/a − 1 + B)
+
+    Returns:
+        (lq, dlq_da, delta_lq_c) where delta_lq_c = Lq(c + 1) − Lq(c).
+        Entries are only meaningful where a > 0 and a < c.
+    """
+    a = np.asarray(a, dtype=float)
+    c = np.asarray(c, dtype=float)
+    b = erlang_b(a, c)
+    with np.errstate(all='ignore'):
+        d = c - a + a * b
+        erl_c = c * b / d
+        lq = erl_c * a / (c - a)
+
+        db = b * (c / a - 1 + b)
+        dd = -1 + b + a * db
+        derl_c = c * (db * d - b * dd) / (d * d)
+        dlq_da = derl_c * a / (c - a) + erl_c * c / (c - a) ** 2
+
+        b1 = a * b / (c + 1 + a * b)
+        lq1 = (c + 1) * b1 / (c + 1 - a + a * b1) * a / (c + 1 - a)
+    return lq, dlq_da, lq1 - lq
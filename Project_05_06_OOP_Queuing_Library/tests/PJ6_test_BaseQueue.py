@@ -1,4 +1,5 @@
 import math
+import threading
 import unittest
 
 from BaseQueue import BaseQueue
@@ -43,5 +44,91 @@ class TestBaseQueue(unittest.TestCase):
         self.assertAlmostEqual(q.wq, 0.16, places=7)
         self.assertAlmostEqual(q.w, 0.20, places=7)
 
+    def test_construction_is_lazy(self):
+        q = DummyQueue(20, 25)
+        self.assertTrue(q._recalc_needed)     # nothing computed yet
+        self.assertAlmostEqual(q.wq, 0.16, places=7)
+        self.assertFalse(q._recalc_needed)
+
+        inf = DummyQueue(30, 25)
+        self.assertTrue(math.isinf(inf.lq))
+        self.assertTrue(math.isinf(inf.p0))
+
+    def test_update_sets_several_parameters(self):
+        q = DummyQueue(20, 25)
+        _ = q.lq
+        q.update(lamda=30, mu=40)
+        self.assertTrue(q._recalc_needed)
+        self.assertEqual((q.lamda, q.mu), (30.0, 40.0))
+        self.assertAlmostEqual(q.lq, 0.75 ** 2 / 0.25, places=7)
+
+        q.update(mu=-1)
+        self.assertTrue(math.isnan(q.lq))     # invalid after a valid read ⇒ NaN, not stale
+
+    def test_update_rejects_unknown_names(self):
+        q = DummyQueue(20, 25)
+        for bad in ({"lamda": 30, "sigma": 1}, {"ro": 0.5}, {"_mu": 5}):
+            with self.assertRaises(TypeError):
+                q.update(**bad)
+        self.assertEqual((q.lamda, q.mu), (20.0, 25.0))  # untouched
+
+    def test_profiling_counts_per_class(self):
+        BaseQueue.reset_profiling_stats()
+        BaseQueue.enable_profiling()
+        self.addCleanup(BaseQueue.reset_profiling_stats)
+        self.addCleanup(BaseQueue.disable_profiling)
+
+        q = DummyQueue(20, 25)
+        _ = q.lq                              # recompute
+        _ = q.lq                              # cached
+        _ = q.p0                              # cached
+        q.lamda = 22
+        _ = q.p0                              # recompute
+        stats = BaseQueue.profiling_stats()["DummyQueue"]
+        self.assertEqual(stats["recomputations"], 2)
+        self.assertEqual(stats["cache_hits"], 2)
+        self.assertGreater(stats["validations"], 0)
+        self.assertGreaterEqual(stats["calc_seconds"], 0.0)
+
+        BaseQueue.reset_profiling_stats()
+        self.assertEqual(BaseQueue.profiling_stats(), {})
+
+    def test_profiling_counts_across_threads(self):
+        BaseQueue.reset_profiling_stats()
+        BaseQueue.enable_profiling()
+        self.addCleanup(BaseQueue.reset_profiling_stats)
+        self.addCleanup(BaseQueue.disable_profiling)
+
+        def work():
+            q = DummyQueue(20, 25)
+            for i in range(500):
+                q.lamda = 10 + i % 10
+                _ = q.lq                      # recompute
+                _ = q.p0                      # cached
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        stats = BaseQueue.profiling_stats()["DummyQueue"]
+        self.assertEqual(stats["recomputations"], 4000)
+        self.assertEqual(stats["cache_hits"], 4000)
+
+    def test_profiling_off_leaves_methods_untouched(self):
+        original_calc, original_lq = DummyQueue._calc_metrics, BaseQueue.__dict__["lq"]
+        BaseQueue.enable_profiling()
+        self.assertTrue(BaseQueue.profiling_enabled())
+        self.assertIsNot(BaseQueue.__dict__["lq"], original_lq)
+        BaseQueue.disable_profiling()
+        self.assertFalse(BaseQueue.profiling_enabled())
+        self.assertIs(DummyQueue._calc_metrics, original_calc)
+        self.assertIs(BaseQueue.__dict__["lq"], original_lq)
+
+        BaseQueue.reset_profiling_stats()
+        _ = DummyQueue(20, 25).lq
+        self.assertEqual(BaseQueue.profiling_stats(), {})
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -0,0 +1,47 @@
+import math
+import unittest
+
+import numpy as np
+
+from GGcQueue import GGcQueue
+from MGcQueue import MGcQueue
+
+
+class TestGGcQueue(unittest.TestCase):
+    def test_poisson_arrivals_match_mgc(self):
+        q, ref = GGcQueue(80, 25, 4, 0.08, 1 / 80), MGcQueue(80, 25, 4, 0.08)
+        self.assertAlmostEqual(q.lq, ref.lq, places=10)
+        self.assertAlmostEqual(q.wq, ref.wq, places=10)
+
+    def test_kingman_for_one_server(self):
+        lam, mu, sigma, sigma_a = 20.0, 25.0, 0.03, 0.04
+        rho = lam / mu
+        ca2, cs2 = (sigma_a * lam) ** 2, (sigma * mu) ** 2
+        expected_wq = rho / (1 - rho) * (ca2 + cs2) / 2 / mu
+        self.assertAlmostEqual(GGcQueue(lam, mu, 1, sigma, sigma_a).wq, expected_wq, places=10)
+
+    def test_deterministic_system_never_waits(self):
+        q = GGcQueue(40, 25, 2, 0.0, 0.0)
+        self.assertEqual(q.lq, 0.0)
+        self.assertAlmostEqual(q.w, 1 / 25)
+
+    def test_invalid_and_infeasible(self):
+        self.assertTrue(math.isnan(GGcQueue(20, 25, 1, 0.02, -1).wq))
+        self.assertTrue(math.isinf(GGcQueue(30, 25, 1, 0.02, 0.01).lq))
+        q = GGcQueue(20, 25, 1, 0.02, 0.01)
+        _ = q.lq
+        q.update(sigma_a=0.05)
+        self.assertAlmostEqual(q.ca2, 1.0, places=12)
+
+    def test_from_samples(self):
+        rng = np.random.default_rng(5)
+        gaps, services = rng.gamma(2.0, 1 / 80, 50_000), rng.gamma(4.0, 0.01, 50_000)
+        q = GGcQueue.from_samples(gaps, services, 2)
+        self.assertAlmostEqual(q.lamda, 1 / gaps.mean(), places=8)
+        self.assertAlmostEqual(q.sigma_a, gaps.std(ddof=1), places=8)
+        self.assertAlmostEqual(q.mu, 1 / services.mean(), places=8)
+        self.assertAlmostEqual(q.sigma, services.std(ddof=1), places=8)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
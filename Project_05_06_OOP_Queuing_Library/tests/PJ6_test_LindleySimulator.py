@@ -0,0 +1,48 @@
+import unittest
+
+import numpy as np
+
+from LindleySimulator import LindleySimulator
+from MD1Queue import MD1Queue
+from MG1Queue import MG1Queue
+from MM1Queue import MM1Queue
+from MMcQueue import MMcQueue
+from QueueSimulator import QueueSimulator, Trace
+
+
+class TestLindleySimulator(unittest.TestCase):
+    def test_matches_explicit_recursion_across_chunks(self):
+        rng = np.random.default_rng(0)
+        gaps, services = rng.exponential(1 / 20, 1000), rng.exponential(1 / 25, 1000)
+        expected = [0.0]
+        for i in range(1, 1000):
+            expected.append(max(0.0, expected[-1] + services[i - 1] - gaps[i]))
+        sim = LindleySimulator(Trace(gaps), Trace(services))
+        np.testing.assert_allclose(sim.sample_wq(1000, chunk_size=77), expected, atol=1e-12)
+
+    def test_matches_event_simulator(self):
+        rng = np.random.default_rng(1)
+        gaps, services = Trace(rng.exponential(1 / 20, 500)), Trace(rng.exponential(1 / 25, 500))
+        arrival, start, _ = QueueSimulator(gaps, services).simulate(500)
+        np.testing.assert_allclose(LindleySimulator(gaps, services).sample_wq(500), start - arrival, atol=1e-10)
+
+    def test_agrees_with_analytic_models(self):
+        for q in (MM1Queue(20, 25), MD1Queue(20, 25), MG1Queue(20, 25, 0.02)):
+            r = LindleySimulator.from_queue(q).run(1_000_000, warmup=1000, seed=4, chunk_size=250_000)
+            self.assertAlmostEqual(r["wq"], q.wq, delta=0.05 * q.wq)
+            self.assertAlmostEqual(r["w"], q.w, delta=0.05 * q.w)
+            self.assertAlmostEqual(r["lq"], q.lq, delta=0.05 * q.lq)
+            self.assertAlmostEqual(r["p0"], q.p0, delta=0.01)
+            self.assertEqual(r["n"], 999000)
+
+    def test_rejects_multi_server_and_invalid(self):
+        with self.assertRaises(ValueError):
+            LindleySimulator.from_queue(MMcQueue(40, 25, 2))
+        with self.assertRaises(ValueError):
+            LindleySimulator.from_queue(MM1Queue(-1, 25))
+        with self.assertRaises(ValueError):
+            LindleySimulator.from_queue(MM1Queue(20, 25)).run(10, warmup=10)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -1,5 +1,8 @@
 import math
 import unittest
+from unittest import mock
+
+from BaseQueue import BaseQueue
 from MG1Queue import MG1Queue
 
 class TestMG1Queue(unittest.TestCase):
@@ -17,11 +20,28 @@ class TestMG1Queue(unittest.TestCase):
         infeasible = MG1Queue(25, 20, 5)
         self.assertFalse(infeasible.is_feasible())
 
+    def test_trusted_feasibility_skips_validation(self):
+        q = MG1Queue(20, 25, 5)
+        self.assertTrue(q._trust())
+        with mock.patch.object(BaseQueue, "is_valid", side_effect=AssertionError("revalidated")):
+            self.assertTrue(q.is_feasible())
+        q.sigma = -1                     # setter drops trust; σ still ignored for stability
+        self.assertTrue(q.is_feasible())
+
     def test_metrics(self):
         self.q._calc_metrics()
         self.assertAlmostEqual(self.q.p0, 1 - (20 / 25))
         expected_lq = ((20/25)**2 + (20**2 * 5**2)) / (2*(1 - (20/25)))
         self.assertAlmostEqual(self.q.lq, expected_lq)
 
+    def test_sensitivities_match_finite_differences(self):
+        q, h = MG1Queue(20, 25, 0.03), 1e-6
+        fd_lam = (MG1Queue(20 + h, 25, 0.03).lq - MG1Queue(20 - h, 25, 0.03).lq) / (2 * h)
+        fd_mu = (MG1Queue(20, 25 + h, 0.03).lq - MG1Queue(20, 25 - h, 0.03).lq) / (2 * h)
+        self.assertAlmostEqual(q.dlq_dlamda, fd_lam, places=6)
+        self.assertAlmostEqual(q.dlq_dmu, fd_mu, places=6)
+        fd_wq = (MG1Queue(20 + h, 25, 0.03).wq - MG1Queue(20 - h, 25, 0.03).wq) / (2 * h)
+        self.assertAlmostEqual(q.dwq_dlamda, fd_wq, places=6)
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,74 @@
+import math
+import unittest
+
+import numpy as np
+
+from BaseQueue import BaseQueue
+from GGcQueue import GGcQueue
+from MG1Queue import MG1Queue
+from MGcQueue import MGcQueue
+from MMcQueue import MMcQueue
+from QueueSimulator import QueueSimulator
+
+
+class TestMGcQueue(unittest.TestCase):
+    def test_reduces_to_pollaczek_khinchine_for_one_server(self):
+        q, ref = MGcQueue(20, 25, 1, 0.02), MG1Queue(20, 25, 0.02)
+        self.assertAlmostEqual(q.lq, ref.lq, places=10)
+        self.assertAlmostEqual(q.p0, ref.p0, places=10)
+        self.assertAlmostEqual(q.w, ref.w, places=10)
+
+    def test_exponential_service_matches_mmc(self):
+        q, ref = MGcQueue(80, 25, 4, 1 / 25), MMcQueue(80, 25, 4)
+        self.assertAlmostEqual(q.lq, ref.lq, places=10)
+        self.assertAlmostEqual(q.l, ref.l, places=10)
+
+    def test_deterministic_service_halves_mmc_queue(self):
+        q, ref = MGcQueue(80, 25, 4, 0.0), MMcQueue(80, 25, 4)
+        self.assertAlmostEqual(q.lq, ref.lq / 2, places=10)
+
+    def test_close_to_simulation(self):
+        q = MGcQueue(80, 25, 4, 0.08)
+        r = QueueSimulator.from_queue(q).run(300_000, warmup=2000, seed=1)
+        self.assertAlmostEqual(r["wq"], q.wq, delta=0.1 * q.wq)
+
+    def test_invalid_and_infeasible(self):
+        self.assertTrue(math.isnan(MGcQueue(20, 25, 1, -1).lq))
+        self.assertTrue(math.isnan(MGcQueue(20, 25, 0, 0.02).lq))
+        self.assertTrue(math.isinf(MGcQueue(60, 25, 2, 0.02).lq))
+        q = MGcQueue(20, 25, 1, 0.02)
+        q.sigma = "x"
+        self.assertFalse(q.is_valid())
+
+    def test_sensitivities(self):
+        h = 1e-6
+        for make in (lambda lam, mu: MGcQueue(lam, mu, 4, 0.03),
+                     lambda lam, mu: GGcQueue(lam, mu, 4, 0.03, 0.02)):
+            q = make(80, 25)
+            fd_lam = (make(80 + h, 25).lq - make(80 - h, 25).lq) / (2 * h)
+            fd_mu = (make(80, 25 + h).lq - make(80, 25 - h).lq) / (2 * h)
+            self.assertAlmostEqual(q.dlq_dlamda, fd_lam, places=6)
+            self.assertAlmostEqual(q.dlq_dmu, fd_mu, places=6)
+        q = GGcQueue(80, 25, 4, 0.03, 0.02)
+        self.assertAlmostEqual(q.delta_lq_c, GGcQueue(80, 25, 5, 0.03, 0.02).lq - q.lq, places=12)
+
+    def test_profiling_counts_nested_super_calls_once(self):
+        BaseQueue.reset_profiling_stats()
+        BaseQueue.enable_profiling()
+        self.addCleanup(BaseQueue.reset_profiling_stats)
+        self.addCleanup(BaseQueue.disable_profiling)
+        _ = MGcQueue(80, 25, 4, 0.08).lq      # MGcQueue._calc_metrics → MMcQueue._calc_metrics
+        self.assertEqual(BaseQueue.profiling_stats()["MGcQueue"]["recomputations"], 1)
+
+    def test_from_samples_streams_service_log(self):
+        rng = np.random.default_rng(3)
+        chunks = [rng.gamma(4.0, 0.025, 20_000) for _ in range(5)]
+        q = MGcQueue.from_samples(50, iter(chunks), 2)
+        service = np.concatenate(chunks)
+        self.assertAlmostEqual(q.mu, 1 / service.mean(), places=8)
+        self.assertAlmostEqual(q.sigma, service.std(ddof=1), places=8)
+        self.assertEqual(q.c, 2)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -30,5 +30,15 @@ class TestMM1Queue(unittest.TestCase):
         self.assertTrue(math.isnan(q.p0))
         self.assertTrue(math.isnan(q.lq))
 
+    def test_sensitivities_match_finite_differences(self):
+        q, h = MM1Queue(20, 25), 1e-6
+        fd_lam = (MM1Queue(20 + h, 25).lq - MM1Queue(20 - h, 25).lq) / (2 * h)
+        fd_mu = (MM1Queue(20, 25 + h).wq - MM1Queue(20, 25 - h).wq) / (2 * h)
+        self.assertAlmostEqual(q.dlq_dlamda, 0.96, places=10)   # ρ(2-ρ)/((1-ρ)²μ)
+        self.assertAlmostEqual(q.dlq_dlamda, fd_lam, places=6)
+        self.assertAlmostEqual(q.dwq_dmu, fd_mu, places=6)
+        self.assertTrue(math.isinf(MM1Queue(25, 20).dlq_dmu))
+        self.assertTrue(math.isnan(MM1Queue(20, 0).dwq_dlamda))
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
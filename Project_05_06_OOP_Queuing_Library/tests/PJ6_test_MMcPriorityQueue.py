@@ -46,6 +46,62 @@ class TestMMcPriorityQueue(unittest.TestCase):
         for k, v in enumerate(exp_bk, 1):
             self.assertAlmostEqual(self.q.get_b_k(k), v, places=7)
 
+    def test_class_metrics_match_getters(self):
+        q = MMcPriorityQueue((3, 1, 4, 1, 5, 9, 2, 6), 12, 4)
+        m = q.class_metrics()
+        for k in range(1, 9):
+            self.assertAlmostEqual(m["wqk"][k - 1], q.get_wq_k(k), places=12)
+            self.assertAlmostEqual(m["wk"][k - 1], q.get_w_k(k), places=12)
+            self.assertAlmostEqual(m["lqk"][k - 1], q.get_lq_k(k), places=12)
+            self.assertAlmostEqual(m["lk"][k - 1], q.get_l_k(k), places=12)
+            self.assertAlmostEqual(m["bk"][k - 1], q.get_b_k(k), places=12)
+        # class waits sum back to the aggregate queue length
+        self.assertAlmostEqual(m["lqk"].sum(), q.lq, places=10)
+
+    def test_class_wait_sensitivity_to_mu(self):
+        mix, h = (3, 1, 4, 1, 5), 1e-6
+        d = MMcPriorityQueue(mix, 12, 2).class_metrics()["dwqk_dmu"]
+        hi = MMcPriorityQueue(mix, 12 + h, 2).class_metrics()["wqk"]
+        lo = MMcPriorityQueue(mix, 12 - h, 2).class_metrics()["wqk"]
+        for k in range(5):
+            self.assertAlmostEqual(d[k], (hi[k] - lo[k]) / (2 * h), places=6)
+
+    def test_class_metrics_follow_lamda_updates(self):
+        self.q.lamda_k = (10, 5, 5)
+        self.assertAlmostEqual(self.q.class_metrics()["bk"][0], 0.6, places=12)
+        self.assertAlmostEqual(self.q.get_b_k(1), 0.6, places=12)
+
+    def test_class_metrics_invalid_and_infeasible(self):
+        bad = MMcPriorityQueue((5, 10, "five"), 25, 1)
+        self.assertEqual(bad.class_metrics()["wqk"].size, 0)
+        busy = MMcPriorityQueue((10, 10, 10), 25, 1)
+        self.assertTrue(all(math.isinf(x) for x in busy.class_metrics()["wqk"]))
+        neg_mu = MMcPriorityQueue((5, 10, 5), -25, 1)
+        self.assertTrue(all(math.isnan(x) for x in neg_mu.class_metrics()["lk"]))
+
+    def test_evaluate_scenarios_matches_reassignment(self):
+        q = MMcPriorityQueue((5, 10, 5), 25, 2)
+        scenarios = [(5, 10, 5), (1, 2, 30), (20, 0, 10), (0.5, 0.5, 0.5)]
+        m = q.evaluate_scenarios(scenarios)
+        self.assertEqual(m["wqk"].shape, (4, 3))
+        for s, mix in enumerate(scenarios):
+            ref = MMcPriorityQueue(mix, 25, 2)
+            for k in range(1, 4):
+                self.assertAlmostEqual(m["wqk"][s, k - 1], ref.get_wq_k(k), places=12)
+                self.assertAlmostEqual(m["wk"][s, k - 1], ref.get_w_k(k), places=12)
+                self.assertAlmostEqual(m["lqk"][s, k - 1], ref.get_lq_k(k), places=12)
+                self.assertAlmostEqual(m["lk"][s, k - 1], ref.get_l_k(k), places=12)
+        self.assertEqual(q.lamda_k, (5, 10, 5))  # queue state untouched
+
+    def test_evaluate_scenarios_invalid_and_infeasible_rows(self):
+        m = self.q.evaluate_scenarios([(5, 10, 5), (5, -1, 5), (0, 0, 0), (10, 10, 10)])
+        self.assertFalse(any(math.isnan(x) or math.isinf(x) for x in m["wqk"][0]))
+        self.assertTrue(all(math.isnan(x) for x in m["wqk"][1]))
+        self.assertTrue(all(math.isnan(x) for x in m["wqk"][2]))
+        self.assertTrue(all(math.isinf(x) for x in m["lk"][3]))
+        with self.assertRaises(ValueError):
+            self.q.evaluate_scenarios((5, 10, 5))
+
     def test_invalid_tuple_is_caught(self):
         bad = MMcPriorityQueue((5, 10, "five"), 25, 1)
         self.assertFalse(bad.is_valid())
@@ -45,6 +45,52 @@ class TestMMcQueue(unittest.TestCase):
         self.assertAlmostEqual(q.w,  w_e,  places=7)
         self.assertAlmostEqual(q.l,  l_e,  places=7)
 
+    def test_update_includes_c(self):
+        q = MMcQueue(24, 25, 2)
+        q.update(lamda=40, c=3)
+        p0_e, lq_e, _, _, _ = erlang_c_expected(40, 25, 3)
+        self.assertAlmostEqual(q.p0, p0_e, places=7)
+        self.assertAlmostEqual(q.lq, lq_e, places=7)
+
+    def test_walking_c_reuses_erlang_value(self):
+        q = MMcQueue(24, 25, 2)
+        for c in (2, 3, 4, 5, 4, 3, 6):
+            q.c = c
+            p0_e, lq_e, _, _, _ = erlang_c_expected(24, 25, c)
+            self.assertAlmostEqual(q.p0, p0_e, places=10)
+            self.assertAlmostEqual(q.lq, lq_e, places=10)
+        self.assertEqual(q._erlang_n, 6)         # only B(a, 6) is kept
+        self.assertIsInstance(q._erlang_b, float)
+
+        q.lamda = 40                           # new offered load ⇒ fresh table
+        p0_e, lq_e, _, _, _ = erlang_c_expected(40, 25, 6)
+        self.assertAlmostEqual(q.lq, lq_e, places=10)
+
+    def test_stepping_c_down_from_large_matches_fresh_queue(self):
+        for lam, start, targets in ((1, 177, (2, 3, 90)), (1, 175, (3,)), (95, 200, (120, 100, 96))):
+            for c in targets:
+                q = MMcQueue(lam, 1, start)
+                _ = q.lq
+                q.c = c
+                fresh = MMcQueue(lam, 1, c)
+                self.assertAlmostEqual(q.lq / fresh.lq, 1.0, places=12)
+                self.assertAlmostEqual(q.p0 / fresh.p0, 1.0, places=12)
+
+    def test_thousands_of_servers(self):
+        q = MMcQueue(2900, 1, 3000)            # a^c / c! overflows a float here
+        self.assertTrue(math.isfinite(q.lq))
+        self.assertTrue(0 <= q.p0 < 1)
+        self.assertAlmostEqual(q.l, q.lq + 2900, places=7)
+
+    def test_sensitivities(self):
+        q, h = MMcQueue(80, 25, 5), 1e-6
+        fd_lam = (MMcQueue(80 + h, 25, 5).lq - MMcQueue(80 - h, 25, 5).lq) / (2 * h)
+        fd_mu = (MMcQueue(80, 25 + h, 5).lq - MMcQueue(80, 25 - h, 5).lq) / (2 * h)
+        self.assertAlmostEqual(q.dlq_dlamda, fd_lam, places=6)
+        self.assertAlmostEqual(q.dlq_dmu, fd_mu, places=6)
+        self.assertAlmostEqual(q.delta_lq_c, MMcQueue(80, 25, 6).lq - q.lq, places=12)
+        self.assertTrue(math.isinf(MMcQueue(80, 25, 3).delta_lq_c))
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -0,0 +1,99 @@
+import math
+import unittest
+
+import numpy as np
+
+from MD1Queue import MD1Queue
+from MG1Queue import MG1Queue
+from MGcQueue import MGcQueue
+from MM1Queue import MM1Queue
+from GGcQueue import GGcQueue
+from MMcPriorityQueue import MMcPriorityQueue
+from MMcQueue import MMcQueue
+from QueueArray import QueueArray
+
+
+class TestQueueArray(unittest.TestCase):
+    def setUp(self):
+        self.queues = [MM1Queue(20, 25), MD1Queue(20, 25), MG1Queue(20, 25, 0.02),
+                       MMcQueue(40, 25, 2), MMcQueue(95, 10, 12), MGcQueue(80, 25, 4, 0.08)]
+        self.arr = QueueArray.from_queues(self.queues)
+
+    def test_matches_queue_objects(self):
+        for name in ("ro", "p0", "lq", "l", "wq", "w"):
+            expected = [getattr(q, name) for q in self.queues]
+            np.testing.assert_allclose(getattr(self.arr, name), expected, rtol=1e-10, err_msg=name)
+
+    def test_sensitivities_match_queue_objects(self):
+        for name in ("dlq_dlamda", "dlq_dmu", "dwq_dlamda", "dwq_dmu"):
+            expected = [getattr(q, name) for q in self.queues]
+            np.testing.assert_allclose(getattr(self.arr, name), expected, rtol=1e-9, err_msg=name)
+        multi = [q for q in self.queues if isinstance(q, MMcQueue)]
+        np.testing.assert_allclose(QueueArray.from_queues(multi).delta_lq_c,
+                                   [q.delta_lq_c for q in multi], rtol=1e-9)
+
+    def test_invalid_and_infeasible_rows(self):
+        arr = QueueArray([20, -1, 30, 20], [25, 25, 25, 25], [1, 1, 1, 1.5])
+        lq = arr.lq
+        self.assertAlmostEqual(lq[0], MM1Queue(20, 25).lq)
+        self.assertTrue(math.isnan(lq[1]))
+        self.assertTrue(math.isinf(lq[2]))
+        self.assertTrue(math.isnan(lq[3]))
+        self.assertTrue(math.isinf(arr.w[2]))
+        np.testing.assert_array_equal(arr.is_feasible(), [True, False, False, False])
+
+    def test_memory_per_queue(self):
+        arr = QueueArray(np.full(10_000, 20.0), 25.0, 1)
+        self.assertEqual(len(arr), 10_000)
+        self.assertEqual(arr.nbytes / len(arr), 33)
+        self.assertFalse(hasattr(arr, "__dict__"))
+
+    def test_queue_objects_use_slots(self):
+        for q in self.queues:
+            self.assertFalse(hasattr(q, "__dict__"))
+            with self.assertRaises(AttributeError):
+                q.unknown = 1
+
+    def test_bytes_round_trip_is_zero_copy(self):
+        data = self.arr.to_bytes()
+        self.assertEqual(len(data), 16 + 33 * len(self.arr))
+        back = QueueArray.from_bytes(data)
+        for name in ("lamda", "mu", "c", "sigma", "model"):
+            np.testing.assert_array_equal(getattr(back, name), getattr(self.arr, name))
+        self.assertFalse(back.lamda.flags.owndata)          # a view into the buffer
+        np.testing.assert_allclose(back.lq, self.arr.lq, rtol=1e-12)
+
+    def test_to_queues_restores_classes(self):
+        back = QueueArray.from_bytes(self.arr.to_bytes()).to_queues()
+        self.assertEqual([type(q) for q in back], [type(q) for q in self.queues])
+        for q, r in zip(self.queues, back):
+            self.assertAlmostEqual(q.lq, r.lq, places=10)
+
+    def test_from_bytes_rejects_bad_buffers(self):
+        data = self.arr.to_bytes()
+        for bad in (data[:10], b"XXXX" + data[4:], data[:-1]):
+            with self.assertRaises(ValueError):
+                QueueArray.from_bytes(bad)
+
+    def test_rejects_unsupported_queues(self):
+        for q in (MMcPriorityQueue((5, 10), 25, 2), GGcQueue(20, 25, 2, 0.02, 0.05)):
+            with self.assertRaises(TypeError):
+                QueueArray.from_queues([MM1Queue(20, 25), q])
+
+    def test_nan_sigma_is_invalid(self):
+        arr = QueueArray([20, 20, 20], 25, 1, [0.02, math.nan, 0.02], model=[2, 2, 0])
+        np.testing.assert_array_equal(arr.is_valid(), [True, False, True])
+        self.assertTrue(math.isnan(arr.lq[1]))
+        self.assertAlmostEqual(arr.lq[2], MM1Queue(20, 25).lq)   # σ ignored on exponential rows
+        self.assertTrue(math.isnan(QueueArray([20.0], 25, 2, math.nan).lq[0]))
+        back = QueueArray.from_queues([MG1Queue(20, 25, math.nan)])
+        self.assertTrue(math.isnan(back.lq[0]))
+
+    def test_large_c_is_stable(self):
+        arr = QueueArray([950.0], [1.0], [1000])
+        self.assertTrue(np.isfinite(arr.lq[0]))
+        self.assertTrue(0 <= arr.p0[0] < 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
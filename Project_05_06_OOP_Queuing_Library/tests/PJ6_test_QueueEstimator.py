@@ -0,0 +1,62 @@
+import math
+import unittest
+
+import numpy as np
+
+from MG1Queue import MG1Queue
+from MGcQueue import MGcQueue
+from MM1Queue import MM1Queue
+from MMcQueue import MMcQueue
+from QueueEstimator import QueueEstimator
+from QueueSimulator import QueueSimulator
+
+
+def chunked(*arrays, size=10_000):
+    for i in range(0, arrays[0].size, size):
+        yield tuple(a[i:i + size] for a in arrays)
+
+
+class TestQueueEstimator(unittest.TestCase):
+    def test_single_server_infers_start_times(self):
+        sim = QueueSimulator.from_queue(MG1Queue(20, 25, 0.02))
+        arrival, start, departure = sim.simulate(100_000, np.random.default_rng(2))
+        est = QueueEstimator().consume(chunked(arrival, departure, size=7_777))
+        self.assertEqual(est.n, 100_000)
+        self.assertAlmostEqual(est.wq, float(np.mean(start - arrival)), places=9)
+        self.assertAlmostEqual(est.w, float(np.mean(departure - arrival)), places=9)
+        self.assertAlmostEqual(est.lamda, 99_999 / (arrival[-1] - arrival[0]), places=6)
+        self.assertAlmostEqual(est.mu, 25, delta=0.5)
+        self.assertAlmostEqual(est.sigma, 0.02, delta=0.001)
+
+    def test_record_by_record_matches_chunks(self):
+        arrival, start, departure = QueueSimulator.from_queue(MM1Queue(20, 25)).simulate(
+            2000, np.random.default_rng(3))
+        one = QueueEstimator().consume(zip(arrival, departure))
+        many = QueueEstimator().consume(chunked(arrival, departure, size=300))
+        for name in ("lamda", "mu", "sigma", "wq", "lq"):
+            self.assertAlmostEqual(getattr(one, name), getattr(many, name), places=9)
+
+    def test_multi_server_compare(self):
+        arrival, start, departure = QueueSimulator.from_queue(MMcQueue(80, 25, 4)).simulate(
+            200_000, np.random.default_rng(4))
+        est = QueueEstimator(c=4).consume(chunked(arrival, departure, start))
+        self.assertIsInstance(est.to_queue("mm"), MMcQueue)
+        self.assertIsInstance(est.to_queue(), MGcQueue)
+        cmp = est.compare(model="mm")
+        for name in ("lq", "l", "wq", "w"):
+            self.assertLess(abs(cmp[name]["error"]), 0.1, name)
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            QueueEstimator(c=0)
+        with self.assertRaises(ValueError):
+            QueueEstimator(c=2).update([0.0, 1.0], [0.5, 1.5])
+        with self.assertRaises(ValueError):
+            QueueEstimator().update([0.0, 1.0], [0.5])
+        with self.assertRaises(ValueError):
+            QueueEstimator().to_queue("xx")
+        self.assertTrue(math.isnan(QueueEstimator().lamda))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,72 @@
+import math
+import unittest
+
+from BaseQueue import BaseQueue
+from GGcQueue import GGcQueue
+from MM1Queue import MM1Queue
+from MMcPriorityQueue import MMcPriorityQueue
+from MMcQueue import MMcQueue
+from QueueFactory import QueueFactory, create_queue
+
+
+class CountingQueue(MM1Queue):
+    """Counts is_valid() calls to check the trusted fast path."""
+
+    __slots__ = ("calls",)
+
+    def is_valid(self):
+        self.calls = getattr(self, "calls", 0) + 1
+        return super().is_valid()
+
+
+class TestQueueFactory(unittest.TestCase):
+    def test_builds_registered_models(self):
+        q = create_queue({"model": "MMc", "lamda": 40, "mu": 25, "c": 2})
+        self.assertIsInstance(q, MMcQueue)
+        self.assertAlmostEqual(q.lq, MMcQueue(40, 25, 2).lq, places=12)
+
+        p = create_queue({"model": "mmc_priority", "lamda": [5, 10, 5], "mu": 25, "c": 1})
+        self.assertIsInstance(p, MMcPriorityQueue)
+        self.assertAlmostEqual(p.get_wq_k(3), 0.40, places=7)
+
+        g = create_queue({"model": "ggc", "lamda": 20, "mu": 25, "c": 1, "sigma": 0.02, "sigma_a": 0.05})
+        self.assertIsInstance(g, GGcQueue)
+
+    def test_rejects_bad_specs_at_the_boundary(self):
+        bad_specs = (
+            {"model": "nope", "lamda": 1, "mu": 2},
+            {"model": "mm1", "lamda": 1},
+            {"model": "mm1", "lamda": 1, "mu": 2, "c": 3},
+            {"model": "mm1", "lamda": -1, "mu": 2},
+            {"model": "mgc", "lamda": 1, "mu": 2, "c": 1, "sigma": -0.1},
+            {"model": "mmc_priority", "lamda": [1, "x"], "mu": 2, "c": 1},
+        )
+        for spec in bad_specs:
+            with self.assertRaises(ValueError, msg=spec):
+                create_queue(spec)
+
+    def test_infeasible_queues_are_allowed(self):
+        q = create_queue({"model": "mm1", "lamda": 30, "mu": 25})
+        self.assertTrue(math.isinf(q.lq))
+
+    def test_trusted_reads_skip_validation(self):
+        QueueFactory.register("counting", CountingQueue)
+        self.addCleanup(QueueFactory._registry.pop, "counting", None)
+        q = create_queue({"model": "counting", "lamda": 20, "mu": 25})
+        q.calls = 0
+        self.assertAlmostEqual(q.w, 0.2, places=10)
+        self.assertEqual(q.calls, 0)
+
+        q.mu = 0                                     # setters drop the trust
+        self.assertTrue(math.isnan(q.w))
+        self.assertGreater(q.calls, 0)
+
+    def test_register_requires_queue_class(self):
+        with self.assertRaises(TypeError):
+            QueueFactory.register("bad", dict)
+        self.assertIn("mm1", QueueFactory.models())
+        self.assertTrue(issubclass(QueueFactory._registry["mm1"], BaseQueue))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,70 @@
+import itertools
+import math
+import unittest
+
+from MMcPriorityQueue import MMcPriorityQueue
+from MMcQueue import MMcQueue
+from QueueOptimizer import QueueOptimizer
+
+
+def brute_force(lam, mu, server_cost, waiting_cost, c_max):
+    best = (math.inf, None, None)
+    for c in range(1, c_max + 1):
+        for order in itertools.permutations(range(len(lam))):
+            q = MMcPriorityQueue(tuple(lam[k] for k in order), mu, c)
+            if not q.is_feasible():
+                continue
+            cost = c * server_cost + sum(waiting_cost[k] * q.get_lq_k(i + 1) for i, k in enumerate(order))
+            if cost < best[0]:
+                best = (cost, c, order)
+    return best
+
+
+class TestQueueOptimizer(unittest.TestCase):
+    def test_matches_exhaustive_search(self):
+        lam, cost = (3, 1, 4, 1, 5), (2, 7, 1, 8, 2.5)
+        r = QueueOptimizer(lam, 4, 3.0, cost).optimize()
+        cost_bf, c_bf, order_bf = brute_force(lam, 4, 3.0, cost, 12)
+        self.assertAlmostEqual(r["cost"], cost_bf, places=9)
+        self.assertEqual((r["c"], r["order"]), (c_bf, order_bf))
+        self.assertIsInstance(r["queue"], MMcPriorityQueue)
+        self.assertAlmostEqual(r["cost"], r["server_cost"] + r["waiting_cost"], places=12)
+
+    def test_cost_agrees_with_queue_objects(self):
+        opt = QueueOptimizer((5, 10, 5), 25, 1.0, (3, 2, 1))
+        q = MMcPriorityQueue((5, 10, 5), 25, 1)
+        expected = 1.0 + sum(w * q.get_lq_k(k) for k, w in enumerate((3, 2, 1), 1))
+        self.assertAlmostEqual(opt.cost(1, (0, 1, 2)), expected, places=12)
+        fifo = MMcQueue(20, 25, 2)
+        self.assertAlmostEqual(opt.cost(2), 2.0 + (3 * 5 + 2 * 10 + 1 * 5) * fifo.wq, places=12)
+        self.assertTrue(math.isinf(QueueOptimizer((30,), 25, 1, 1).cost(1)))
+
+    def test_equal_costs_keep_fifo(self):
+        r = QueueOptimizer((5, 10, 5), 25, 1.0, 4.0).optimize()
+        self.assertIsNone(r["order"])
+        self.assertIsInstance(r["queue"], MMcQueue)
+
+    def test_candidate_orders_and_server_bound(self):
+        opt = QueueOptimizer(tuple(range(1, 9)), 10, 5.0, [1 + (7 * k) % 10 for k in range(8)])
+        candidates = list(itertools.islice(itertools.permutations(range(8)), 2000))
+        r = opt.optimize(orders=candidates)
+        self.assertIn(r["order"], candidates + [None])
+        # c stops as soon as servers alone cost at least the best total
+        c_first, c_last = 4, math.ceil(r["cost"] / 5.0) - 1
+        self.assertEqual(r["evaluated"], (len(candidates) + 1) * (c_last - c_first + 1))
+        best_given = min(opt.cost(r["c"], order) for order in candidates)
+        self.assertLessEqual(r["cost"], best_given + 1e-12)
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            QueueOptimizer((), 1, 1, 1)
+        with self.assertRaises(ValueError):
+            QueueOptimizer((1, 2), 1, 1, (1, 2, 3))
+        with self.assertRaises(ValueError):
+            QueueOptimizer((1, 2), 1, 1, 1).optimize(orders=[(0, 0)])
+        with self.assertRaises(ValueError):
+            QueueOptimizer((10, 20), 1, 1, 1, max_servers=5).optimize()
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,73 @@
+import math
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from MM1Queue import MM1Queue
+from MMcQueue import MMcQueue
+from MD1Queue import MD1Queue
+from QueueSimulator import QueueSimulator, Exponential, Deterministic, Gamma
+
+
+class TestQueueSimulator(unittest.TestCase):
+    def assertClose(self, simulated, analytic, rel=0.1):
+        self.assertAlmostEqual(simulated, analytic, delta=rel * analytic)
+
+    def test_mm1_matches_analytic(self):
+        q = MM1Queue(20, 25)
+        r = QueueSimulator.from_queue(q).run(200000, warmup=1000, seed=7)
+        for name in ("p0", "lq", "l", "wq", "w"):
+            self.assertClose(r[name], getattr(q, name))
+        self.assertClose(r["lamda"], 20, rel=0.02)
+
+    def test_mmc_matches_analytic(self):
+        q = MMcQueue(40, 25, 2)
+        sim = QueueSimulator.from_queue(q)
+        self.assertEqual(sim.c, 2)
+        r = sim.run(200000, warmup=1000, seed=11)
+        for name in ("p0", "lq", "wq", "w"):
+            self.assertClose(r[name], getattr(q, name))
+
+    def test_md1_uses_deterministic_service(self):
+        q = MD1Queue(20, 25)
+        sim = QueueSimulator.from_queue(q)
+        self.assertIsInstance(sim.service, Deterministic)
+        r = sim.run(200000, warmup=1000, seed=3)
+        self.assertClose(r["wq"], q.wq)
+
+    def test_trace_replay_from_csv(self):
+        # one arrival per time unit, each served for half a unit: never waits
+        fd, path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(fd, "w") as fh:
+            fh.write("arrival,service\n")
+            for t in range(101):
+                fh.write(f"{t},0.5\n")
+        try:
+            r = QueueSimulator.from_csv(path).run(1000)
+        finally:
+            os.remove(path)
+        self.assertEqual(r["n"], 101)
+        self.assertAlmostEqual(r["wq"], 0.0)
+        self.assertAlmostEqual(r["w"], 0.5)
+        self.assertAlmostEqual(r["p0"], 0.5)
+        self.assertAlmostEqual(r["lamda"], 1.0)
+
+    def test_gamma_moments(self):
+        x = Gamma(2.0, 0.5).sample(np.random.default_rng(0), 200000)
+        self.assertAlmostEqual(x.mean(), 2.0, delta=0.01)
+        self.assertAlmostEqual(x.std(), 0.5, delta=0.01)
+
+    def test_invalid_inputs(self):
+        with self.assertRaises(ValueError):
+            QueueSimulator(Exponential(1.0), Exponential(2.0), c=0)
+        with self.assertRaises(ValueError):
+            QueueSimulator.from_queue(MM1Queue(20, 0))
+        with self.assertRaises(ValueError):
+            QueueSimulator(Exponential(1.0), Exponential(2.0)).run(10, warmup=10)
+        self.assertTrue(math.isnan(MM1Queue(20, 0).p0))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
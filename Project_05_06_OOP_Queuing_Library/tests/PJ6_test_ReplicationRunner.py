@@ -0,0 +1,54 @@
+import unittest
+
+from MM1Queue import MM1Queue
+from QueueSimulator import QueueSimulator
+from ReplicationRunner import ReplicationRunner, _t_quantile
+
+
+class TestReplicationRunner(unittest.TestCase):
+    def setUp(self):
+        self.q = MM1Queue(20, 25)
+        self.sim = QueueSimulator.from_queue(self.q)
+
+    def test_t_quantile(self):
+        self.assertAlmostEqual(_t_quantile(0.975, 4), 2.776, places=2)
+        self.assertAlmostEqual(_t_quantile(0.975, 9), 2.262, places=3)
+        self.assertAlmostEqual(_t_quantile(0.975, 1000), 1.962, places=3)
+
+    def test_t_quantile_small_df(self):
+        known = {(0.975, 1): 12.7062, (0.995, 1): 63.6567, (0.975, 2): 4.3027,
+                 (0.995, 2): 9.9248, (0.975, 5): 2.5706, (0.995, 5): 4.0321}
+        for (p, df), t in known.items():
+            self.assertAlmostEqual(_t_quantile(p, df), t, places=4)
+        self.assertAlmostEqual(_t_quantile(0.025, 5), -2.5706, places=4)
+
+    def test_results_independent_of_worker_count(self):
+        serial = ReplicationRunner(self.sim, 20000, 500, max_workers=1).run(seed=5)
+        parallel = ReplicationRunner(self.sim, 20000, 500, max_workers=2).run(seed=5)
+        self.assertEqual(serial["replications"], 5)
+        self.assertEqual(serial["mean"], parallel["mean"])
+        self.assertEqual(serial["half_width"], parallel["half_width"])
+
+    def test_adaptive_stop_and_coverage(self):
+        runner = ReplicationRunner(self.sim, 50000, 1000, max_workers=2)
+        r = runner.run(target={"wq": 0.05}, seed=3)
+        self.assertTrue(r["converged"])
+        self.assertLessEqual(r["half_width"]["wq"], 0.05 * r["mean"]["wq"])
+        self.assertAlmostEqual(r["mean"]["wq"], self.q.wq, delta=2 * r["half_width"]["wq"])
+
+    def test_cap_on_replications(self):
+        r = ReplicationRunner(self.sim, 2000, max_workers=1).run(target=1e-9, max_replications=6, seed=1)
+        self.assertFalse(r["converged"])
+        self.assertEqual(r["replications"], 6)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            ReplicationRunner(self.sim, 100, warmup=100)
+        with self.assertRaises(ValueError):
+            ReplicationRunner(self.sim, 100).run(min_replications=1)
+        with self.assertRaises(ValueError):
+            ReplicationRunner(self.sim, 100).run(target={"x": 0.1})
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,41 @@
+import math
+import unittest
+
+import numpy as np
+
+from RunningStats import RunningStats
+
+
+class TestRunningStats(unittest.TestCase):
+    def setUp(self):
+        self.x = np.random.default_rng(0).lognormal(0.0, 1.5, 10_000)
+
+    def test_values_and_chunks_agree_with_numpy(self):
+        one_by_one = RunningStats(self.x.tolist())
+        chunked = RunningStats(np.array_split(self.x, 7))
+        for s in (one_by_one, chunked):
+            self.assertEqual(s.n, self.x.size)
+            self.assertAlmostEqual(s.mean, self.x.mean(), places=9)
+            self.assertAlmostEqual(s.variance / self.x.var(ddof=1), 1.0, places=9)
+            self.assertAlmostEqual(s.scv, self.x.var(ddof=1) / self.x.mean() ** 2, places=9)
+
+    def test_merge(self):
+        a, b = RunningStats(self.x[:3000]), RunningStats(self.x[3000:])
+        a.merge(b)
+        self.assertAlmostEqual(a.std / self.x.std(ddof=1), 1.0, places=9)
+
+    def test_stable_with_large_offset(self):
+        s = RunningStats()
+        for v in 1e9 + np.array([4.0, 7.0, 13.0, 16.0]):
+            s.push(v)
+        self.assertAlmostEqual(s.variance, 30.0, places=6)
+
+    def test_empty(self):
+        s = RunningStats()
+        self.assertTrue(math.isnan(s.mean))
+        s.push(2.0)
+        self.assertTrue(math.isnan(s.variance))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,78 @@
+import math
+import time
+import unittest
+
+import numpy as np
+
+from MMcQueue import MMcQueue
+from StaffingPlanner import StaffingPlanner
+
+
+class TestStaffingPlanner(unittest.TestCase):
+    def setUp(self):
+        t = np.arange(96) * 0.25
+        self.lam = 60 + 50 * np.sin(2 * np.pi * t / 24)
+        self.planner = StaffingPlanner(self.lam, 4.0, 0.25)
+
+    def test_psa_is_minimal_per_interval(self):
+        r = self.planner.plan('psa', target_wq=0.02)
+        for i in range(0, 96, 7):
+            c = int(r["c"][i])
+            q = MMcQueue(self.lam[i], 4.0, c)
+            self.assertAlmostEqual(r["wq"][i], q.wq, places=12)
+            self.assertLessEqual(q.wq, 0.02)
+            below = MMcQueue(self.lam[i], 4.0, c - 1)
+            self.assertTrue(not below.is_feasible() or below.wq > 0.02)
+
+    def test_combined_targets(self):
+        r = self.planner.plan('psa', service_level=0.8, answer_time=0.05, max_delay_prob=0.5)
+        sl = 1 - r["pw"] * np.exp(-(r["c"] * 4.0 - self.lam) * 0.05)
+        self.assertTrue(np.all(sl >= 0.8) and np.all(r["pw"] <= 0.5))
+        self.assertTrue(np.all(r["ro"] < 1))
+
+    def test_lagged_and_offered_load(self):
+        a_psa = self.planner.offered_load('psa')
+        a_lag = self.planner.offered_load('lag')
+        a_mol = self.planner.offered_load('mol')
+        # one mean service time is one interval here: lag shifts by exactly one step
+        np.testing.assert_allclose(a_lag[1:], a_psa[:-1])
+        # infinite-server load lags the peak and smooths it
+        self.assertGreater(np.argmax(a_mol), np.argmax(a_psa))
+        self.assertLess(a_mol.max(), a_psa.max())
+        constant = StaffingPlanner(np.full(10, 30.0), 2.0).offered_load('mol')
+        np.testing.assert_allclose(constant, 15.0)
+
+    def test_zero_traffic_and_errors(self):
+        r = StaffingPlanner([0.0, 10.0], 5.0).plan(target_wq=0.1)
+        self.assertEqual(r["c"][0], 0)
+        self.assertGreaterEqual(r["c"][1], 3)
+        with self.assertRaises(ValueError):
+            self.planner.plan('psa')
+        with self.assertRaises(ValueError):
+            self.planner.plan('xyz', target_wq=1)
+        with self.assertRaises(ValueError):
+            StaffingPlanner([-1.0], 1.0)
+
+    def test_invalid_targets_raise(self):
+        planner = StaffingPlanner([10.0], 5.0)
+        for kwargs in ({"target_wq": -1}, {"target_wq": 0}, {"target_wq": math.nan},
+                       {"max_delay_prob": 0}, {"max_delay_prob": 1.5}, {"max_delay_prob": math.nan}):
+            with self.assertRaises(ValueError, msg=kwargs):
+                planner.plan(**kwargs)
+        self.assertEqual(planner.plan(max_delay_prob=1.0)["c"][0], 3)
+
+    def test_unreachable_target_stops(self):
+        with self.assertRaises(ValueError):
+            StaffingPlanner([10.0], 5.0).plan(target_wq=1e-300)
+
+    def test_year_of_intervals_plans_fast(self):
+        t = np.arange(35040) * 0.25
+        planner = StaffingPlanner(200 + 150 * np.sin(2 * np.pi * t / 24), 4.0)
+        start = time.perf_counter()
+        r = planner.plan('mol', target_wq=1 / 60)
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertTrue(np.all(r["wq"] <= 1 / 60) and not math.isnan(r["wq"].sum()))
+
+
+if __name__ == "__main__":
+    unittest.main()